@@ -0,0 +1,81 @@
+"""
+Benchmark: enqueue throughput as the number of producer threads grows.
+
+Every thread enqueues events as fast as it can into a sender pool whose
+batches are discarded, so the numbers show the cost of the buffering layer
+alone. For comparison the same load is run against the design the
+per-thread buffers replaced: a shared pending counter and a single
+condition-guarded deque that every producer locks and notifies.
+
+Run it on a regular and a free-threaded build (e.g. python3.13t) to compare:
+
+    python benchmarks/bench_enqueue_threads.py [--events 200000]
+"""
+
+import argparse
+import sys
+import threading
+import time
+from collections import deque
+
+from teer.sender import SenderPool
+
+
+class SharedQueue:
+    """The previous buffering layer: every enqueue takes two shared locks."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.condition = threading.Condition()
+        self.events = deque()
+
+    def enqueue(self, event):
+        with self.lock:
+            self.pending += 1
+        with self.condition:
+            self.events.append(event)
+            self.condition.notify()
+        return True
+
+
+def run(enqueue, threads, events):
+    per_thread = events // threads
+    barrier = threading.Barrier(threads + 1)
+
+    def produce():
+        barrier.wait()
+        for i in range(per_thread):
+            enqueue(i)
+
+    workers = [threading.Thread(target=produce) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return per_thread * threads / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=200_000)
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    print(f"{args.events} events per run")
+    print(f"{'threads':>8} {'per-thread/s':>14} {'shared/s':>14}")
+    for threads in (1, 8, 32, 200):
+        pool = SenderPool(
+            lambda batch: None, workers=4, max_buffer_size=args.events * 2
+        )
+        pool_rate = run(pool.enqueue, threads, args.events)
+        pool.close()
+        shared_rate = run(SharedQueue().enqueue, threads, args.events)
+        print(f"{threads:>8} {pool_rate:>14,.0f} {shared_rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark: sender pool throughput as a function of the number of workers.
+
+The Teer API is replaced by a fake session that sleeps for a fixed latency per
+request, so the numbers show how well the pool overlaps network round trips
+rather than the speed of any real server.
+
+Usage:
+    python benchmarks/bench_sender_pool.py [--events 20000] [--latency 0.02]
+"""
+
+import argparse
+import time
+
+from teer import TeerClient
+
+
+class FakeResponse:
+    status_code = 200
+    headers = {}
+    text = "{}"
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {}
+
+
+class FakeSession:
+    """Stands in for requests.Session with a fixed per-request latency."""
+
+    def __init__(self, latency):
+        self.latency = latency
+
+    def request(self, **kwargs):
+        time.sleep(self.latency)
+        return FakeResponse()
+
+
+def run(workers, events, latency, batch_size):
+    client = TeerClient(api_key="bench", sender_workers=workers, batch_size=batch_size)
+    client.http_client.session = FakeSession(latency)
+    payload = {
+        "provider": "openai",
+        "model": "gpt-4o",
+        "function_id": "bench",
+        "usage": {"input": 100, "output": 20},
+    }
+
+    start = time.perf_counter()
+    for _ in range(events):
+        client.ingest.enqueue(payload)
+    client.flush()
+    elapsed = time.perf_counter() - start
+    client.close()
+    return events / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+
+    print(
+        f"{args.events} events, {args.latency * 1000:.0f} ms per request, "
+        f"batch size {args.batch_size}"
+    )
+    print(f"{'workers':>8} {'events/s':>12} {'speedup':>8}")
+    baseline = None
+    for workers in (1, 2, 4, 8, 16):
+        rate = run(workers, args.events, args.latency, args.batch_size)
+        baseline = baseline or rate
+        print(f"{workers:>8} {rate:>12,.0f} {rate / baseline:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Benchmark: cold-start and per-invocation cost of serverless mode.
+
+Simulates cold starts by building a fresh client (with its own transport) and
+sending one ingest event, with and without ``serverless=True``. Prewarming
+moves connection setup into client construction, which a real platform runs
+during its init phase rather than on the first invocation. Then simulates
+warm invocations of a ``teer.serverless.handler``-wrapped function that
+buffers a few events, and reports the time spent flushing them at the end of
+each invocation.
+
+The client talks to a minimal local HTTP server with a small artificial
+connection delay (``--connect-delay``) standing in for DNS, TCP and TLS
+setup, which loopback would otherwise make free.
+
+Usage:
+    python benchmarks/bench_serverless.py [--cold-starts 20] [--invocations 500]
+"""
+
+import argparse
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from teer import TeerClient
+from teer.serverless import handler
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Accepts any request with an empty JSON object, keeping the connection alive."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    connect_delay = 0.0
+
+    def setup(self):
+        time.sleep(self.connect_delay)
+        super().setup()
+
+    def do_HEAD(self):
+        self.send_response(204)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(202)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format, *args):
+        pass
+
+
+PAYLOAD = {
+    "provider": "openai",
+    "model": "gpt-4o",
+    "function_id": "bench",
+    "usage": {"input": 100, "output": 20},
+}
+
+
+def cold_start(track_url, serverless):
+    """Return (init seconds, first send seconds) for a fresh client."""
+    start = time.perf_counter()
+    client = TeerClient(api_key="bench", track_url=track_url, serverless=serverless)
+    initialized = time.perf_counter()
+    client.ingest.send(PAYLOAD)
+    sent = time.perf_counter()
+    client.http_client.transport.close()
+    return initialized - start, sent - initialized
+
+
+def invocations(track_url, count, events):
+    """Return per-invocation flush times for a warm, wrapped handler."""
+    client = TeerClient(api_key="bench", track_url=track_url, serverless=True)
+    flushes = []
+
+    @handler(client)
+    def function(event, context):
+        for _ in range(events):
+            client.ingest.enqueue(PAYLOAD)
+
+    for _ in range(count):
+        function({}, None)
+        flushes.append(client.metrics.get("serverless.flush_seconds"))
+    client.close()
+    return flushes
+
+
+def ms(seconds):
+    return f"{seconds * 1000:>10.2f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cold-starts", type=int, default=20)
+    parser.add_argument("--invocations", type=int, default=500)
+    parser.add_argument("--events", type=int, default=5)
+    parser.add_argument("--connect-delay", type=float, default=0.02)
+    args = parser.parse_args()
+
+    Handler.connect_delay = args.connect_delay
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    track_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print(f"Cold starts ({args.cold_starts} runs, median ms)")
+    print(f"{'mode':>12} {'init':>10} {'first send':>10}")
+    for name, serverless in (("default", False), ("serverless", True)):
+        runs = [cold_start(track_url, serverless) for _ in range(args.cold_starts)]
+        init = statistics.median(r[0] for r in runs)
+        first = statistics.median(r[1] for r in runs)
+        print(f"{name:>12} {ms(init)} {ms(first)}")
+
+    flushes = sorted(invocations(track_url, args.invocations, args.events))
+    print()
+    print(f"End-of-invocation flush ({args.events} events, ms)")
+    print(f"{'p50':>10} {'p99':>10}")
+    p99 = flushes[int(len(flushes) * 0.99) - 1]
+    print(f"{ms(statistics.median(flushes))} {ms(p99)}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark: per-request cost of each transport.
+
+Sends the same ingest event through every transport that ships with the SDK:
+in-memory, JSONL file, HTTP over a Unix domain socket and pooled HTTP over
+loopback TCP. The socket transports talk to a minimal local HTTP server
+started by the benchmark, so the numbers compare transport overhead rather
+than the speed of any real server.
+
+Usage:
+    python benchmarks/bench_transports.py [--requests 5000]
+"""
+
+import argparse
+import os
+import socketserver
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from teer import (
+    FileTransport,
+    HTTPTransport,
+    InMemoryTransport,
+    TeerClient,
+    UnixSocketTransport,
+)
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Accepts any POST with an empty JSON object, keeping the connection alive."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(202)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TCPHandler(Handler):
+    # Avoid Nagle/delayed-ACK stalls between the header and body writes
+    disable_nagle_algorithm = True
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        # BaseHTTPRequestHandler expects a (host, port) client address
+        return request, ("local", 0)
+
+
+def serve(server):
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def run(transport, track_url, requests):
+    client = TeerClient(api_key="bench", track_url=track_url, transport=transport)
+    payload = {
+        "provider": "openai",
+        "model": "gpt-4o",
+        "function_id": "bench",
+        "usage": {"input": 100, "output": 20},
+    }
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        client.ingest.send(payload)
+    elapsed = time.perf_counter() - start
+    transport.close()
+    return elapsed / requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = os.path.join(tmp, "teer.sock")
+        unix_server = serve(UnixHTTPServer(socket_path, Handler))
+        tcp_server = serve(ThreadingHTTPServer(("127.0.0.1", 0), TCPHandler))
+        tcp_url = f"http://127.0.0.1:{tcp_server.server_address[1]}"
+
+        cases = [
+            ("memory", InMemoryTransport(record=False), "http://local"),
+            ("file", FileTransport(os.path.join(tmp, "events.jsonl")), "http://local"),
+            ("unix", UnixSocketTransport(socket_path), "http://local"),
+            ("http", HTTPTransport(), tcp_url),
+        ]
+
+        print(f"{args.requests} sequential ingest requests")
+        print(f"{'transport':>10} {'us/request':>12} {'requests/s':>12}")
+        for name, transport, track_url in cases:
+            seconds = run(transport, track_url, args.requests)
+            print(f"{name:>10} {seconds * 1e6:>12,.1f} {1 / seconds:>12,.0f}")
+
+        unix_server.shutdown()
+        tcp_server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,35 @@
 #
 # SPDX-License-Identifier: MIT
 
+import atexit
 import os
-from typing import Optional
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
 
 from .http import HttpClient
-from .resources import Ingest, BillingResource
+from .hooks import Hook, RequestContext
+from .metrics import Metrics
+from .concurrency import AdaptiveConcurrencyLimiter
+from .sender import EXIT_FLUSH_TIMEOUT, SenderPool, Ordering
+from .pricing import CostEngine
+from .processors import EventProcessor, ProcessorChain
+from .cache import ResponseCache
+from .tenants import TeerClientPool
+from .hedging import HedgingPolicy
+from .defaults import PayloadDefaults
+from .dedup import Deduplicator
+from .delivery import DeliveryTracker
+from .stats import UsageStats
+from .tokens import TokenEstimator
+from .transports import (
+    Transport,
+    HTTPTransport,
+    InMemoryTransport,
+    FileTransport,
+    UnixSocketTransport,
+)
+from .resources import Ingest, BillingResource, RateCardsResource, UsageResource
 from .types import (
     AnthropicCache,
     OpenAICache,
@@ -62,6 +86,23 @@ class TeerClient:
         base_url: str = DEFAULT_API_BASE_URL,
         track_url: str = DEFAULT_TRACK_BASE_URL,
         api_version: str = "v1",
+        hooks: Optional[Iterable[Hook]] = None,
+        max_retries: int = 2,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        sender_workers: int = 4,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        ordering: Ordering = "none",
+        processors: Optional[Iterable[EventProcessor]] = None,
+        response_cache: Optional[ResponseCache] = None,
+        transport: Optional[Transport] = None,
+        defaults: Optional[Dict[str, Any]] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        serverless: bool = False,
+        dedup: Optional[Deduplicator] = None,
+        stats: Optional[UsageStats] = None,
+        delivery: Optional[DeliveryTracker] = None,
+        pool_maxsize: Optional[int] = None,
     ):
         """
         Initialize the Teer client.
@@ -73,6 +114,51 @@ class TeerClient:
             track_url: The base URL for tracking endpoints (ingest, billing).
                       Defaults to https://track.teer.ai.
             api_version: The API version to use. Defaults to v1.
+            hooks: Optional request lifecycle hooks (see ``teer.hooks.Hook``),
+                   shared by every resource.
+            max_retries: How many times to retry requests the server throttles
+                        (429/503), honoring Retry-After. Defaults to 2.
+            concurrency_limiter: Optional adaptive limiter that caps in-flight
+                                requests and backs off when throttled.
+            sender_workers: Number of background threads sending events buffered
+                           with ``ingest.enqueue``. Defaults to 4.
+            batch_size: Maximum number of buffered events per request.
+            flush_interval: Maximum time a buffered event waits for its batch
+                           to fill, in seconds.
+            ordering: ``"trace_id"`` to deliver buffered events of the same
+                     trace in order, or ``"none"`` (the default) for the best
+                     throughput.
+            processors: Optional event processors that see, and may modify or
+                       drop, every outgoing ingest event.
+            response_cache: Optional cache for GET requests such as rate cards,
+                           revalidated with ETag/Last-Modified so unchanged
+                           resources cost a 304.
+            transport: Optional transport that delivers requests, e.g. an
+                      ``InMemoryTransport`` in tests or a ``FileTransport`` for
+                      offline capture. Defaults to pooled HTTP.
+            defaults: Optional default ingest payload fields, such as
+                     ``provider``, ``platform`` or ``metadata``. They are
+                     merged into each payload when it is encoded; fields set
+                     on the payload win.
+            hedging: Optional policy that duplicates slow ``ingest.send`` and
+                    ``billing.meter_events.create`` requests to cut tail
+                    latency.
+            serverless: Open the connection to the tracking host during
+                       initialization, so the first send does not pay for DNS
+                       and TLS. Pair it with ``teer.serverless.handler`` to
+                       flush buffered events before each invocation returns.
+            dedup: Optional ``teer.dedup.Deduplicator`` that suppresses ingest
+                  and meter events already sent, e.g. by a retried job or a
+                  replayed spool.
+            stats: Optional ``teer.stats.UsageStats`` that keeps live
+                  per-second usage of outgoing ingest events, readable as
+                  ``client.stats``.
+            delivery: Optional ``teer.delivery.DeliveryTracker`` that stamps
+                     ingest and meter events with a producer ID and sequence
+                     number, and resends buffered ingest events the server
+                     has not acknowledged.
+            pool_maxsize: Maximum number of pooled connections kept per host.
+                         Defaults to the number of sender workers, at least 10.
         """
         self.api_key = api_key or os.environ.get(TEER_API_KEY_ENV)
         if not self.api_key:
@@ -85,12 +171,182 @@ class TeerClient:
         self.track_url = track_url.rstrip("/")
         self.api_version = api_version
 
-        # Initialize the HTTP client with the API base URL
-        self.http_client = HttpClient(api_key=self.api_key, base_url=self.api_base)
+        # Initialize the HTTP client with the API base URL. All resources send
+        # through this client, whichever base URL (api or track) they target.
+        self.metrics = Metrics()
+        self.http_client = HttpClient(
+            api_key=self.api_key,
+            base_url=self.api_base,
+            hooks=hooks,
+            max_retries=max_retries,
+            metrics=self.metrics,
+            pool_maxsize=pool_maxsize or max(10, sender_workers),
+            cache=response_cache,
+            transport=transport,
+            hedging=hedging,
+        )
+
+        # The limiter runs last in the chain so it measures only time on the wire
+        self.concurrency_limiter = concurrency_limiter
+        if concurrency_limiter is not None:
+            if concurrency_limiter.metrics is None:
+                concurrency_limiter.metrics = self.metrics
+            self.http_client.add_hook(concurrency_limiter)
+
+        # Event processors run on every ingest event before it is sent.
+        # Duplicates are suppressed first so no other processor counts them,
+        # then stats see every event before sampling can drop any.
+        self.dedup = dedup
+        self.stats = stats
+        builtin: List[EventProcessor] = []
+        if dedup is not None:
+            if dedup.metrics is None:
+                dedup.metrics = self.metrics
+            builtin.append(dedup)
+        if stats is not None:
+            builtin.append(stats)
+        self.processors = ProcessorChain([*builtin, *(processors or ())])
+
+        self.delivery = delivery
+        if delivery is not None:
+            delivery.attach(self)
 
         # Initialize resources
-        self.ingest = Ingest(self)
+        self.defaults = PayloadDefaults(defaults) if defaults else None
+        self.ingest = Ingest(self, self.defaults)
         self.billing = BillingResource(self)
+        self.rate_cards = RateCardsResource(self)
+        self.usage = UsageResource(self)
+
+        # Prices usage locally from cached rate cards
+        self.pricing = CostEngine(self)
+
+        # The sender pool is created on first use so clients that only send
+        # synchronously never start background threads.
+        self._sender_options = {
+            "workers": sender_workers,
+            "batch_size": batch_size,
+            "flush_interval": flush_interval,
+            "ordering": ordering,
+        }
+        self._sender: Optional[SenderPool] = None
+        self._sender_lock = threading.Lock()
+
+        if serverless:
+            self.prewarm()
+
+    def with_defaults(self, **defaults: Any) -> "ScopedClient":
+        """
+        Get a view of the client with extra default ingest payload fields.
+
+        The view shares this client's connections, sender and processors;
+        only its ``ingest`` resource differs. Views are cheap to create, e.g.
+        one per request handler.
+
+        Args:
+            **defaults: Default payload fields, layered on top of the
+                        client's own defaults.
+
+        Returns:
+            The scoped view.
+        """
+        base = self.defaults
+        return ScopedClient(
+            self, base.merged(defaults) if base else PayloadDefaults(defaults)
+        )
+
+    def prewarm(self, timeout: float = 2.0) -> float:
+        """
+        Open a pooled connection to the tracking host ahead of the first send.
+
+        Args:
+            timeout: Maximum time to spend connecting, in seconds.
+
+        Returns:
+            The time spent, in seconds. Also recorded as the
+            ``serverless.prewarm_seconds`` gauge.
+        """
+        started = time.perf_counter()
+        self.http_client.transport.warm(f"{self.track_base}/ingest", timeout)
+        elapsed = time.perf_counter() - started
+        self.metrics.set_gauge("serverless.prewarm_seconds", elapsed)
+        return elapsed
+
+    def add_processor(self, processor: EventProcessor) -> None:
+        """
+        Register an event processor at the end of the chain.
+
+        Args:
+            processor: The processor to add.
+        """
+        self.processors.add(processor)
+
+    def remove_processor(self, processor: EventProcessor) -> None:
+        """
+        Unregister an event processor.
+
+        Args:
+            processor: The processor to remove.
+        """
+        self.processors.remove(processor)
+
+    @property
+    def sender(self) -> SenderPool:
+        """The background sender pool, created on first use."""
+        if self._sender is None:
+            with self._sender_lock:
+                if self._sender is None:
+                    sender = SenderPool(
+                        self.ingest._post_batch,
+                        metrics=self.metrics,
+                        name="ingest",
+                        **self._sender_options,
+                    )
+                    # Meter events are billed, so they jump ahead of analytics
+                    # and are retried until delivered rather than dropped.
+                    sender.add_lane(
+                        "meter",
+                        self.billing.meter_events._post_batch,
+                        priority=1,
+                        weight=8,
+                        durable=True,
+                    )
+                    self._sender = sender
+                    atexit.register(self.close, EXIT_FLUSH_TIMEOUT)
+        return self._sender
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for all buffered events to be sent.
+
+        Args:
+            timeout: Maximum time to wait, in seconds. Waits forever if None.
+
+        Returns:
+            True if every buffered event was sent, False on timeout.
+        """
+        # Events held by processors, e.g. summaries, go out with the rest
+        self.processors.flush()
+        if self._sender is None:
+            return True
+        return self._sender.flush(timeout)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Flush buffered events and stop the background sender.
+
+        Args:
+            timeout: Maximum time to wait for the flush, in seconds.
+
+        Returns:
+            True if every buffered event was sent before closing.
+        """
+        if self.delivery is not None:
+            self.delivery.close()
+        self.processors.flush()
+        if self._sender is None:
+            return True
+        return self._sender.close(timeout)
 
     @property
     def api_base(self) -> str:
@@ -103,12 +359,69 @@ class TeerClient:
         return f"{self.track_url}/{self.api_version}"
 
 
+class ScopedClient:
+    """
+    A view of a ``TeerClient`` whose ingest payloads get extra defaults.
+
+    Everything except ``ingest`` and ``defaults`` is delegated to the
+    underlying client.
+    """
+
+    def __init__(self, client: TeerClient, defaults: PayloadDefaults):
+        """
+        Initialize the view.
+
+        Args:
+            client: The client to delegate to.
+            defaults: The view's complete defaults, including the client's.
+        """
+        self.client = client
+        self.defaults = defaults
+        self.ingest = Ingest(client, defaults)
+
+    def with_defaults(self, **defaults: Any) -> "ScopedClient":
+        """
+        Get a narrower view with more defaults layered on top of this one's.
+
+        Args:
+            **defaults: Default payload fields.
+
+        Returns:
+            The scoped view.
+        """
+        return ScopedClient(self.client, self.defaults.merged(defaults))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
+
+
 # For backwards compatibility with the old API
 Teer = TeerClient
 
 __all__ = [
     "TeerClient",
     "Teer",
+    "ScopedClient",
+    "TeerClientPool",
+    "PayloadDefaults",
+    "Deduplicator",
+    "DeliveryTracker",
+    "UsageStats",
+    "Hook",
+    "RequestContext",
+    "Metrics",
+    "AdaptiveConcurrencyLimiter",
+    "SenderPool",
+    "CostEngine",
+    "TokenEstimator",
+    "EventProcessor",
+    "ResponseCache",
+    "HedgingPolicy",
+    "Transport",
+    "HTTPTransport",
+    "InMemoryTransport",
+    "FileTransport",
+    "UnixSocketTransport",
     "AnthropicCache",
     "OpenAICache",
     "GoogleCache",
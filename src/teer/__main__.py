@@ -0,0 +1,9 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,159 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import requests
+
+
+class CacheEntry:
+    """A cached response body and the validators needed to revalidate it."""
+
+    __slots__ = ("body", "etag", "last_modified", "validated_at", "stored_at")
+
+    def __init__(self, body: Any, etag: Optional[str], last_modified: Optional[str]):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = self.validated_at = time.monotonic()
+
+    def validators(self) -> Dict[str, str]:
+        """
+        Get the conditional request headers for revalidating this entry.
+
+        Returns:
+            ``If-None-Match`` and/or ``If-Modified-Since`` headers.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    LRU cache of parsed GET responses with conditional revalidation.
+
+    Pass an instance to ``TeerClient(response_cache=...)``. A cached response
+    younger than ``max_age`` seconds is returned without any request. After
+    that, the request is sent with ``If-None-Match``/``If-Modified-Since``; a
+    304 reply reuses the already parsed body. Entries older than ``ttl`` are
+    discarded, and the least recently used entries are evicted beyond
+    ``max_entries``.
+
+    Cached bodies are shared between callers and must not be modified.
+    """
+
+    def __init__(
+        self, max_entries: int = 256, ttl: float = 300.0, max_age: float = 0.0
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached responses.
+            ttl: Maximum lifetime of a cached response, in seconds.
+            max_age: How long a response is used without revalidation, in
+                     seconds. Defaults to 0, revalidating on every request.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_age = max_age
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(
+        url: str, params: Optional[Dict[str, Any]], authorization: Optional[str]
+    ) -> Tuple[Hashable, ...]:
+        """
+        Build the cache key of a request.
+
+        Args:
+            url: The request URL.
+            params: The query parameters.
+            authorization: The Authorization header, so that different
+                           accounts never share entries.
+
+        Returns:
+            A hashable cache key.
+        """
+        items = tuple(sorted((k, str(v)) for k, v in (params or {}).items()))
+        return (url, items, authorization)
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        """
+        Look up an entry, discarding it if it has outlived the TTL.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The entry, or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry.stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """
+        Check whether an entry can be used without revalidation.
+
+        Args:
+            entry: The cache entry.
+
+        Returns:
+            True if the entry was validated less than ``max_age`` seconds ago.
+        """
+        return time.monotonic() - entry.validated_at < self.max_age
+
+    def store(self, key: Hashable, response: requests.Response, body: Any) -> None:
+        """
+        Cache a successful response, unless it forbids caching.
+
+        Args:
+            key: The cache key.
+            response: The HTTP response.
+            body: The parsed response body.
+        """
+        if "no-store" in response.headers.get("Cache-Control", ""):
+            return
+        entry = CacheEntry(
+            body, response.headers.get("ETag"), response.headers.get("Last-Modified")
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def revalidated(self, entry: CacheEntry) -> None:
+        """
+        Record that the server confirmed an entry is unchanged.
+
+        Args:
+            entry: The cache entry.
+        """
+        now = time.monotonic()
+        entry.validated_at = now
+        entry.stored_at = now
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            self._entries.clear()
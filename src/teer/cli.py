@@ -0,0 +1,410 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import BinaryIO, Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from . import TeerClient, DEFAULT_API_BASE_URL, DEFAULT_TRACK_BASE_URL
+from .compression import GzipCompression
+
+logger = logging.getLogger("teer")
+
+CHECKPOINT_SUFFIX = ".checkpoint"
+
+
+class Checkpoint:
+    """
+    Persistent record of how far an upload has progressed.
+
+    The checkpoint stores the byte offset up to which every line has been
+    sent, so an interrupted upload can seek straight past it.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the checkpoint.
+
+        Args:
+            path: Where the checkpoint file is stored.
+        """
+        self.path = path
+
+    def load(self) -> Tuple[int, int]:
+        """
+        Read the checkpoint.
+
+        Returns:
+            The byte offset to resume from and the number of events already sent.
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return 0, 0
+        return int(state["offset"]), int(state.get("events", 0))
+
+    def save(self, offset: int, events: int) -> None:
+        """
+        Atomically write the checkpoint.
+
+        Args:
+            offset: Byte offset up to which every line has been sent.
+            events: Number of events sent so far.
+        """
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"offset": offset, "events": events}, f)
+        os.replace(tmp_path, self.path)
+
+    def remove(self) -> None:
+        """Delete the checkpoint file, if any."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class UploadResult:
+    """Summary of a finished upload."""
+
+    def __init__(self, events: int, skipped: int, bytes_read: int, seconds: float):
+        self.events = events
+        self.skipped = skipped
+        self.bytes_read = bytes_read
+        self.seconds = seconds
+
+    @property
+    def rate(self) -> float:
+        """Events sent per second."""
+        return self.events / self.seconds if self.seconds else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"<UploadResult events={self.events} skipped={self.skipped} "
+            f"seconds={self.seconds:.1f}>"
+        )
+
+
+def iter_batches(
+    f: BinaryIO, offset: int, batch_size: int, validate: bool = False
+) -> Iterator[Tuple[int, int, List[bytes], int]]:
+    """
+    Read a JSONL file in batches without loading it into memory.
+
+    Args:
+        f: The file, opened in binary mode.
+        offset: Byte offset to start reading from.
+        batch_size: Maximum number of events per batch.
+        validate: Whether to parse each line and skip invalid JSON.
+
+    Yields:
+        Tuples of (start offset, end offset, encoded events, skipped lines).
+    """
+    f.seek(offset)
+    start = offset
+    lines: List[bytes] = []
+    skipped = 0
+    for line in f:
+        offset += len(line)
+        line = line.strip()
+        if not line:
+            continue
+        if validate:
+            try:
+                json.loads(line)
+            except ValueError:
+                logger.warning(f"Skipping invalid JSON line ending at byte {offset}")
+                skipped += 1
+                continue
+        lines.append(line)
+        if len(lines) >= batch_size:
+            yield start, offset, lines, skipped
+            start, lines, skipped = offset, [], 0
+    if lines or skipped:
+        yield start, offset, lines, skipped
+
+
+class Uploader:
+    """
+    Streams a JSONL file of usage reports to Teer with parallel workers.
+
+    Batches may complete out of order; the checkpoint only advances past a
+    batch once every batch before it has also been sent.
+    """
+
+    def __init__(
+        self,
+        client: TeerClient,
+        path: str,
+        batch_size: int = 500,
+        workers: int = 4,
+        checkpoint_path: Optional[str] = None,
+        validate: bool = False,
+        progress: Optional[TextIO] = None,
+        checkpoint_interval: float = 1.0,
+    ):
+        """
+        Initialize the uploader.
+
+        Args:
+            client: The Teer client to send with.
+            path: Path to the JSONL file.
+            batch_size: Maximum number of events per request.
+            workers: Number of concurrent requests.
+            checkpoint_path: Where to store progress. Defaults to the input
+                             path with a ``.checkpoint`` suffix.
+            validate: Whether to parse each line and skip invalid JSON.
+            progress: Stream to report progress on, or None for silence.
+            checkpoint_interval: Minimum seconds between checkpoint writes.
+        """
+        self.client = client
+        self.path = path
+        self.batch_size = batch_size
+        self.workers = workers
+        self.checkpoint = Checkpoint(checkpoint_path or path + CHECKPOINT_SUFFIX)
+        self.validate = validate
+        self.progress = progress
+        self.checkpoint_interval = checkpoint_interval
+
+        self._lock = threading.Lock()
+        self._completed: Dict[int, Tuple[int, int]] = {}
+        self._watermark = 0
+        self._events = 0
+        self._error: Optional[BaseException] = None
+        self._last_save = 0.0
+
+    def run(self, restart: bool = False) -> UploadResult:
+        """
+        Upload the file, resuming from the checkpoint unless ``restart`` is set.
+
+        Args:
+            restart: Ignore any existing checkpoint and start from the beginning.
+
+        Returns:
+            A summary of the upload.
+
+        Raises:
+            Exception: The first batch failure. The checkpoint is kept so the
+                       upload can be resumed.
+        """
+        offset, events = (0, 0) if restart else self.checkpoint.load()
+        size = os.path.getsize(self.path)
+        if offset > size:
+            raise ValueError(
+                f"Checkpoint offset {offset} is past the end of {self.path}; "
+                f"use --restart to upload from the beginning"
+            )
+        if offset:
+            self._report(
+                f"Resuming at byte {offset:,} ({events:,} events already sent)\n"
+            )
+
+        self._watermark = offset
+        self._events = events
+        start_offset, start_events = offset, events
+        skipped = 0
+        started = time.monotonic()
+        last_report = started
+        in_flight = threading.BoundedSemaphore(self.workers * 2)
+
+        try:
+            with open(self.path, "rb") as f, ThreadPoolExecutor(self.workers) as pool:
+                for start, end, lines, batch_skipped in iter_batches(
+                    f, offset, self.batch_size, self.validate
+                ):
+                    skipped += batch_skipped
+                    in_flight.acquire()
+                    if self._error is not None:
+                        in_flight.release()
+                        break
+                    future = pool.submit(self._send, lines)
+
+                    def done(fut, start=start, end=end, count=len(lines)):
+                        try:
+                            self._complete(fut, start, end, count)
+                        finally:
+                            in_flight.release()
+
+                    future.add_done_callback(done)
+                    now = time.monotonic()
+                    if now - last_report >= 1.0:
+                        last_report = now
+                        self._report_progress(start_offset, start_events, size, started)
+        finally:
+            with self._lock:
+                self.checkpoint.save(self._watermark, self._events)
+
+        if self._error is not None:
+            self._report("\n")
+            raise self._error
+
+        self.checkpoint.remove()
+        self._report_progress(start_offset, start_events, size, started)
+        self._report("\n")
+        return UploadResult(
+            self._events - start_events,
+            skipped,
+            self._watermark - start_offset,
+            time.monotonic() - started,
+        )
+
+    def _send(self, lines: Sequence[bytes]) -> None:
+        if lines:
+            self.client.ingest.send_batch_encoded(lines)
+
+    def _complete(
+        self, future: "Future[None]", start: int, end: int, count: int
+    ) -> None:
+        error = future.exception()
+        with self._lock:
+            if error is not None:
+                if self._error is None:
+                    self._error = error
+                return
+            self._completed[start] = (end, count)
+            # Advance the watermark over every contiguous completed batch
+            while self._watermark in self._completed:
+                end_offset, sent = self._completed.pop(self._watermark)
+                self._watermark = end_offset
+                self._events += sent
+            now = time.monotonic()
+            if now - self._last_save >= self.checkpoint_interval:
+                self._last_save = now
+                self.checkpoint.save(self._watermark, self._events)
+
+    def _report_progress(
+        self, start_offset: int, start_events: int, size: int, started: float
+    ) -> None:
+        elapsed = max(time.monotonic() - started, 1e-9)
+        with self._lock:
+            events, offset = self._events, self._watermark
+        sent = events - start_events
+        percent = 100.0 * offset / size if size else 100.0
+        self._report(
+            f"\r{events:,} events sent ({percent:.1f}%), "
+            f"{sent / elapsed:,.0f} events/s, "
+            f"{(offset - start_offset) / elapsed / 1e6:.1f} MB/s"
+        )
+
+    def _report(self, message: str) -> None:
+        if self.progress is not None:
+            self.progress.write(message)
+            self.progress.flush()
+
+
+def _upload(args: argparse.Namespace) -> int:
+    hooks = [GzipCompression()] if args.gzip else None
+    client = TeerClient(
+        api_key=args.api_key,
+        base_url=args.base_url,
+        track_url=args.track_url,
+        hooks=hooks,
+        # One pooled connection per worker, so none is discarded and reopened
+        pool_maxsize=max(10, args.workers),
+    )
+    uploader = Uploader(
+        client,
+        args.path,
+        batch_size=args.batch_size,
+        workers=args.workers,
+        checkpoint_path=args.checkpoint,
+        validate=args.validate,
+        progress=None if args.quiet else sys.stderr,
+    )
+    try:
+        result = uploader.run(restart=args.restart)
+    except KeyboardInterrupt:
+        print(
+            f"\nInterrupted; progress saved to {uploader.checkpoint.path}",
+            file=sys.stderr,
+        )
+        return 130
+    except Exception as e:
+        print(f"Upload failed: {e}", file=sys.stderr)
+        print(
+            f"Progress saved to {uploader.checkpoint.path}; rerun to resume.",
+            file=sys.stderr,
+        )
+        return 1
+
+    print(
+        f"Uploaded {result.events:,} events in {result.seconds:.1f}s "
+        f"({result.rate:,.0f} events/s)"
+        + (f", skipped {result.skipped:,} invalid lines" if result.skipped else ""),
+        file=sys.stderr,
+    )
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Entry point for the ``teer`` command.
+
+    ``teer upload usage.jsonl --workers 8 --gzip`` sends a JSONL file with
+    one usage report per line, in the format accepted by
+    ``client.ingest.send``.
+
+    Args:
+        argv: Command line arguments, defaulting to ``sys.argv[1:]``.
+
+    Returns:
+        The process exit code.
+    """
+    parser = argparse.ArgumentParser(
+        prog="teer", description="Teer command line tools."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    upload = subparsers.add_parser(
+        "upload", help="Upload usage reports from a JSONL file."
+    )
+    upload.add_argument("path", help="JSONL file with one usage report per line.")
+    upload.add_argument(
+        "--api-key", help="Teer API key. Defaults to $TEER_SECRET_API_KEY."
+    )
+    upload.add_argument("--base-url", default=DEFAULT_API_BASE_URL)
+    upload.add_argument("--track-url", default=DEFAULT_TRACK_BASE_URL)
+    upload.add_argument(
+        "--batch-size", type=int, default=500, help="Events per request (default 500)."
+    )
+    upload.add_argument(
+        "--workers", type=int, default=4, help="Concurrent requests (default 4)."
+    )
+    upload.add_argument(
+        "--gzip", action="store_true", help="Compress request bodies with gzip."
+    )
+    upload.add_argument(
+        "--checkpoint",
+        help=f"Checkpoint file. Defaults to PATH{CHECKPOINT_SUFFIX}.",
+    )
+    upload.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore any existing checkpoint and start from the beginning.",
+    )
+    upload.add_argument(
+        "--validate",
+        action="store_true",
+        help="Parse every line and skip the ones that are not valid JSON.",
+    )
+    upload.add_argument("--quiet", action="store_true", help="Do not report progress.")
+    upload.set_defaults(func=_upload)
+
+    args = parser.parse_args(argv)
+    try:
+        return args.func(args)
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
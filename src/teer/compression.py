@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+import gzip
+import json
+
+from .hooks import Hook, RequestContext
+
+
+class GzipCompression(Hook):
+    """
+    Hook that gzip-compresses request bodies.
+
+    Bodies smaller than ``min_size`` bytes are sent uncompressed, since the
+    gzip framing would outweigh the savings.
+    """
+
+    def __init__(self, min_size: int = 1024, level: int = 6):
+        """
+        Initialize the compression hook.
+
+        Args:
+            min_size: Minimum encoded body size, in bytes, worth compressing.
+            level: gzip compression level, from 1 (fastest) to 9 (smallest).
+        """
+        self.min_size = min_size
+        self.level = level
+
+    def before_send(self, request: RequestContext) -> None:
+        body = request.body
+        if body is None:
+            if request.json is None:
+                return
+            body = json.dumps(request.json, separators=(",", ":")).encode("utf-8")
+        if len(body) < self.min_size:
+            request.body = body
+            return
+        request.body = gzip.compress(body, compresslevel=self.level)
+        request.headers["Content-Encoding"] = "gzip"
@@ -0,0 +1,211 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+import logging
+import threading
+import time
+from typing import Any, Optional
+
+import requests
+
+from .hooks import Hook, RequestContext
+from .metrics import Metrics
+
+logger = logging.getLogger("teer")
+
+# Status codes that signal the server wants us to slow down.
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+_SLOT_KEY = "teer.concurrency.started"
+
+
+class AdaptiveConcurrencyLimiter(Hook):
+    """
+    AIMD concurrency limiter for outgoing requests.
+
+    The limiter caps the number of requests in flight. Every healthy response
+    grows the limit additively (by roughly one slot per round trip); a 429 or
+    503 shrinks it multiplicatively and, when the server sends
+    ``Retry-After``, pauses all new requests until that time has passed, for
+    at most ``max_retry_delay`` seconds.
+    Responses much slower than the best latency seen so far hold the limit
+    steady instead of growing it.
+
+    Register it as a hook, or pass it to ``TeerClient(concurrency_limiter=...)``.
+    The current limit is published as the ``concurrency.limit`` gauge.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff_ratio: float = 0.5,
+        latency_tolerance: float = 2.0,
+        max_retry_delay: float = 60.0,
+        metrics: Optional[Metrics] = None,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial_limit: Number of requests allowed in flight at start.
+            min_limit: The limit never drops below this value.
+            max_limit: The limit never grows above this value.
+            backoff_ratio: Factor the limit is multiplied by when throttled.
+            latency_tolerance: Responses slower than this multiple of the
+                              baseline latency do not grow the limit.
+            max_retry_delay: Longest pause, in seconds, a ``Retry-After``
+                             header can impose on new requests.
+            metrics: Metrics registry to publish the limit into.
+        """
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be between 0 and 1")
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                "Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit"
+            )
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.max_retry_delay = max_retry_delay
+
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._blocked_until = 0.0
+        self._baseline_latency: Optional[float] = None
+        self._condition = threading.Condition()
+        self.metrics = metrics
+
+    @property
+    def metrics(self) -> Optional[Metrics]:
+        """The metrics registry the limit is published into."""
+        return self._metrics
+
+    @metrics.setter
+    def metrics(self, metrics: Optional[Metrics]) -> None:
+        self._metrics = metrics
+        self._publish()
+
+    @property
+    def limit(self) -> int:
+        """The current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests currently in flight."""
+        return self._in_flight
+
+    def acquire(self) -> None:
+        """Block until a request slot is available and take it."""
+        with self._condition:
+            while True:
+                delay = self._blocked_until - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(delay)
+                elif self._in_flight >= int(self._limit):
+                    self._condition.wait()
+                else:
+                    break
+            self._in_flight += 1
+            self._publish()
+
+    def release(
+        self,
+        latency: Optional[float] = None,
+        throttled: bool = False,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """
+        Return a request slot and adjust the limit.
+
+        Args:
+            latency: How long the request took, in seconds. ``None`` when the
+                     request failed without a usable response.
+            throttled: Whether the server asked us to slow down.
+            retry_after: Seconds the server asked us to wait, if any.
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if throttled:
+                self._limit = max(self.min_limit, self._limit * self.backoff_ratio)
+                if retry_after:
+                    retry_after = min(retry_after, self.max_retry_delay)
+                    self._blocked_until = max(
+                        self._blocked_until, time.monotonic() + retry_after
+                    )
+                if self.metrics is not None:
+                    self.metrics.increment("concurrency.throttled")
+                logger.debug(
+                    f"Throttled by server, concurrency limit now {int(self._limit)}"
+                )
+            elif latency is not None:
+                baseline = self._baseline_latency
+                if baseline is None or latency < baseline:
+                    self._baseline_latency = latency
+                elif baseline:
+                    # Let the baseline drift up slowly so a single fast
+                    # outlier does not pin it forever.
+                    self._baseline_latency = baseline * 0.99 + latency * 0.01
+                if baseline is None or latency <= baseline * self.latency_tolerance:
+                    self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+            self._publish()
+            self._condition.notify_all()
+
+    def before_send(self, request: RequestContext) -> None:
+        self.acquire()
+        request.extensions[_SLOT_KEY] = time.monotonic()
+
+    def after_response(self, request: RequestContext, response: Any) -> None:
+        started = request.extensions.pop(_SLOT_KEY, None)
+        if started is not None:
+            self.release(latency=time.monotonic() - started)
+
+    def on_error(self, request: RequestContext, error: Exception) -> None:
+        started = request.extensions.pop(_SLOT_KEY, None)
+        if started is None:
+            return
+        response = getattr(error, "response", None)
+        status_code = getattr(response, "status_code", None)
+        if status_code in THROTTLE_STATUS_CODES:
+            self.release(throttled=True, retry_after=parse_retry_after(response))
+        else:
+            self.release()
+
+    def _publish(self) -> None:
+        if self.metrics is not None:
+            self.metrics.set_gauge("concurrency.limit", int(self._limit))
+            self.metrics.set_gauge("concurrency.in_flight", self._in_flight)
+
+
+def parse_retry_after(response: Optional[requests.Response]) -> Optional[float]:
+    """
+    Parse the ``Retry-After`` header of a response.
+
+    Args:
+        response: The response to inspect.
+
+    Returns:
+        The number of seconds to wait, or None if the header is absent or invalid.
+    """
+    if response is None:
+        return None
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    # Retry-After may also be an HTTP date.
+    from email.utils import parsedate_to_datetime
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
@@ -0,0 +1,301 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+import hashlib
+import logging
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable, Optional, Tuple
+
+from .defaults import DefaultedEvent
+from .metrics import Metrics
+from .processors import EventProcessor
+from .types import IngestPayload
+
+logger = logging.getLogger("teer")
+
+
+class DedupFilter(ABC):
+    """
+    Base class for the sets of recently seen keys a ``Deduplicator`` uses.
+
+    Implementations must be thread safe and bounded in memory.
+    """
+
+    @abstractmethod
+    def seen(self, key: str) -> bool:
+        """
+        Record a key, reporting whether it was already recorded.
+
+        Args:
+            key: The key.
+
+        Returns:
+            True if the key was seen within the filter's window.
+        """
+
+    @abstractmethod
+    def forget(self, key: str) -> None:
+        """
+        Remove a key, e.g. because the event it belongs to failed to send.
+
+        Filters that cannot remove keys ignore this.
+
+        Args:
+            key: The key.
+        """
+
+
+class WindowedLRUFilter(DedupFilter):
+    """
+    An exact filter of the keys seen within ``window`` seconds.
+
+    At most ``max_keys`` keys are kept; beyond that the least recently seen
+    are forgotten first. Memory grows with the number of keys, roughly 150
+    bytes each.
+    """
+
+    def __init__(self, window: float = 600.0, max_keys: int = 100_000):
+        """
+        Initialize the filter.
+
+        Args:
+            window: How long a key is remembered, in seconds.
+            max_keys: Maximum number of keys remembered.
+        """
+        self.window = window
+        self.max_keys = max_keys
+        self._keys: "OrderedDict[Hashable, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def seen(self, key: str) -> bool:
+        now = time.monotonic()
+        keys = self._keys
+        with self._lock:
+            # Keys are ordered by when they were last seen, so expired ones
+            # are all at the front.
+            expired = now - self.window
+            while keys and next(iter(keys.values())) < expired:
+                keys.popitem(last=False)
+
+            duplicate = key in keys
+            keys[key] = now
+            keys.move_to_end(key)
+            if len(keys) > self.max_keys:
+                keys.popitem(last=False)
+        return duplicate
+
+    def forget(self, key: str) -> None:
+        with self._lock:
+            self._keys.pop(key, None)
+
+
+class BloomFilter(DedupFilter):
+    """
+    A probabilistic filter with a fixed memory footprint.
+
+    Keys are recorded in the current of two generations and looked up in
+    both. Every ``window`` seconds the older generation is discarded, so
+    keys are remembered for between one and two windows; more than
+    ``capacity`` keys in a window rotate the generations sooner. Each
+    generation is sized for half of ``error_rate``, so the chance of a new key
+    being mistaken for a duplicate in either of them stays below it.
+
+    Duplicates within the window are never missed, but keys cannot be
+    forgotten: an event that failed to send is suppressed if it is retried
+    within the window. Use ``WindowedLRUFilter`` when failed events are
+    retried or replayed through the same client.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.001,
+        window: float = 600.0,
+    ):
+        """
+        Initialize the filter.
+
+        Args:
+            capacity: Number of keys per window the error rate holds for.
+            error_rate: Target false positive rate, between 0 and 1.
+            window: How long a key is remembered at least, in seconds.
+        """
+        if not 0.0 < error_rate < 1.0:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.window = window
+        # Optimal bit count and hash count for the capacity and the error
+        # rate of one generation; lookups check two
+        rate = error_rate / 2
+        self.bits = math.ceil(-capacity * math.log(rate) / math.log(2) ** 2)
+        self.hashes = max(1, round(self.bits / capacity * math.log(2)))
+        self._current = bytearray((self.bits + 7) // 8)
+        self._previous = bytearray(len(self._current))
+        self._count = 0
+        self._rotated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def memory(self) -> int:
+        """Memory used by the bit arrays, in bytes."""
+        return len(self._current) + len(self._previous)
+
+    def seen(self, key: str) -> bool:
+        positions = self._positions(key)
+        with self._lock:
+            now = time.monotonic()
+            if self._count >= self.capacity or now - self._rotated_at >= self.window:
+                self._previous = self._current
+                self._current = bytearray(len(self._previous))
+                self._count = 0
+                self._rotated_at = now
+
+            current = self._current
+            previous = self._previous
+            in_current = all(current[p >> 3] & (1 << (p & 7)) for p in positions)
+            if in_current:
+                return True
+            in_previous = all(previous[p >> 3] & (1 << (p & 7)) for p in positions)
+            for p in positions:
+                current[p >> 3] |= 1 << (p & 7)
+            self._count += 1
+            return in_previous
+
+    def forget(self, key: str) -> None:
+        # Bits are shared between keys, so clearing them could hide others
+        pass
+
+    def _positions(self, key: str) -> Tuple[int, ...]:
+        """Bit positions of a key, by double hashing one 128-bit digest."""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        bits = self.bits
+        return tuple((h1 + i * h2) % bits for i in range(self.hashes))
+
+
+class Deduplicator(EventProcessor):
+    """
+    Suppresses events that were already sent, so retries, replays and
+    at-least-once pipelines don't double-count usage or double-bill.
+
+    Pass it to ``TeerClient(dedup=...)``; it then runs before any other
+    event processor and also checks meter events. Ingest events are keyed on
+    their ``span_id`` or, failing that, their ``idempotency_key``. Meter
+    events are keyed on their ``fields.identifier``. Events without any of
+    these are never suppressed: two distinct LLM calls can have identical
+    contents, so events are never compared by content.
+
+    Keys are recorded when an event is sent or buffered, so a duplicate
+    arriving while the original is in flight is suppressed too. Keys of
+    events that are not delivered are forgotten so the event can be retried:
+    a failed synchronous send, an event dropped because the buffer was full,
+    and a buffered batch that failed or was rejected. Buffered ingest events
+    a ``DeliveryTracker`` resends keep their keys. ``BloomFilter`` cannot
+    forget keys, so with it retries within the window are suppressed.
+    """
+
+    def __init__(
+        self, filter: Optional[DedupFilter] = None, metrics: Optional[Metrics] = None
+    ):
+        """
+        Initialize the deduplicator.
+
+        Args:
+            filter: The set of recently seen keys. Defaults to a
+                    ``WindowedLRUFilter`` with its default window and size.
+            metrics: Metrics registry to count suppressed duplicates into.
+                     Defaults to the client's.
+        """
+        self.filter = filter if filter is not None else WindowedLRUFilter()
+        self.metrics = metrics
+
+    def process(self, event: IngestPayload) -> Optional[IngestPayload]:
+        key = self.key(event)
+        if key is None or not self._duplicate(key):
+            return event
+        logger.debug(f"Suppressed duplicate ingest event {key}")
+        return None
+
+    def key(self, event: IngestPayload) -> Optional[str]:
+        """
+        Get the deduplication key of an ingest event.
+
+        Args:
+            event: The ingest payload.
+
+        Returns:
+            The key, or None if the event cannot be deduplicated.
+        """
+        span_id = event.get("span_id")
+        if span_id:
+            return f"span:{span_id}"
+        idempotency_key = event.get("idempotency_key")
+        if idempotency_key:
+            return f"key:{idempotency_key}"
+        return None
+
+    def check_meter(self, identifier: Optional[str]) -> bool:
+        """
+        Record a meter event, reporting whether it is a duplicate.
+
+        Args:
+            identifier: The meter event's identifier.
+
+        Returns:
+            True if an event with the identifier was already seen.
+        """
+        if not identifier:
+            return False
+        if self._duplicate(f"meter:{identifier}"):
+            logger.debug(f"Suppressed duplicate meter event {identifier}")
+            return True
+        return False
+
+    def forget(self, event: IngestPayload) -> None:
+        """
+        Forget an ingest event that failed to send.
+
+        Args:
+            event: The ingest payload.
+        """
+        key = self.key(event)
+        if key is not None:
+            self.filter.forget(key)
+
+    def forget_all(self, events: Iterable[Any]) -> None:
+        """
+        Forget buffered ingest events that were not delivered.
+
+        Args:
+            events: Plain events or ``DefaultedEvent`` entries.
+        """
+        for event in events:
+            if isinstance(event, DefaultedEvent):
+                event = event.event
+            self.forget(event)
+
+    def forget_meter(self, identifier: Optional[str]) -> None:
+        """
+        Forget a meter event that failed to send.
+
+        Args:
+            identifier: The meter event's identifier.
+        """
+        if identifier:
+            self.filter.forget(f"meter:{identifier}")
+
+    def _duplicate(self, key: str) -> bool:
+        duplicate = self.filter.seen(key)
+        if duplicate and self.metrics is not None:
+            self.metrics.increment("dedup.suppressed")
+        return duplicate
@@ -0,0 +1,151 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+import json
+from typing import Any, Dict, Iterable, NamedTuple, Union
+
+from .types import IngestPayload
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"))
+
+
+def merge(defaults: Dict[str, Any], values: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Deep-merge two dicts into a new one.
+
+    Nested dicts are merged recursively; any other value in ``values``
+    replaces the default.
+
+    Args:
+        defaults: The default values.
+        values: The values that take precedence.
+
+    Returns:
+        The merged dict. Neither argument is modified.
+    """
+    merged = dict(defaults)
+    for key, value in values.items():
+        default = merged.get(key)
+        if isinstance(default, dict) and isinstance(value, dict):
+            value = merge(default, value)
+        merged[key] = value
+    return merged
+
+
+class PayloadDefaults:
+    """
+    Default fields merged into ingest payloads when they are encoded.
+
+    The defaults are encoded to JSON once, when the object is created.
+    Encoding an event then serializes only the event's own fields and
+    splices in the pre-encoded defaults, so the defaults' nested dicts are
+    never copied per call. Fields set on the event win; nested dicts such as
+    ``metadata`` are merged field by field.
+    """
+
+    __slots__ = ("values", "_fragments", "_all_fragments")
+
+    def __init__(self, values: Dict[str, Any]):
+        """
+        Initialize the defaults.
+
+        Args:
+            values: The default payload fields, e.g. ``provider``,
+                    ``platform``, ``billing`` or ``metadata``.
+        """
+        self.values = values
+        self._fragments = {
+            key: f"{_dumps(key)}:{_dumps(value)}" for key, value in values.items()
+        }
+        self._all_fragments = ",".join(self._fragments.values())
+
+    def __bool__(self) -> bool:
+        return bool(self.values)
+
+    def merged(self, values: Dict[str, Any]) -> "PayloadDefaults":
+        """
+        Layer more defaults on top of these.
+
+        Args:
+            values: The defaults that take precedence.
+
+        Returns:
+            New defaults combining both.
+        """
+        return PayloadDefaults(merge(self.values, values))
+
+    def apply(self, event: IngestPayload) -> IngestPayload:
+        """
+        Merge the defaults into an event eagerly.
+
+        Args:
+            event: The event. It is not modified.
+
+        Returns:
+            A new event with the defaults filled in.
+        """
+        return merge(self.values, event)  # type: ignore[arg-type, return-value]
+
+    def encode(self, event: IngestPayload) -> bytes:
+        """
+        Encode an event as JSON with the defaults merged in.
+
+        Args:
+            event: The event. It is not modified.
+
+        Returns:
+            The encoded event.
+        """
+        values = self.values
+        missing = self._all_fragments
+        if any(key in event for key in values):
+            own: Dict[str, Any] = dict(event)
+            fragments = []
+            for key, fragment in self._fragments.items():
+                if key not in own:
+                    fragments.append(fragment)
+                    continue
+                default, value = values[key], own[key]
+                if isinstance(default, dict) and isinstance(value, dict):
+                    own[key] = merge(default, value)
+            encoded = _dumps(own)
+            missing = ",".join(fragments)
+        else:
+            encoded = _dumps(event)
+
+        if not missing:
+            return encoded.encode("utf-8")
+        separator = "," if len(encoded) > 2 else ""
+        return f"{encoded[:-1]}{separator}{missing}}}".encode("utf-8")
+
+
+class DefaultedEvent(NamedTuple):
+    """An event buffered together with the defaults to encode it with."""
+
+    event: IngestPayload
+    defaults: PayloadDefaults
+
+
+def encode_batch(events: Iterable[Union[IngestPayload, DefaultedEvent]]) -> bytes:
+    """
+    Encode the body of a batch ingest request.
+
+    Args:
+        events: Plain events, or events paired with their defaults.
+
+    Returns:
+        The encoded ``{"events": [...]}`` body.
+    """
+    encoded = [
+        (
+            event.defaults.encode(event.event)
+            if isinstance(event, DefaultedEvent)
+            else _dumps(event).encode("utf-8")
+        )
+        for event in events
+    ]
+    return b'{"events":[' + b",".join(encoded) + b"]}"
+
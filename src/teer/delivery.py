@@ -0,0 +1,258 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+import itertools
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+from .defaults import DefaultedEvent
+
+if TYPE_CHECKING:
+    from . import TeerClient
+
+logger = logging.getLogger("teer")
+
+
+def sequence_of(event: Any) -> Optional[int]:
+    """Get the sequence number of a stamped event, if it has one."""
+    if isinstance(event, DefaultedEvent):
+        event = event.event
+    return event.get("sequence")
+
+
+class DeliveryTracker:
+    """
+    Exactly-once delivery of buffered events through producer sequences.
+
+    Pass it to ``TeerClient(delivery=...)``. The client then stamps every
+    ingest and meter event with the tracker's ``producer_id`` and a
+    monotonically increasing ``sequence``, so the server can discard an
+    event whose sequence it has already received from the producer.
+
+    Ingest events buffered with ``enqueue`` stay in a window of
+    unacknowledged sequences until the server acknowledges them. A response
+    acknowledges every sequence up to its ``acked_sequence`` field when it
+    has one, and otherwise every event in the request. Events still
+    unacknowledged after ``resend_after`` seconds, e.g. because their batch
+    failed, are buffered again with their original sequence. Events the
+    server rejects with a 4xx error other than 429 are not resent.
+
+    The window holds at most ``window`` events; beyond that the oldest are
+    given up on and counted in ``delivery.dropped``. Buffered meter events
+    keep their sequence across the meter lane's own retries, and
+    synchronous sends raise their errors to the caller instead of being
+    tracked.
+    """
+
+    def __init__(self, window: int = 10_000, resend_after: float = 30.0):
+        """
+        Initialize the tracker.
+
+        Args:
+            window: Maximum number of unacknowledged events kept.
+            resend_after: Seconds after which an unacknowledged event is
+                          resent.
+        """
+        self.window = window
+        self.resend_after = resend_after
+        self.producer_id = uuid.uuid4().hex
+        self.client: Optional["TeerClient"] = None
+        self._sequences = itertools.count(1)
+        # sequence -> (event, sent at), oldest sequence first
+        self._unacked: "OrderedDict[int, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._unacked)
+
+    def attach(self, client: "TeerClient") -> None:
+        """
+        Bind the tracker to the client whose events it tracks.
+
+        Args:
+            client: The client.
+        """
+        self.client = client
+
+    def stamp(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Give an event the producer ID and the next sequence number.
+
+        Events that already have a sequence, i.e. resends, keep it.
+
+        Args:
+            event: The ingest payload or meter event parameters.
+
+        Returns:
+            A stamped copy of the event.
+        """
+        if "sequence" in event:
+            return event
+        return {
+            **event,
+            "producer_id": self.producer_id,
+            "sequence": next(self._sequences),
+        }
+
+    def stamp_all(self, events: Sequence[Any]) -> List[Any]:
+        """
+        Stamp buffered events, keeping the defaults they were buffered with.
+
+        Args:
+            events: Plain events or ``DefaultedEvent`` entries.
+
+        Returns:
+            The stamped events.
+        """
+        stamped = []
+        for event in events:
+            if isinstance(event, DefaultedEvent):
+                event = DefaultedEvent(self.stamp(event.event), event.defaults)
+            else:
+                event = self.stamp(event)
+            stamped.append(event)
+        return stamped
+
+    def sent(self, events: Sequence[Any]) -> None:
+        """
+        Record stamped events as sent and awaiting acknowledgement.
+
+        Args:
+            events: The stamped events, resends included.
+        """
+        now = time.monotonic()
+        dropped = 0
+        with self._lock:
+            unacked = self._unacked
+            for event in events:
+                unacked[sequence_of(event)] = (event, now)  # type: ignore[index]
+            while len(unacked) > self.window:
+                unacked.popitem(last=False)
+                dropped += 1
+        if dropped:
+            self._metrics_increment("delivery.dropped", dropped)
+            logger.warning(
+                f"Gave up on {dropped} unacknowledged events: the delivery "
+                f"window of {self.window} is full"
+            )
+        if self._thread is None:
+            self._start()
+
+    def acknowledge(self, response: Any, events: Sequence[Any]) -> None:
+        """
+        Process the response to a request that delivered stamped events.
+
+        Args:
+            response: The parsed response body.
+            events: The stamped events the request carried.
+        """
+        acked_sequence = None
+        if isinstance(response, dict):
+            producer_id = response.get("producer_id", self.producer_id)
+            if producer_id == self.producer_id:
+                acked_sequence = response.get("acked_sequence")
+
+        acked = 0
+        with self._lock:
+            unacked = self._unacked
+            if acked_sequence is None:
+                for event in events:
+                    if unacked.pop(sequence_of(event), None) is not None:
+                        acked += 1
+            else:
+                # Batches can complete out of order, so check every sequence
+                for sequence in [s for s in unacked if s <= acked_sequence]:
+                    del unacked[sequence]
+                    acked += 1
+        if acked:
+            self._metrics_increment("delivery.acked", acked)
+
+    def failed(self, error: Exception, events: Sequence[Any]) -> None:
+        """
+        Process the failure of a request that carried stamped events.
+
+        Events the server rejected as invalid are not resent; everything
+        else stays in the window.
+
+        Args:
+            error: The request error.
+            events: The stamped events the request carried.
+        """
+        response = getattr(error, "response", None)
+        status_code = getattr(response, "status_code", None)
+        if status_code is None or not 400 <= status_code < 500 or status_code == 429:
+            return
+        with self._lock:
+            for event in events:
+                self._unacked.pop(sequence_of(event), None)  # type: ignore[arg-type]
+        self._metrics_increment("delivery.rejected", len(events))
+
+    def resend(self) -> int:
+        """
+        Resend events unacknowledged for longer than ``resend_after``.
+
+        Returns:
+            The number of events buffered for resending.
+        """
+        client = self.client
+        if client is None:
+            return 0
+        now = time.monotonic()
+        stale = now - self.resend_after
+        due = []
+        with self._lock:
+            unacked = self._unacked
+            for sequence, (event, sent_at) in unacked.items():
+                if sent_at <= stale:
+                    # Restart the clock so a slow sender does not get the
+                    # event buffered twice
+                    unacked[sequence] = (event, now)
+                    due.append(event)
+
+        sender = client.sender
+        for event in due:
+            # The event keeps its sequence, so the server drops it if the
+            # original did arrive after all.
+            sender.enqueue(event)
+        if due:
+            self._metrics_increment("delivery.resent", len(due))
+        return len(due)
+
+    def close(self) -> None:
+        """Stop resending in the background."""
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None or self._stop.is_set():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="teer-delivery", daemon=True
+            )
+        self._thread.start()
+
+    def _run(self) -> None:
+        interval = max(self.resend_after / 2, 0.01)
+        while not self._stop.wait(interval):
+            try:
+                self.resend()
+            except RuntimeError:
+                # The client's sender was closed
+                return
+            except Exception as e:
+                logger.error(f"Failed to resend unacknowledged events: {str(e)}")
+
+    def _metrics_increment(self, name: str, value: int) -> None:
+        if self.client is not None:
+            self.client.metrics.increment(name, value)
+
@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+import threading
+from collections import deque
+from typing import Deque, Optional
+
+from .metrics import Metrics
+
+
+class HedgingPolicy:
+    """
+    Decides when a slow request gets a duplicate ("hedge") sent alongside it.
+
+    The policy tracks the latency of recent hedged-eligible requests. When a
+    request has not completed after the configured percentile of that
+    latency, the HTTP client fires a duplicate with the same idempotency key
+    and returns whichever successful response arrives first.
+
+    Hedges are rate limited with a token bucket: each request earns
+    ``max_hedge_rate`` of a hedge, so over time at most that fraction of
+    requests is duplicated, with bursts of up to ``burst`` hedges.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        min_delay: float = 0.01,
+        max_delay: float = 1.0,
+        max_hedge_rate: float = 0.05,
+        burst: int = 10,
+        window: int = 512,
+        min_samples: int = 20,
+        metrics: Optional[Metrics] = None,
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            percentile: Latency percentile, from 0 to 100, after which a hedge
+                        is fired.
+            min_delay: Lower bound on the hedge delay, in seconds.
+            max_delay: Upper bound on the hedge delay, in seconds. Also used
+                       until ``min_samples`` latencies have been observed.
+            max_hedge_rate: Maximum long-run fraction of requests hedged.
+            burst: Maximum number of hedges that can be fired back to back.
+            window: Number of recent latencies the percentile is computed over.
+            min_samples: Latencies needed before the percentile is trusted.
+            metrics: Metrics registry to publish the hedge delay to. The
+                     client sets this to its own registry when left as None.
+        """
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.max_hedge_rate = max_hedge_rate
+        self.burst = burst
+        self.min_samples = min_samples
+        self.metrics = metrics
+
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._delay = max_delay
+        self._since_refresh = 0
+        self._credit = float(burst)
+        self._lock = threading.Lock()
+
+    def delay(self) -> float:
+        """
+        Get how long to wait for a response before hedging, in seconds.
+
+        Returns:
+            The hedge delay.
+        """
+        return self._delay
+
+    def record(self, latency: float) -> None:
+        """
+        Record the latency of a completed request.
+
+        Args:
+            latency: Time until the first response arrived, in seconds.
+        """
+        with self._lock:
+            self._latencies.append(latency)
+            self._since_refresh += 1
+            # Re-sorting the window on every request is wasteful; the
+            # percentile moves slowly, so refresh it periodically.
+            if self._since_refresh < 32 and len(self._latencies) > self.min_samples:
+                return
+            self._since_refresh = 0
+            if len(self._latencies) < self.min_samples:
+                return
+            ordered = sorted(self._latencies)
+            index = min(int(len(ordered) * self.percentile / 100), len(ordered) - 1)
+            self._delay = min(max(ordered[index], self.min_delay), self.max_delay)
+        if self.metrics is not None:
+            self.metrics.set_gauge("hedging.delay", self._delay)
+
+    def admit(self) -> None:
+        """Credit the hedge budget for a new request."""
+        with self._lock:
+            self._credit = min(self._credit + self.max_hedge_rate, float(self.burst))
+
+    def try_hedge(self) -> bool:
+        """
+        Spend one hedge from the budget.
+
+        Returns:
+            True if a hedge may be fired, False if the budget is exhausted.
+        """
+        with self._lock:
+            if self._credit < 1.0:
+                return False
+            self._credit -= 1.0
+            return True
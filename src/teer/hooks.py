@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+from typing import Dict, Any, Optional
+
+
+class RequestContext:
+    """A single request travelling through the HTTP client's hook chain."""
+
+    __slots__ = (
+        "method",
+        "url",
+        "params",
+        "json",
+        "body",
+        "headers",
+        "timeout",
+        "extensions",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = 10,
+    ):
+        """
+        Initialize the request context.
+
+        Args:
+            method: The HTTP method to use (GET, POST, etc.).
+            url: The fully qualified request URL.
+            params: Query parameters for the request.
+            json: JSON-serializable request body.
+            headers: Request headers, including authorization.
+            timeout: Request timeout in seconds.
+        """
+        self.method = method
+        self.url = url
+        self.params = params
+        self.json = json
+        # Pre-encoded request body. When set it is sent instead of ``json``,
+        # which lets hooks such as compression rewrite the body in place.
+        self.body: Optional[bytes] = None
+        self.headers = headers if headers is not None else {}
+        self.timeout = timeout
+        # Scratch space for hooks to share state between lifecycle stages.
+        self.extensions: Dict[str, Any] = {}
+
+    def __repr__(self) -> str:
+        return f"<RequestContext {self.method} {self.url}>"
+
+
+class Hook:
+    """
+    Base class for request lifecycle hooks.
+
+    Hooks registered on an ``HttpClient`` form an ordered chain. ``before_send``
+    runs in registration order; ``after_response`` and ``on_error`` run in
+    reverse order so that each hook wraps the ones registered after it.
+    Subclasses only need to override the stages they care about.
+    """
+
+    def before_send(self, request: RequestContext) -> None:
+        """
+        Called before the request is sent. May mutate the request.
+
+        Args:
+            request: The outgoing request.
+        """
+
+    def after_response(self, request: RequestContext, response: Any) -> None:
+        """
+        Called after a successful (2xx/3xx) response is received.
+
+        Args:
+            request: The request that was sent.
+            response: The response object returned by the transport.
+        """
+
+    def on_error(self, request: RequestContext, error: Exception) -> None:
+        """
+        Called when the request fails, including non-2xx responses.
+
+        Args:
+            request: The request that was sent.
+            error: The exception raised while sending the request.
+        """
@@ -4,24 +4,132 @@
 
 import requests
 import logging
-from typing import Dict, Any, Optional, Union
+import random
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from .cache import ResponseCache
+from .concurrency import THROTTLE_STATUS_CODES, parse_retry_after
+from .hedging import HedgingPolicy
+from .hooks import Hook, RequestContext
+from .metrics import Metrics
+from .singleflight import SingleFlight
+from .transports import HTTPTransport, ResponseLike, Transport
 
 logger = logging.getLogger("teer")
 
+# Threads available to hedged requests; beyond this they are sent unhedged
+HEDGE_WORKERS = 32
+
+
 class HttpClient:
-    """HTTP client for making requests to the Teer API."""
-    
-    def __init__(self, api_key: str, base_url: str):
+    """
+    HTTP client for making requests to the Teer API.
+
+    This is the single client used by every resource. It builds the
+    authorization headers, runs the registered lifecycle hooks around each
+    request and hands the prepared request to its transport, which defaults
+    to pooled HTTP.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        hooks: Optional[Iterable[Hook]] = None,
+        session: Optional[requests.Session] = None,
+        max_retries: int = 2,
+        max_retry_delay: float = 60.0,
+        metrics: Optional[Metrics] = None,
+        pool_maxsize: int = 10,
+        cache: Optional[ResponseCache] = None,
+        transport: Optional[Transport] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        coalesce: bool = True,
+    ):
         """
         Initialize the HTTP client.
-        
+
         Args:
             api_key: The Teer API key.
             base_url: The base URL for the Teer API.
+            hooks: Optional lifecycle hooks, run in the given order.
+            session: Optional ``requests.Session`` to use for connection pooling.
+                     Ignored when a transport is provided.
+            max_retries: How many times to retry a request the server throttled
+                        (429/503). Defaults to 2.
+            max_retry_delay: Upper bound in seconds on how long to wait before
+                            a retry, whatever ``Retry-After`` asks for.
+            metrics: Metrics registry to record retries into.
+            pool_maxsize: Maximum number of pooled connections kept per host.
+                         Ignored when a session or transport is provided.
+            cache: Optional cache of GET responses, revalidated with ETag and
+                   Last-Modified.
+            transport: Optional transport that delivers requests. Defaults to
+                       an ``HTTPTransport``.
+            hedging: Optional policy for duplicating slow requests sent with
+                     ``hedge=True``.
+            coalesce: Whether concurrent identical GET requests share one
+                      request to the server and its parsed result.
         """
         self.api_key = api_key
         self.base_url = base_url
-    
+        if transport is None:
+            transport = HTTPTransport(session, pool_maxsize=pool_maxsize)
+        self.transport = transport
+        self.max_retries = max_retries
+        self.max_retry_delay = max_retry_delay
+        self.metrics = metrics or Metrics()
+        self.cache = cache
+        self.hedging = hedging
+        if hedging is not None and hedging.metrics is None:
+            hedging.metrics = self.metrics
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self._hedge_lock = threading.Lock()
+        self._hedge_busy = 0
+        self._reads: Optional[SingleFlight] = SingleFlight() if coalesce else None
+        self._hooks: List[Hook] = list(hooks or ())
+        self._default_headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        }
+
+    @property
+    def session(self) -> Optional[requests.Session]:
+        """The session of the HTTP transport, or None for other transports."""
+        return getattr(self.transport, "session", None)
+
+    @session.setter
+    def session(self, session: requests.Session) -> None:
+        self.transport = HTTPTransport(session)
+
+    @property
+    def hooks(self) -> List[Hook]:
+        """The registered lifecycle hooks, in execution order."""
+        return list(self._hooks)
+
+    def add_hook(self, hook: Hook) -> None:
+        """
+        Register a lifecycle hook at the end of the chain.
+
+        Args:
+            hook: The hook to register.
+        """
+        # Replace rather than mutate so in-flight requests keep a stable chain.
+        self._hooks = self._hooks + [hook]
+
+    def remove_hook(self, hook: Hook) -> None:
+        """
+        Unregister a previously registered lifecycle hook.
+
+        Args:
+            hook: The hook to remove.
+        """
+        self._hooks = [h for h in self._hooks if h is not hook]
+
     def request(
         self,
         method: str,
@@ -29,11 +137,11 @@ class HttpClient:
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
-        timeout: int = 10
+        timeout: Optional[float] = 10,
     ) -> Dict[str, Any]:
         """
         Make a request to the Teer API.
-        
+
         Args:
             method: The HTTP method to use (GET, POST, etc.).
             path: The path to append to the base URL.
@@ -41,48 +149,291 @@ class HttpClient:
             data: JSON data for the request body.
             headers: Additional headers to include in the request.
             timeout: Request timeout in seconds.
-            
+
+        Returns:
+            The response from the Teer API.
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails.
+        """
+        url = f"{self.base_url}/{path}".rstrip("/")
+        return self.send(
+            method, url, params=params, data=data, headers=headers, timeout=timeout
+        )
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = 10,
+        body: Optional[bytes] = None,
+        hedge: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Send a request to a fully qualified URL through the hook chain.
+
+        Requests the server throttles (429/503) are retried up to
+        ``max_retries`` times, honoring the ``Retry-After`` header.
+
+        With ``hedge=True`` and a hedging policy configured, a request that
+        is slower than the policy's latency percentile is duplicated with the
+        same ``Idempotency-Key`` header and the first response wins. Only use
+        it for requests the server deduplicates.
+
+        Args:
+            method: The HTTP method to use (GET, POST, etc.).
+            url: The fully qualified request URL.
+            params: Query parameters for the request.
+            data: JSON data for the request body.
+            headers: Additional headers to include in the request.
+            timeout: Request timeout in seconds.
+            body: Pre-encoded JSON request body, sent instead of ``data``.
+            hedge: Whether the request may be hedged.
+
         Returns:
             The response from the Teer API.
-            
+
         Raises:
             requests.exceptions.RequestException: If the request fails.
         """
-        url = f"{self.base_url}/{path}".rstrip('/')
-        
         # Ensure we always have the Authorization and Content-Type headers
-        request_headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-        
+        request_headers = dict(self._default_headers)
+
         # Add any additional headers
         if headers:
             request_headers.update(headers)
-        
-        try:
-            logger.debug(f"Making {method} request to {url}")
-            if data:
-                logger.debug(f"Request data: {data}")
-            
-            response = requests.request(
-                method=method,
-                url=url,
-                params=params,
-                json=data,
-                headers=request_headers,
-                timeout=timeout
+
+        if method.upper() != "GET":
+            if hedge and self.hedging is not None:
+                response = self._send_hedged(
+                    method, url, params, data, request_headers, timeout, body
+                )
+            else:
+                response = self._send_with_retries(
+                    method, url, params, data, request_headers, timeout, body
+                )
+            return self._parse(response)
+
+        reads = self._reads
+        if reads is None:
+            return self._get(url, params, data, request_headers, timeout, body)
+
+        # Concurrent identical reads, e.g. many threads missing the cache for
+        # the same rate card, share a single request and its parsed result.
+        key = ResponseCache.key(url, params, request_headers.get("Authorization"))
+        key += tuple(sorted(request_headers.items()))
+        result, shared = reads.do(
+            key,
+            lambda: self._get(url, params, data, request_headers, timeout, body),
+        )
+        if shared:
+            self.metrics.increment("http.coalesced")
+        return result
+
+    def _get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[Any],
+        headers: Dict[str, str],
+        timeout: Optional[float],
+        body: Optional[bytes],
+    ) -> Dict[str, Any]:
+        """Send a GET request, answering it from the cache when possible."""
+        cache = self.cache
+        if cache is None:
+            response = self._send_with_retries(
+                "GET", url, params, data, headers, timeout, body
             )
-            response.raise_for_status()
-            
-            # Try to parse the response as JSON
+            return self._parse(response)
+
+        key = cache.key(url, params, headers.get("Authorization"))
+        entry = cache.get(key)
+        if entry is not None:
+            if cache.is_fresh(entry):
+                self.metrics.increment("cache.hits")
+                return entry.body
+            headers = {**headers, **entry.validators()}
+
+        response = self._send_with_retries(
+            "GET", url, params, data, headers, timeout, body
+        )
+        if response.status_code == 304 and entry is not None:
+            # Unchanged on the server: reuse the body we already parsed
+            cache.revalidated(entry)
+            self.metrics.increment("cache.revalidated")
+            return entry.body
+
+        result = self._parse(response)
+        cache.store(key, response, result)
+        self.metrics.increment("cache.misses")
+        return result
+
+    def _send_with_retries(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[Any],
+        headers: Dict[str, str],
+        timeout: Optional[float],
+        body: Optional[bytes],
+    ) -> ResponseLike:
+        """Send a request, retrying it while the server throttles it."""
+        attempt = 0
+        while True:
+            request = RequestContext(method, url, params, data, dict(headers), timeout)
+            request.body = body
             try:
-                return response.json()
-            except ValueError:
-                # If the response is not JSON, return the text
-                return {"text": response.text}
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error making request to {url}: {str(e)}")
+                return self._send_once(request)
+            except requests.exceptions.HTTPError as e:
+                response = e.response
+                status_code = getattr(response, "status_code", None)
+                if (
+                    attempt >= self.max_retries
+                    or status_code not in THROTTLE_STATUS_CODES
+                ):
+                    raise
+                delay = parse_retry_after(response)
+                if delay is None:
+                    # Exponential backoff with jitter when the server gives no hint.
+                    delay = 0.5 * (2**attempt) * (1 + random.random())
+                delay = min(delay, self.max_retry_delay)
+                attempt += 1
+                self.metrics.increment("http.retries")
+                logger.debug(
+                    f"Retrying {method} {url} in {delay:.2f}s after {status_code} "
+                    f"(attempt {attempt} of {self.max_retries})"
+                )
+                time.sleep(delay)
+
+    def _send_hedged(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[Any],
+        headers: Dict[str, str],
+        timeout: Optional[float],
+        body: Optional[bytes],
+    ) -> ResponseLike:
+        """
+        Send a request, firing a duplicate if it is slow to respond.
+
+        Both attempts run on hedge threads while the caller waits for the
+        first successful response. When every hedge thread is busy, the
+        request is sent unhedged on the calling thread instead, so hedging
+        never limits how many requests are in flight.
+        """
+        policy = self.hedging
+        assert policy is not None
+        # Both attempts carry the same key so the server keeps only one
+        headers.setdefault("Idempotency-Key", uuid.uuid4().hex)
+        args = (method, url, params, data, headers, timeout, body)
+
+        policy.admit()
+        self.metrics.increment("hedging.requests")
+        started = time.monotonic()
+        original = self._submit_attempt(args)
+        if original is None:
+            # Hedging now would only add load to a saturated client
+            self.metrics.increment("hedging.skipped")
+            response = self._send_with_retries(*args)
+            policy.record(time.monotonic() - started)
+            return response
+
+        done, pending = wait([original], timeout=policy.delay())
+        if not done:
+            if not policy.try_hedge():
+                self.metrics.increment("hedging.budget_exhausted")
+            else:
+                hedge = self._submit_attempt(args)
+                if hedge is None:
+                    self.metrics.increment("hedging.skipped")
+                else:
+                    self.metrics.increment("hedging.fired")
+                    logger.debug(f"Hedging {method} {url}")
+                    pending.add(hedge)
+
+        while True:
+            for future in done:
+                if future.exception() is not None:
+                    continue
+                policy.record(time.monotonic() - started)
+                if future is not original:
+                    self.metrics.increment("hedging.won")
+                return future.result()
+            if not pending:
+                # Every attempt failed; surface the original's error
+                return original.result()
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+    def _submit_attempt(self, args: Tuple[Any, ...]) -> Optional[Future]:
+        """Send an attempt on a free hedge thread, or return None if all are busy."""
+        with self._hedge_lock:
+            if self._hedge_busy >= HEDGE_WORKERS:
+                return None
+            self._hedge_busy += 1
+        return self._get_hedge_executor().submit(self._attempt, args)
+
+    def _attempt(self, args: Tuple[Any, ...]) -> ResponseLike:
+        try:
+            return self._send_with_retries(*args)
+        finally:
+            with self._hedge_lock:
+                self._hedge_busy -= 1
+
+    def _get_hedge_executor(self) -> ThreadPoolExecutor:
+        if self._hedge_executor is None:
+            with self._hedge_lock:
+                if self._hedge_executor is None:
+                    self._hedge_executor = ThreadPoolExecutor(
+                        max_workers=HEDGE_WORKERS, thread_name_prefix="teer-hedge"
+                    )
+        return self._hedge_executor
+
+    def _send_once(self, request: RequestContext) -> ResponseLike:
+        """Send a single attempt of a request through the hook chain."""
+        # Snapshot the chain; the common no-hook case skips all dispatch.
+        hooks = self._hooks
+        # Hooks whose before_send ran, and so must see the outcome, e.g. to
+        # release a concurrency slot even if a later hook raises.
+        entered = 0
+        try:
+            if hooks:
+                for hook in hooks:
+                    hook.before_send(request)
+                    entered += 1
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Making {request.method} request to {request.url}")
+                if request.json:
+                    logger.debug(f"Request data: {request.json}")
+
+            response = self.transport.send(request)
+            response.raise_for_status()
+        except Exception as e:
+            logger.error(f"Error making request to {request.url}: {str(e)}")
+            for hook in reversed(hooks[:entered]):
+                hook.on_error(request, e)
             # Re-raise the exception for the caller to handle
             raise
+
+        if hooks:
+            for hook in reversed(hooks):
+                hook.after_response(request, response)
+
+        return response
+
+    @staticmethod
+    def _parse(response: ResponseLike) -> Dict[str, Any]:
+        """Parse a response body as JSON, falling back to its text."""
+        # Try to parse the response as JSON
+        try:
+            return response.json()
+        except ValueError:
+            # If the response is not JSON, return the text
+            return {"text": response.text}
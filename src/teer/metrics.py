@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+import threading
+from typing import Dict, Union
+
+Number = Union[int, float]
+
+
+class Metrics:
+    """
+    Thread-safe in-process counters and gauges.
+
+    Every ``TeerClient`` owns one instance, exposed as ``client.metrics``.
+    Components of the SDK record into it using dotted names such as
+    ``concurrency.limit`` or ``http.retries``.
+    """
+
+    def __init__(self):
+        """Initialize an empty metrics registry."""
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Number] = {}
+        self._gauges: Dict[str, Number] = {}
+
+    def increment(self, name: str, value: Number = 1) -> None:
+        """
+        Increment a counter.
+
+        Args:
+            name: The counter name.
+            value: The amount to add. Defaults to 1.
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: Number) -> None:
+        """
+        Set a gauge to the given value.
+
+        Args:
+            name: The gauge name.
+            value: The current value.
+        """
+        # A single dict store is atomic; gauges do not need the lock.
+        self._gauges[name] = value
+
+    def get(self, name: str, default: Number = 0) -> Number:
+        """
+        Get the current value of a counter or gauge.
+
+        Args:
+            name: The counter or gauge name.
+            default: Value returned when nothing has been recorded yet.
+
+        Returns:
+            The recorded value.
+        """
+        if name in self._gauges:
+            return self._gauges[name]
+        return self._counters.get(name, default)
+
+    def snapshot(self) -> Dict[str, Number]:
+        """
+        Get a point-in-time copy of all counters and gauges.
+
+        Returns:
+            A dictionary mapping metric names to values.
+        """
+        with self._lock:
+            result = dict(self._counters)
+        result.update(self._gauges)
+        return result
@@ -0,0 +1,161 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+from typing import Any, Callable, Iterable, Iterator, Optional, TYPE_CHECKING
+
+from .scope import UsageScope, _current
+
+if TYPE_CHECKING:
+    from . import TeerClient
+
+REQUEST_ID_HEADER = "X-Request-ID"
+SESSION_ID_HEADER = "X-Session-ID"
+
+
+class TeerASGIMiddleware:
+    """
+    ASGI middleware collecting the usage of each HTTP request.
+
+    Each request runs in a ``teer.scope.usage_scope``, so its reports are
+    buffered together once the response has been sent. The request ID is
+    read from the ``X-Request-ID`` header, or generated, and the session ID
+    from the ``X-Session-ID`` header unless ``session_id`` derives it:
+
+        app.add_middleware(TeerASGIMiddleware, client=client)
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        client: "TeerClient",
+        request_id_header: str = REQUEST_ID_HEADER,
+        session_id_header: str = SESSION_ID_HEADER,
+        session_id: Optional[Callable[[dict], Optional[str]]] = None,
+    ):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The ASGI application to wrap.
+            client: The client whose usage is collected.
+            request_id_header: Header holding the request ID.
+            session_id_header: Header holding the session ID.
+            session_id: Optional callable returning the session ID for an
+                        ASGI connection scope. Overrides the header.
+        """
+        self.app = app
+        self.client = client
+        self._request_id_header = request_id_header.lower().encode("latin-1")
+        self._session_id_header = session_id_header.lower().encode("latin-1")
+        self._session_id = session_id
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or ())
+        request_id = headers.get(self._request_id_header)
+        if self._session_id is not None:
+            session_id = self._session_id(scope)
+        else:
+            session_id = _decode(headers.get(self._session_id_header))
+
+        usage = UsageScope(self.client, _decode(request_id), session_id)
+        token = _current.set(usage)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current.reset(token)
+            usage.submit()
+
+
+class TeerWSGIMiddleware:
+    """
+    WSGI middleware collecting the usage of each HTTP request.
+
+    The WSGI counterpart of ``TeerASGIMiddleware``, e.g. for Flask:
+
+        app.wsgi_app = TeerWSGIMiddleware(app.wsgi_app, client)
+    """
+
+    def __init__(
+        self,
+        app: Callable[..., Iterable[bytes]],
+        client: "TeerClient",
+        request_id_header: str = REQUEST_ID_HEADER,
+        session_id_header: str = SESSION_ID_HEADER,
+        session_id: Optional[Callable[[dict], Optional[str]]] = None,
+    ):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The WSGI application to wrap.
+            client: The client whose usage is collected.
+            request_id_header: Header holding the request ID.
+            session_id_header: Header holding the session ID.
+            session_id: Optional callable returning the session ID for a WSGI
+                        environ. Overrides the header.
+        """
+        self.app = app
+        self.client = client
+        self._request_id_key = _environ_key(request_id_header)
+        self._session_id_key = _environ_key(session_id_header)
+        self._session_id = session_id
+
+    def __call__(
+        self, environ: dict, start_response: Callable[..., Any]
+    ) -> Iterable[bytes]:
+        if self._session_id is not None:
+            session_id = self._session_id(environ)
+        else:
+            session_id = environ.get(self._session_id_key)
+
+        usage = UsageScope(
+            self.client, environ.get(self._request_id_key), session_id
+        )
+        token = _current.set(usage)
+        try:
+            result = self.app(environ, start_response)
+        except BaseException:
+            _current.reset(token)
+            usage.submit()
+            raise
+        # Streamed bodies may still make LLM calls, so the scope stays open
+        # until the server closes the response.
+        return _ClosingIterable(result, usage, token)
+
+
+class _ClosingIterable:
+    """A WSGI response that submits the request's usage when closed."""
+
+    def __init__(self, result: Iterable[bytes], usage: UsageScope, token: Any):
+        self._result = result
+        self._usage = usage
+        self._token = token
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self._result)
+
+    def close(self) -> None:
+        try:
+            close = getattr(self._result, "close", None)
+            if close is not None:
+                close()
+        finally:
+            try:
+                _current.reset(self._token)
+            except ValueError:
+                # Closed from a different context than the one it was opened in
+                pass
+            self._usage.submit()
+
+
+def _decode(value: Optional[bytes]) -> Optional[str]:
+    return value.decode("latin-1") if value else None
+
+
+def _environ_key(header: str) -> str:
+    return "HTTP_" + header.upper().replace("-", "_")
@@ -0,0 +1,222 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+import logging
+from typing import Any, List, Mapping, Optional, Sequence, TYPE_CHECKING
+
+try:
+    from opentelemetry.sdk.trace import ReadableSpan
+    from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+except ImportError as e:  # no cov
+    raise ImportError(
+        "teer.otel requires the OpenTelemetry SDK. "
+        "Install it with `pip install teer[otel]`."
+    ) from e
+
+from .types import IngestPayload, MetadataObject, UsageObject
+
+if TYPE_CHECKING:
+    from . import TeerClient
+
+logger = logging.getLogger("teer")
+
+# gen_ai.system / gen_ai.provider.name values mapped to Teer providers
+PROVIDER_ALIASES = {
+    "anthropic": "anthropic",
+    "openai": "openai",
+    "azure.ai.openai": "openai",
+    "az.ai.openai": "openai",
+    "google": "google",
+    "gemini": "google",
+    "vertex_ai": "google",
+    "gcp.gemini": "google",
+    "gcp.vertex_ai": "google",
+    "gcp.gen_ai": "google",
+}
+
+# Token usage attributes, newest semantic convention names first
+INPUT_TOKEN_ATTRIBUTES = ("gen_ai.usage.input_tokens", "gen_ai.usage.prompt_tokens")
+OUTPUT_TOKEN_ATTRIBUTES = (
+    "gen_ai.usage.output_tokens",
+    "gen_ai.usage.completion_tokens",
+)
+CACHE_READ_ATTRIBUTES = (
+    "gen_ai.usage.cache_read.input_tokens",
+    "gen_ai.usage.cache_read_input_tokens",
+)
+CACHE_CREATION_ATTRIBUTES = (
+    "gen_ai.usage.cache_creation.input_tokens",
+    "gen_ai.usage.cache_creation_input_tokens",
+)
+REASONING_ATTRIBUTES = ("gen_ai.usage.reasoning.output_tokens",)
+
+# Span attributes mapped onto metadata fields
+METADATA_ATTRIBUTES = {
+    "user.id": "user_id",
+    "session.id": "session_id",
+}
+METADATA_PREFIX = "teer.metadata."
+FUNCTION_ID_ATTRIBUTE = "teer.function_id"
+RATE_CARD_ATTRIBUTE = "teer.rate_card_id"
+
+
+def _first(attributes: Mapping[str, Any], names: Sequence[str]) -> Optional[Any]:
+    for name in names:
+        value = attributes.get(name)
+        if value is not None:
+            return value
+    return None
+
+
+def span_to_payload(span: ReadableSpan) -> Optional[IngestPayload]:
+    """
+    Convert a GenAI span into an ingest payload.
+
+    Args:
+        span: A finished OpenTelemetry span.
+
+    Returns:
+        The ingest payload, or None if the span carries no token usage or
+        comes from a provider Teer does not support.
+    """
+    attributes = span.attributes or {}
+    input_tokens = _first(attributes, INPUT_TOKEN_ATTRIBUTES)
+    output_tokens = _first(attributes, OUTPUT_TOKEN_ATTRIBUTES)
+    if input_tokens is None and output_tokens is None:
+        return None
+
+    system = _first(attributes, ("gen_ai.provider.name", "gen_ai.system"))
+    provider = PROVIDER_ALIASES.get(str(system).lower()) if system else None
+    if provider is None:
+        logger.debug(
+            f"Skipping span {span.name!r} from unsupported provider {system!r}"
+        )
+        return None
+
+    model = _first(attributes, ("gen_ai.response.model", "gen_ai.request.model"))
+    usage: UsageObject = {
+        "input": int(input_tokens or 0),
+        "output": int(output_tokens or 0),
+    }
+
+    cache_read = _first(attributes, CACHE_READ_ATTRIBUTES)
+    cache_creation = _first(attributes, CACHE_CREATION_ATTRIBUTES)
+    if provider == "anthropic" and (
+        cache_read is not None or cache_creation is not None
+    ):
+        anthropic = {}
+        if cache_creation is not None:
+            anthropic["cache_creation_input_tokens"] = int(cache_creation)
+        if cache_read is not None:
+            anthropic["cache_read_input_tokens"] = int(cache_read)
+        usage["cache"] = {"anthropic": anthropic}
+    elif provider == "openai" and cache_read is not None:
+        usage["cache"] = {"openai": {"input_cached_tokens": int(cache_read)}}
+    elif provider == "google":
+        google = {}
+        if cache_read is not None:
+            google["cached_content_token_count"] = int(cache_read)
+        reasoning = _first(attributes, REASONING_ATTRIBUTES)
+        if reasoning is not None:
+            google["thoughts_token_count"] = int(reasoning)
+        if google:
+            usage["cache"] = {"google": google}
+
+    payload: IngestPayload = {
+        "provider": provider,
+        "model": str(model or "unknown"),
+        "usage": usage,
+    }
+
+    function_id = attributes.get(FUNCTION_ID_ATTRIBUTE)
+    if function_id:
+        payload["function_id"] = str(function_id)
+
+    context = span.get_span_context()
+    if context is not None and context.is_valid:
+        payload["trace_id"] = format(context.trace_id, "032x")
+        payload["span_id"] = format(context.span_id, "016x")
+    if span.parent is not None and span.parent.is_valid:
+        payload["parent_span_id"] = format(span.parent.span_id, "016x")
+
+    rate_card_id = attributes.get(RATE_CARD_ATTRIBUTE)
+    if rate_card_id:
+        payload["platform"] = {"rate_card_id": str(rate_card_id)}
+
+    metadata: MetadataObject = {}
+    for key, value in attributes.items():
+        if key in METADATA_ATTRIBUTES:
+            metadata[METADATA_ATTRIBUTES[key]] = str(value)  # type: ignore[literal-required]
+        elif key.startswith(METADATA_PREFIX):
+            metadata[key[len(METADATA_PREFIX) :]] = str(value)  # type: ignore[literal-required]
+    if metadata:
+        payload["metadata"] = metadata
+
+    return payload
+
+
+class TeerSpanExporter(SpanExporter):
+    """
+    OpenTelemetry span exporter that sends GenAI spans to Teer.
+
+    Spans without token usage attributes are ignored, so the exporter can sit
+    alongside other exporters on a tracer provider that records every span.
+    Each export call is sent with ``ingest.send_batch``, so wrap the exporter
+    in OpenTelemetry's ``BatchSpanProcessor`` to send spans in bulk:
+
+        provider.add_span_processor(BatchSpanProcessor(TeerSpanExporter(client)))
+
+    Requires the ``otel`` extra: ``pip install teer[otel]``.
+    """
+
+    def __init__(self, client: "TeerClient", max_batch_size: int = 500):
+        """
+        Initialize the exporter.
+
+        Args:
+            client: The Teer client to send events with.
+            max_batch_size: Maximum number of events per ingest request.
+        """
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self._shutdown = False
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        """
+        Convert spans to ingest events and send them.
+
+        Args:
+            spans: The finished spans to export.
+
+        Returns:
+            SUCCESS if every batch was sent, FAILURE otherwise.
+        """
+        if self._shutdown:
+            return SpanExportResult.FAILURE
+
+        payloads: List[IngestPayload] = []
+        for span in spans:
+            payload = span_to_payload(span)
+            if payload is not None:
+                payloads.append(payload)
+
+        try:
+            for start in range(0, len(payloads), self.max_batch_size):
+                batch = payloads[start : start + self.max_batch_size]
+                self.client.ingest.send_batch(batch)
+        except Exception as e:
+            logger.error(f"Failed to export {len(payloads)} spans to Teer: {str(e)}")
+            return SpanExportResult.FAILURE
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        """Stop accepting spans."""
+        self._shutdown = True
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Spans are sent synchronously in ``export``, so there is nothing to flush."""
+        return True
+
+
+__all__ = ["TeerSpanExporter", "span_to_payload"]
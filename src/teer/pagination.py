@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+import queue
+import threading
+from typing import Any, Callable, Dict, Generic, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Fetches one page given the cursor returned with the previous page
+FetchPage = Callable[[Optional[str]], Dict[str, Any]]
+
+_END = object()
+
+
+class _Failure:
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class PageIterator(Generic[T]):
+    """
+    Lazy iterator over a cursor-paginated list endpoint.
+
+    Pages are only requested while the iterator is consumed. With
+    ``prefetch`` greater than zero a background thread fetches the next
+    pages while the current one is being processed, so network latency
+    overlaps with the caller's work. At most ``prefetch + 2`` pages are held
+    in memory at any time, however long the listing is.
+
+    Each page is expected to look like
+    ``{"data": [...], "has_more": true, "next_cursor": "..."}``.
+    """
+
+    def __init__(self, fetch_page: FetchPage, prefetch: int = 1):
+        """
+        Initialize the iterator.
+
+        Args:
+            fetch_page: Callable that fetches the page after a cursor
+                        (None for the first page).
+            prefetch: Number of pages to fetch ahead in the background.
+                      0 fetches each page only when it is needed.
+        """
+        self.fetch_page = fetch_page
+        self.prefetch = prefetch
+
+    def __iter__(self) -> Iterator[T]:
+        for page in self.pages():
+            yield from page.get("data", [])
+
+    def pages(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over whole pages instead of individual items.
+
+        Yields:
+            Each page as returned by the API.
+        """
+        if self.prefetch <= 0:
+            return self._sequential_pages()
+        return self._prefetched_pages()
+
+    def _sequential_pages(self) -> Iterator[Dict[str, Any]]:
+        cursor: Optional[str] = None
+        while True:
+            page = self.fetch_page(cursor)
+            yield page
+            cursor = self._next_cursor(page)
+            if cursor is None:
+                return
+
+    def _prefetched_pages(self) -> Iterator[Dict[str, Any]]:
+        pages: "queue.Queue[Any]" = queue.Queue(maxsize=self.prefetch)
+        stop = threading.Event()
+
+        def put(item: Any) -> bool:
+            # Give up if the consumer stopped iterating, so the thread exits.
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce() -> None:
+            try:
+                for page in self._sequential_pages():
+                    if not put(page):
+                        return
+                put(_END)
+            except BaseException as e:
+                put(_Failure(e))
+
+        thread = threading.Thread(target=produce, name="teer-prefetch", daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = pages.get()
+                if item is _END:
+                    return
+                if isinstance(item, _Failure):
+                    raise item.error
+                yield item
+        finally:
+            stop.set()
+
+    @staticmethod
+    def _next_cursor(page: Dict[str, Any]) -> Optional[str]:
+        if not page.get("has_more"):
+            return None
+        return page.get("next_cursor")
@@ -0,0 +1,312 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Set, Tuple, TYPE_CHECKING
+
+from .resources.rate_cards import ModelRate, RateCard
+from .singleflight import SingleFlight
+from .types import IngestPayload, UsageObject
+
+if TYPE_CHECKING:
+    import numpy
+    from . import TeerClient
+
+logger = logging.getLogger("teer")
+
+TOKENS_PER_PRICE_UNIT = 1_000_000
+
+# Column order of the token and rate matrices used by the vectorized path
+_COLUMNS = ("input", "output", "cache_read", "cache_write")
+
+
+def usage_tokens(provider: str, usage: UsageObject) -> Tuple[int, int, int, int]:
+    """
+    Split a usage object into billable token classes.
+
+    Providers report cached tokens differently: Anthropic's ``input`` excludes
+    cache reads and writes, while OpenAI and Google include cached tokens in
+    ``input``. Google's thinking tokens are billed as output.
+
+    Args:
+        provider: The LLM provider.
+        usage: The usage object of an ingest payload.
+
+    Returns:
+        A tuple of (uncached input, output, cache read, cache write) tokens.
+    """
+    input_tokens = usage.get("input", 0)
+    output_tokens = usage.get("output", 0)
+    cache = usage.get("cache") or {}
+
+    if provider == "anthropic":
+        anthropic = cache.get("anthropic") or {}
+        return (
+            input_tokens,
+            output_tokens,
+            anthropic.get("cache_read_input_tokens", 0),
+            anthropic.get("cache_creation_input_tokens", 0),
+        )
+    if provider == "openai":
+        cached = (cache.get("openai") or {}).get("input_cached_tokens", 0)
+        return max(input_tokens - cached, 0), output_tokens, cached, 0
+    if provider == "google":
+        google = cache.get("google") or {}
+        cached = google.get("cached_content_token_count", 0)
+        thoughts = google.get("thoughts_token_count", 0)
+        return max(input_tokens - cached, 0), output_tokens + thoughts, cached, 0
+    return input_tokens, output_tokens, 0, 0
+
+
+def _rate_vector(rate: ModelRate, batch: bool) -> Tuple[float, float, float, float]:
+    input_price = rate["input"]
+    prices = (
+        input_price,
+        rate["output"],
+        rate.get("cache_read", input_price),
+        rate.get("cache_write", input_price),
+    )
+    if batch:
+        factor = 1.0 - rate.get("batch_discount", 0.0)
+        prices = tuple(p * factor for p in prices)  # type: ignore[assignment]
+    return prices
+
+
+class CostEngine:
+    """
+    Computes the cost of LLM usage locally from cached rate cards.
+
+    Rate cards are fetched from the Teer API the first time they are needed
+    and cached for ``ttl`` seconds, so pricing an event never waits on the
+    network once its rate card is warm. Prices are per million tokens.
+    """
+
+    def __init__(
+        self,
+        client: "TeerClient",
+        ttl: float = 300.0,
+        default_rate_card_id: Optional[str] = None,
+    ):
+        """
+        Initialize the cost engine.
+
+        Args:
+            client: The Teer client used to fetch rate cards.
+            ttl: How long a fetched rate card is reused, in seconds.
+            default_rate_card_id: Rate card used for payloads that do not
+                                  reference one in ``platform.rate_card_id``.
+        """
+        self.client = client
+        self.ttl = ttl
+        self.default_rate_card_id = default_rate_card_id
+        self._cache: Dict[str, Tuple[float, RateCard]] = {}
+        self._lock = threading.Lock()
+        # One fetch per rate card at a time, without blocking other cards
+        self._fetches = SingleFlight()
+        self._refreshing: Set[str] = set()
+
+    def rate_card(self, rate_card_id: str) -> RateCard:
+        """
+        Get a rate card, fetching it if it is missing or expired.
+
+        Args:
+            rate_card_id: The ID of the rate card.
+
+        Returns:
+            The rate card.
+
+        Raises:
+            Exception: If the rate card has to be fetched and the request fails.
+        """
+        cached = self._cache.get(rate_card_id)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        card, _ = self._fetches.do(rate_card_id, lambda: self._fetch(rate_card_id))
+        return card
+
+    def cached_rate_card(self, rate_card_id: str) -> Optional[RateCard]:
+        """
+        Get a rate card without waiting on the network.
+
+        A missing or expired card is fetched in the background; until the
+        fetch completes, an expired card is still returned.
+
+        Args:
+            rate_card_id: The ID of the rate card.
+
+        Returns:
+            The rate card, or None if it has not been fetched yet.
+        """
+        cached = self._cache.get(rate_card_id)
+        if cached is None or cached[0] <= time.monotonic():
+            self.refresh(rate_card_id)
+        return cached[1] if cached is not None else None
+
+    def refresh(self, rate_card_id: str) -> None:
+        """
+        Fetch a rate card in a background thread, e.g. to warm the cache.
+
+        Args:
+            rate_card_id: The ID of the rate card.
+        """
+        with self._lock:
+            if rate_card_id in self._refreshing:
+                return
+            self._refreshing.add(rate_card_id)
+        threading.Thread(
+            target=self._refresh,
+            args=(rate_card_id,),
+            name="teer-rate-card",
+            daemon=True,
+        ).start()
+
+    def _refresh(self, rate_card_id: str) -> None:
+        try:
+            self._fetches.do(rate_card_id, lambda: self._fetch(rate_card_id))
+        except Exception as e:
+            logger.warning(f"Failed to fetch rate card {rate_card_id}: {str(e)}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(rate_card_id)
+
+    def _fetch(self, rate_card_id: str) -> RateCard:
+        # Another thread may have refreshed it while we checked
+        cached = self._cache.get(rate_card_id)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        card = self.client.rate_cards.retrieve(rate_card_id)
+        with self._lock:
+            self._cache[rate_card_id] = (time.monotonic() + self.ttl, card)
+        return card
+
+    def set_rate_card(self, card: RateCard) -> None:
+        """
+        Seed the cache with a rate card, e.g. for offline use or tests.
+
+        Args:
+            card: The rate card to cache.
+        """
+        with self._lock:
+            self._cache[card["id"]] = (time.monotonic() + self.ttl, card)
+
+    def invalidate(self, rate_card_id: Optional[str] = None) -> None:
+        """
+        Drop cached rate cards so they are fetched again on next use.
+
+        Args:
+            rate_card_id: The rate card to drop, or None to drop all of them.
+        """
+        with self._lock:
+            if rate_card_id is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(rate_card_id, None)
+
+    def cost(
+        self,
+        payload: IngestPayload,
+        rate_card_id: Optional[str] = None,
+        wait: bool = True,
+    ) -> Optional[float]:
+        """
+        Compute the cost of a single usage report.
+
+        Args:
+            payload: The usage report.
+            rate_card_id: Rate card to price with. Defaults to the payload's
+                          ``platform.rate_card_id``, then ``default_rate_card_id``.
+            wait: Whether to wait for a rate card that is not cached yet.
+                  If False, the card is fetched in the background instead.
+
+        Returns:
+            The cost in the rate card's currency, or None if no rate card
+            applies, the rate card has no price for the model, or ``wait``
+            is False and the rate card has not been fetched yet.
+        """
+        rate = self._model_rate(payload, rate_card_id, wait)
+        if rate is None:
+            return None
+        tokens = usage_tokens(payload["provider"], payload["usage"])
+        prices = _rate_vector(rate, bool(payload.get("batch")))
+        return sum(t * p for t, p in zip(tokens, prices)) / TOKENS_PER_PRICE_UNIT
+
+    def cost_batch(
+        self, payloads: Sequence[IngestPayload], rate_card_id: Optional[str] = None
+    ) -> "numpy.ndarray":
+        """
+        Compute the cost of many usage reports at once with NumPy.
+
+        Token counts are gathered into a matrix and priced with a single
+        vectorized multiply against the matching rate rows, which is much
+        faster than calling ``cost`` in a loop for large backfills.
+
+        Args:
+            payloads: The usage reports.
+            rate_card_id: Rate card to price with, overriding the payloads'.
+
+        Returns:
+            A float array of costs, with NaN where no price applies.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError(
+                "cost_batch requires NumPy. "
+                "Install it with `pip install teer[pricing]`."
+            ) from e
+
+        # The only per-payload Python work is reading each payload once: its
+        # token counts and the index of its (rate card, model, batch) row.
+        row_index: Dict[Tuple[Optional[str], str, bool], int] = {}
+        token_rows = []
+        row_indexes = []
+        for payload in payloads:
+            token_rows.append(usage_tokens(payload["provider"], payload["usage"]))
+            key = (
+                rate_card_id or self._rate_card_id(payload),
+                payload["model"],
+                bool(payload.get("batch")),
+            )
+            row_indexes.append(row_index.setdefault(key, len(row_index)))
+        tokens = np.array(token_rows, dtype=np.float64).reshape(-1, len(_COLUMNS))
+        indexes = np.array(row_indexes, dtype=np.intp)
+
+        # Rates are looked up once per distinct row, then applied in one
+        # vectorized multiply.
+        nan_row = (float("nan"),) * len(_COLUMNS)
+        rows: List[Tuple[float, ...]] = []
+        for card_id, model, batch in row_index:
+            rate = self._rate(card_id, model)
+            rows.append(nan_row if rate is None else _rate_vector(rate, batch))
+        rates = np.array(rows, dtype=np.float64).reshape(-1, len(_COLUMNS))
+        return np.einsum("ij,ij->i", tokens, rates[indexes]) / TOKENS_PER_PRICE_UNIT
+
+    def _rate_card_id(self, payload: IngestPayload) -> Optional[str]:
+        platform = payload.get("platform")
+        if platform and platform.get("rate_card_id"):
+            return platform["rate_card_id"]
+        return self.default_rate_card_id
+
+    def _model_rate(
+        self, payload: IngestPayload, rate_card_id: Optional[str], wait: bool = True
+    ) -> Optional[ModelRate]:
+        card_id = rate_card_id or self._rate_card_id(payload)
+        return self._rate(card_id, payload["model"], wait)
+
+    def _rate(
+        self, rate_card_id: Optional[str], model: str, wait: bool = True
+    ) -> Optional[ModelRate]:
+        if rate_card_id is None:
+            return None
+        if wait:
+            card: Optional[RateCard] = self.rate_card(rate_card_id)
+        else:
+            card = self.cached_rate_card(rate_card_id)
+        return card["rates"].get(model) if card is not None else None
+
@@ -0,0 +1,121 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+import logging
+from typing import Iterable, List, Optional
+
+from .types import IngestPayload
+
+logger = logging.getLogger("teer")
+
+
+class EventProcessor:
+    """
+    Base class for processors that see every outgoing ingest event.
+
+    Processors run in registration order when an event is sent or enqueued,
+    before it is encoded. A processor may observe the event, modify it in
+    place, or drop it by returning None.
+    """
+
+    def process(self, event: IngestPayload) -> Optional[IngestPayload]:
+        """
+        Process an outgoing event.
+
+        Args:
+            event: The ingest payload about to be sent.
+
+        Returns:
+            The event to send, or None to drop it.
+        """
+        return event
+
+    def flush(self) -> None:
+        """
+        Hand any events the processor holds back to the client to send.
+
+        Called by ``client.flush`` and ``client.close`` before the sender is
+        flushed. Processors that hold events, e.g. to aggregate them, must
+        release them here so they are not lost when the process exits or is
+        frozen.
+        """
+
+
+class ProcessorChain:
+    """An ordered list of event processors."""
+
+    def __init__(self, processors: Optional[Iterable[EventProcessor]] = None):
+        """
+        Initialize the chain.
+
+        Args:
+            processors: Initial processors, run in the given order.
+        """
+        self._processors: List[EventProcessor] = list(processors or ())
+
+    def __bool__(self) -> bool:
+        return bool(self._processors)
+
+    def __iter__(self):
+        return iter(list(self._processors))
+
+    def add(self, processor: EventProcessor) -> None:
+        """
+        Append a processor to the end of the chain.
+
+        Args:
+            processor: The processor to add.
+        """
+        # Replace rather than mutate so concurrent runs keep a stable chain.
+        self._processors = self._processors + [processor]
+
+    def remove(self, processor: EventProcessor) -> None:
+        """
+        Remove a processor from the chain.
+
+        Args:
+            processor: The processor to remove.
+        """
+        self._processors = [p for p in self._processors if p is not processor]
+
+    def flush(self) -> None:
+        """Flush every processor, in chain order."""
+        for processor in self._processors:
+            try:
+                processor.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush {type(processor).__name__}: {str(e)}")
+
+    def run(self, event: IngestPayload) -> Optional[IngestPayload]:
+        """
+        Pass an event through every processor.
+
+        Args:
+            event: The event to process.
+
+        Returns:
+            The processed event, or None if a processor dropped it.
+        """
+        for processor in self._processors:
+            result = processor.process(event)
+            if result is None:
+                logger.debug(f"Event dropped by {type(processor).__name__}")
+                return None
+            event = result
+        return event
+
+    def run_all(self, events: Iterable[IngestPayload]) -> List[IngestPayload]:
+        """
+        Pass several events through the chain, discarding dropped ones.
+
+        Args:
+            events: The events to process.
+
+        Returns:
+            The events that were not dropped.
+        """
+        if not self._processors:
+            return list(events)
+        processed = (self.run(event) for event in events)
+        return [event for event in processed if event is not None]
@@ -0,0 +1,262 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+import logging
+import threading
+from typing import Any, Dict, Iterable, Literal, Optional, Tuple, TYPE_CHECKING
+
+from .pricing import usage_tokens
+from .processors import EventProcessor
+from .types import IngestPayload
+
+if TYPE_CHECKING:
+    from . import TeerClient
+
+logger = logging.getLogger("teer")
+
+# Metadata fields quotas can be keyed on
+QuotaField = Literal["organization_id", "team_id", "user_id"]
+QUOTA_FIELDS: Tuple[QuotaField, ...] = ("organization_id", "team_id", "user_id")
+
+# What a quota counts: total tokens, or cost priced with client.pricing
+QuotaMeasure = Literal["tokens", "cost"]
+
+
+class QuotaTracker(EventProcessor):
+    """
+    In-process budget tracker keyed on metadata attribution fields.
+
+    The tracker is an event processor: register it with
+    ``client.add_processor`` and it counts the usage of every outgoing ingest
+    event against the event's ``organization_id``, ``team_id`` and
+    ``user_id``. ``allowed`` then answers from local counters in constant
+    time, without a network round trip.
+
+    Usage is counted when an event is processed, before it is delivered,
+    so a burst of concurrent calls cannot overshoot a budget while their
+    events are in flight. Events that then fail to send or are dropped stay
+    counted until the next reconciliation. Local counters also miss usage
+    reported by other processes, so ``reconcile`` replaces them with the
+    server's figures, keeping any usage counted locally while the request
+    was in flight. Call ``start`` to reconcile periodically in the
+    background.
+
+    The tokens measure counts every billable token, cache reads and writes
+    included, split the same way ``teer.pricing.usage_tokens`` splits them
+    for the cost measure.
+
+    With the cost measure, events are priced from cached rate cards only. An
+    event whose rate card is not cached yet has the card fetched in the
+    background and counts as unpriced, in the ``quota.unpriced`` counter.
+    """
+
+    def __init__(
+        self,
+        client: "TeerClient",
+        measure: QuotaMeasure = "tokens",
+        reconcile_interval: float = 60.0,
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            client: The Teer client, used for pricing and reconciliation.
+            measure: ``"tokens"`` to count billable tokens, or ``"cost"`` to
+                     count cost priced from the event's rate card.
+            reconcile_interval: Seconds between background reconciliations.
+        """
+        if measure not in ("tokens", "cost"):
+            raise ValueError(f"Unknown quota measure: {measure!r}")
+        self.client = client
+        self.measure = measure
+        self.reconcile_interval = reconcile_interval
+
+        self._limits: Dict[Tuple[str, str], float] = {}
+        self._usage: Dict[Tuple[str, str], float] = {}
+        # Usage counted since the last reconciliation started
+        self._delta: Dict[Tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def set_limit(self, field: QuotaField, value: str, limit: Optional[float]) -> None:
+        """
+        Set the budget for one organization, team or user.
+
+        Args:
+            field: The metadata field the budget applies to.
+            value: The ID of the organization, team or user.
+            limit: The budget in the tracker's measure, or None to remove it.
+        """
+        if field not in QUOTA_FIELDS:
+            raise ValueError(
+                f"Quotas can only be keyed on {', '.join(QUOTA_FIELDS)}"
+            )
+        with self._lock:
+            if limit is None:
+                self._limits.pop((field, value), None)
+            else:
+                self._limits[(field, value)] = limit
+
+    def usage(self, field: QuotaField, value: str) -> float:
+        """
+        Get the usage counted for one organization, team or user.
+
+        Args:
+            field: The metadata field.
+            value: The ID of the organization, team or user.
+
+        Returns:
+            The usage in the tracker's measure.
+        """
+        return self._usage.get((field, value), 0.0)
+
+    def remaining(self, field: QuotaField, value: str) -> Optional[float]:
+        """
+        Get the budget left for one organization, team or user.
+
+        Args:
+            field: The metadata field.
+            value: The ID of the organization, team or user.
+
+        Returns:
+            The remaining budget, which may be negative, or None if unlimited.
+        """
+        limit = self._limits.get((field, value))
+        if limit is None:
+            return None
+        return limit - self._usage.get((field, value), 0.0)
+
+    def allowed(
+        self,
+        organization_id: Optional[str] = None,
+        team_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> bool:
+        """
+        Check whether a caller is within every budget that applies to it.
+
+        Args:
+            organization_id: The caller's organization, if any.
+            team_id: The caller's team, if any.
+            user_id: The caller's user, if any.
+
+        Returns:
+            False if any of the given IDs has used up its budget.
+        """
+        limits = self._limits
+        usage = self._usage
+        for field, value in (
+            ("organization_id", organization_id),
+            ("team_id", team_id),
+            ("user_id", user_id),
+        ):
+            if value is None:
+                continue
+            limit = limits.get((field, value))
+            if limit is not None and usage.get((field, value), 0.0) >= limit:
+                return False
+        return True
+
+    def record(self, event: IngestPayload) -> None:
+        """
+        Count an event's usage against its organization, team and user.
+
+        Args:
+            event: The ingest payload.
+        """
+        metadata: Dict[str, Any] = event.get("metadata") or {}  # type: ignore[assignment]
+        keys = [(f, metadata[f]) for f in QUOTA_FIELDS if metadata.get(f)]
+        if not keys:
+            return
+        amount = self._amount(event)
+        if not amount:
+            return
+        with self._lock:
+            for key in keys:
+                self._usage[key] = self._usage.get(key, 0.0) + amount
+                self._delta[key] = self._delta.get(key, 0.0) + amount
+
+    def process(self, event: IngestPayload) -> Optional[IngestPayload]:
+        self.record(event)
+        return event
+
+    def reconcile(self) -> None:
+        """
+        Replace local counters with the server's totals.
+
+        Fetches current-period usage from the Teer API. Usage counted locally
+        while the request is in flight is added on top of the server totals.
+
+        Raises:
+            Exception: If the request fails.
+        """
+        with self._lock:
+            self._delta = {}
+        totals = self._parse_totals(self.client.usage.totals(self.measure))
+        with self._lock:
+            usage = dict(totals)
+            for key, amount in self._delta.items():
+                usage[key] = usage.get(key, 0.0) + amount
+            self._usage = usage
+
+    def start(self) -> None:
+        """
+        Start reconciling with the server in a background thread.
+
+        With the cost measure, the client's default rate card is also
+        fetched in the background, ready for the first events.
+        """
+        if self._thread is not None:
+            return
+        pricing = self.client.pricing
+        if self.measure == "cost" and pricing.default_rate_card_id:
+            pricing.refresh(pricing.default_rate_card_id)
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="teer-quota-reconcile", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop background reconciliation."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self.reconcile()
+            except Exception as e:
+                logger.warning(f"Failed to reconcile quotas: {str(e)}")
+            if self._stop.wait(self.reconcile_interval):
+                return
+
+    def _amount(self, event: IngestPayload) -> float:
+        if self.measure == "cost":
+            # Never wait on a rate card fetch on the request path: a card
+            # that is not cached yet is fetched in the background, and the
+            # event counts as unpriced meanwhile.
+            try:
+                cost = self.client.pricing.cost(event, wait=False)
+            except Exception as e:
+                logger.warning(f"Could not price event for quota tracking: {str(e)}")
+                return 0.0
+            if cost is None:
+                self.client.metrics.increment("quota.unpriced")
+                return 0.0
+            return cost
+        usage = event.get("usage") or {}
+        return float(sum(usage_tokens(event.get("provider", ""), usage)))
+
+    @staticmethod
+    def _parse_totals(rows: Iterable[Dict]) -> Dict[Tuple[str, str], float]:
+        totals: Dict[Tuple[str, str], float] = {}
+        for row in rows:
+            field, value = row.get("field"), row.get("value")
+            if field in QUOTA_FIELDS and value:
+                totals[(field, value)] = float(row.get("usage", 0))
+        return totals
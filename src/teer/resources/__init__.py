@@ -4,5 +4,7 @@
 
 from .ingest import Ingest
 from .billing import BillingResource
+from .rate_cards import RateCardsResource
+from .usage import UsageResource
 
-__all__ = ["Ingest", "BillingResource"]
+__all__ = ["Ingest", "BillingResource", "RateCardsResource", "UsageResource"]
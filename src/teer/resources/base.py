@@ -3,14 +3,11 @@
 # SPDX-License-Identifier: MIT
 
 from typing import Dict, Any, Optional, TYPE_CHECKING
-import logging
-import requests
+from ..pagination import PageIterator
 
 if TYPE_CHECKING:
     from .. import TeerClient
 
-logger = logging.getLogger("teer")
-
 
 class BaseResource:
     """Base class for all Teer API resources."""
@@ -42,9 +39,11 @@ class BaseResource:
         data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
         timeout: int = 10,
+        body: Optional[bytes] = None,
+        hedge: bool = False,
     ) -> Dict[str, Any]:
         """
-        Make a request to the Teer API using the shared HTTP client.
+        Make a request to the Teer API using the client's shared HTTP client.
 
         Args:
             method: The HTTP method to use (GET, POST, etc.).
@@ -53,6 +52,9 @@ class BaseResource:
             data: JSON data for the request body.
             headers: Additional headers to include in the request.
             timeout: Request timeout in seconds.
+            body: Pre-encoded JSON request body, sent instead of ``data``.
+            hedge: Whether a slow request may be duplicated, if the client
+                   has a hedging policy.
 
         Returns:
             The response from the Teer API.
@@ -61,51 +63,52 @@ class BaseResource:
             Exception: If the request fails.
         """
         # Calculate the full path relative to the resource base URL
-        resource_path = path.lstrip("/") if path else ""
-
-        # Construct the full URL for the request using the resource's base URL
         # This ensures we use the correct base URL (api or track) for each resource
-        full_url = f"{self.base_url}/{resource_path}".rstrip("/")
+        resource_path = path.lstrip("/") if path else ""
         if resource_path:
             full_url = f"{self.base_url}/{resource_path}"
         else:
             full_url = self.base_url
 
-        logger.debug(f"Making {method} request to {full_url}")
-        if data:
-            logger.debug(f"Request data: {data}")
-
-        # Make the request directly using the requests library
-        # This bypasses the HTTP client's base URL and uses the resource's base URL
-        try:
-            # Ensure we always have the Authorization and Content-Type headers
-            request_headers = {
-                "Authorization": f"Bearer {self.client.api_key}",
-                "Content-Type": "application/json",
-            }
-
-            # Add any additional headers
-            if headers:
-                request_headers.update(headers)
-
-            response = requests.request(
-                method=method,
-                url=full_url,
-                params=params,
-                json=data,
-                headers=request_headers,
-                timeout=timeout,
-            )
-            response.raise_for_status()
-
-            # Try to parse the response as JSON
-            try:
-                return response.json()
-            except ValueError:
-                # If the response is not JSON, return the text
-                return {"text": response.text}
-
-        except Exception as e:
-            logger.error(f"Error making request to {full_url}: {str(e)}")
-            # Re-raise the exception for the caller to handle
-            raise
+        return self.client.http_client.send(
+            method,
+            full_url,
+            params=params,
+            data=data,
+            headers=headers,
+            timeout=timeout,
+            body=body,
+            hedge=hedge,
+        )
+
+    def _paginate(
+        self,
+        path: str,
+        filters: Dict[str, Any],
+        page_size: int,
+        prefetch: int,
+        timeout: Optional[int],
+    ) -> PageIterator[Any]:
+        """
+        Build a lazy iterator over a cursor-paginated list endpoint.
+
+        Args:
+            path: The path of the list endpoint, relative to the resource.
+            filters: Query parameters. None values are omitted.
+            page_size: Number of items requested per page.
+            prefetch: Number of pages to fetch ahead in the background.
+            timeout: Request timeout in seconds, per page.
+
+        Returns:
+            An iterator over the listed items.
+        """
+        params = {k: v for k, v in filters.items() if v is not None}
+        params["limit"] = page_size
+
+        def fetch_page(cursor: Optional[str]) -> Dict[str, Any]:
+            page_params = dict(params)
+            if cursor is not None:
+                page_params["cursor"] = cursor
+            return self._request("GET", path, params=page_params, timeout=timeout)
+
+        return PageIterator(fetch_page, prefetch=prefetch)
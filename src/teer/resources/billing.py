@@ -2,9 +2,12 @@
 #
 # SPDX-License-Identifier: MIT
 
+import logging
+import uuid
 from typing import (
     Dict,
     Any,
+    List,
     Optional,
     Union,
     TypedDict,
@@ -13,10 +16,14 @@ from typing import (
     NotRequired,
 )
 from .base import BaseResource
+from ..pagination import PageIterator
+from ..sender import is_permanent_error
 
 if TYPE_CHECKING:
     from .. import TeerClient
 
+logger = logging.getLogger("teer")
+
 
 # Billing provider type
 BillingProvider = Literal["stripe"]
@@ -103,6 +110,11 @@ class MeterEvent(TypedDict):
     updated_at: str
 
 
+def _identifier(params: MeterEventCreateParams) -> Optional[str]:
+    """Get a meter event's identifier from its fields."""
+    return (params.get("fields") or {}).get("identifier")
+
+
 class MeterEventsResource(BaseResource):
     """Resource for meter events operations"""
 
@@ -120,7 +132,7 @@ class MeterEventsResource(BaseResource):
         params: MeterEventCreateParams,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[int] = 10,
-    ) -> MeterEvent:
+    ) -> Optional[MeterEvent]:
         """
         Create a meter event to record usage.
 
@@ -130,12 +142,118 @@ class MeterEventsResource(BaseResource):
             timeout: Request timeout in seconds. Defaults to 10 seconds.
 
         Returns:
-            The created meter event.
+            The created meter event, or None if the client's deduplicator
+            suppressed it as a duplicate.
 
         Raises:
             Exception: If the request fails.
         """
-        return self._request("POST", data=params, headers=headers, timeout=timeout)
+        identifier = _identifier(params)
+        dedup = self.client.dedup
+        if dedup is not None and dedup.check_meter(identifier):
+            return None
+        if identifier and self.client.http_client.hedging is not None:
+            # Let a hedged duplicate be deduplicated on the event's own identifier
+            headers = {"Idempotency-Key": identifier, **(headers or {})}
+        delivery = self.client.delivery
+        if delivery is not None:
+            params = delivery.stamp(params)  # type: ignore[arg-type,assignment]
+        try:
+            return self._request(
+                "POST", data=params, headers=headers, timeout=timeout, hedge=True
+            )
+        except Exception:
+            if dedup is not None:
+                dedup.forget_meter(identifier)
+            raise
+
+    def enqueue(self, params: MeterEventCreateParams) -> bool:
+        """
+        Buffer a meter event to be sent in the background.
+
+        Meter events have their own lane in the client's sender pool. They are
+        sent before buffered ingest events, are never dropped when the buffer
+        is full (this call blocks instead), and failed sends are retried until
+        they succeed unless the server rejects them with a 4xx status other
+        than 429. Events without a ``fields.identifier`` are given one so
+        the server can deduplicate retries. With a delivery tracker, retries
+        also keep the event's sequence number.
+
+        Args:
+            params: Parameters for creating a meter event.
+
+        Returns:
+            True once the event is buffered, False if the client's
+            deduplicator suppressed it as a duplicate or it could not be
+            buffered.
+        """
+        dedup = self.client.dedup
+        identifier = _identifier(params)
+        if dedup is not None and dedup.check_meter(identifier):
+            return False
+        if not identifier:
+            fields = {**params["fields"], "identifier": uuid.uuid4().hex}
+            params = {**params, "fields": fields}  # type: ignore[typeddict-item]
+        delivery = self.client.delivery
+        if delivery is not None:
+            params = delivery.stamp(params)  # type: ignore[arg-type,assignment]
+        if self.client.sender.enqueue(params, lane="meter"):
+            return True
+        if dedup is not None:
+            dedup.forget_meter(identifier)
+        return False
+
+    def _post_batch(self, events: List[MeterEventCreateParams]) -> None:
+        """
+        Create buffered meter events one by one, keyed by their identifier.
+
+        Events the server rejects with a 4xx status other than 429 are logged
+        and dropped, so they don't block the lane. Other errors are raised
+        for the lane to retry the batch.
+        """
+        for event in events:
+            identifier = _identifier(event)
+            try:
+                self._request(
+                    "POST",
+                    data=event,
+                    headers={"Idempotency-Key": identifier} if identifier else None,
+                    timeout=10,
+                )
+            except Exception as e:
+                if not is_permanent_error(e):
+                    raise
+                self.client.metrics.increment("billing.meter_events.rejected")
+                dedup = self.client.dedup
+                if dedup is not None:
+                    dedup.forget_meter(identifier)
+                logger.error(f"Dropped rejected meter event {identifier}: {str(e)}")
+
+    def list(
+        self,
+        event_name: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        page_size: int = 1000,
+        prefetch: int = 1,
+        timeout: Optional[int] = 30,
+    ) -> PageIterator[MeterEvent]:
+        """
+        List meter events, fetching pages lazily as they are consumed.
+
+        Args:
+            event_name: Only include events with this name.
+            start: Only include events at or after this ISO 8601 time.
+            end: Only include events before this ISO 8601 time.
+            page_size: Number of events per page.
+            prefetch: Number of pages to fetch ahead in the background.
+            timeout: Request timeout in seconds, per page.
+
+        Returns:
+            An iterator over the matching meter events.
+        """
+        filters = {"event_name": event_name, "start": start, "end": end}
+        return self._paginate("", filters, page_size, prefetch, timeout)
 
 
 class BillingResource(BaseResource):
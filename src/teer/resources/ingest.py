@@ -2,8 +2,11 @@
 #
 # SPDX-License-Identifier: MIT
 
-from typing import Dict, Any, Optional, TYPE_CHECKING
+from typing import Dict, Any, List, Optional, Sequence, Union, TYPE_CHECKING
 from .base import BaseResource
+from ..defaults import DefaultedEvent, PayloadDefaults, encode_batch
+from ..scope import _collect
+from ..sender import is_permanent_error
 from ..types import IngestPayload
 
 if TYPE_CHECKING:
@@ -17,21 +20,26 @@ class Ingest(BaseResource):
     This resource is used to send LLM usage data and other metrics to Teer.
     """
 
-    def __init__(self, client: "TeerClient"):
+    def __init__(
+        self, client: "TeerClient", defaults: Optional[PayloadDefaults] = None
+    ):
         """
         Initialize the Ingest resource.
 
         Args:
             client: The Teer client instance.
+            defaults: Optional default fields merged into every payload when
+                      it is encoded.
         """
         super().__init__(client, "ingest", client.track_base)
+        self.defaults = defaults or None
 
     def send(
         self,
         payload: IngestPayload,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[int] = 10,
-    ) -> Dict[str, Any]:
+    ) -> Optional[Dict[str, Any]]:
         """
         Send usage data to Teer.
 
@@ -41,10 +49,205 @@ class Ingest(BaseResource):
             headers: Additional headers to include in the request.
             timeout: Request timeout in seconds. Defaults to 10 seconds.
 
+        Returns:
+            The response from the Teer API, or None if one of the client's
+            event processors dropped the payload or it was collected by an
+            active ``teer.scope.usage_scope`` to be sent in the background.
+
+        Raises:
+            Exception: If the request fails.
+        """
+        if _collect(self, payload):
+            return None
+        defaults = self.defaults
+        processors = self.client.processors
+        if processors:
+            if defaults is not None:
+                # Processors always see the complete event
+                payload = defaults.apply(payload)
+                defaults = None
+            payload = processors.run(payload)
+            if payload is None:
+                return None
+        delivery = self.client.delivery
+        if delivery is not None:
+            payload = delivery.stamp(payload)  # type: ignore[assignment]
+        try:
+            if defaults is None:
+                return self._request(
+                    "POST", data=payload, headers=headers, timeout=timeout, hedge=True
+                )
+            return self._request(
+                "POST",
+                headers=headers,
+                timeout=timeout,
+                body=defaults.encode(payload),
+                hedge=True,
+            )
+        except Exception:
+            dedup = self.client.dedup
+            if dedup is not None:
+                # Let the caller retry an event that never reached the server
+                dedup.forget(payload)
+            raise
+
+    def send_batch(
+        self,
+        payloads: List[IngestPayload],
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = 30,
+    ) -> Dict[str, Any]:
+        """
+        Send several usage reports to Teer in a single request.
+
+        Args:
+            payloads: The usage reports to send. See the IngestPayload type.
+            headers: Additional headers to include in the request.
+            timeout: Request timeout in seconds. Defaults to 30 seconds.
+
         Returns:
             The response from the Teer API.
 
         Raises:
             Exception: If the request fails.
         """
-        return self._request("POST", data=payload, headers=headers, timeout=timeout)
+        return self._post_batch(
+            self._prepare_all(payloads), headers=headers, timeout=timeout, track=False
+        )
+
+    def send_batch_encoded(
+        self,
+        events: Sequence[bytes],
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = 30,
+    ) -> Dict[str, Any]:
+        """
+        Send several already JSON-encoded usage reports in a single request.
+
+        This skips decoding and re-encoding the reports, which matters when
+        replaying large JSONL files. Event processors are not applied.
+
+        Args:
+            events: The usage reports, each encoded as a UTF-8 JSON object.
+            headers: Additional headers to include in the request.
+            timeout: Request timeout in seconds. Defaults to 30 seconds.
+
+        Returns:
+            The response from the Teer API.
+
+        Raises:
+            Exception: If the request fails.
+        """
+        body = b'{"events":[' + b",".join(events) + b"]}"
+        return self._request(
+            "POST", "batch", headers=headers, timeout=timeout, body=body
+        )
+
+    def enqueue(self, payload: IngestPayload) -> bool:
+        """
+        Buffer usage data to be sent in the background.
+
+        Buffered reports are sent in batches by the client's sender pool. Call
+        ``client.flush()`` to wait for them to be delivered. Inside an active
+        ``teer.scope.usage_scope`` the report is held until the scope exits.
+
+        Args:
+            payload: The data to send. See the IngestPayload type.
+
+        Returns:
+            True if the report was buffered, False if it was dropped because
+            the buffer was full or an event processor dropped it.
+        """
+        if _collect(self, payload):
+            return True
+        return self._buffer(payload)
+
+    def _buffer(self, payload: IngestPayload) -> bool:
+        """Run the processors over a report and hand it to the sender."""
+        defaults = self.defaults
+        processors = self.client.processors
+        if processors:
+            if defaults is not None:
+                payload = defaults.apply(payload)
+                defaults = None
+            payload = processors.run(payload)
+            if payload is None:
+                return False
+        delivery = self.client.delivery
+        if delivery is not None:
+            payload = delivery.stamp(payload)  # type: ignore[assignment]
+        event = payload if defaults is None else DefaultedEvent(payload, defaults)
+        if self.client.sender.enqueue(event, payload.get("trace_id")):
+            return True
+        dedup = self.client.dedup
+        if dedup is not None:
+            dedup.forget(payload)
+        return False
+
+    def _prepare_all(
+        self, payloads: List[IngestPayload]
+    ) -> List[Union[IngestPayload, DefaultedEvent]]:
+        """Run the processors over several payloads and attach the defaults."""
+        defaults = self.defaults
+        processors = self.client.processors
+        if defaults is None:
+            return processors.run_all(payloads)
+        if processors:
+            return processors.run_all([defaults.apply(p) for p in payloads])
+        return [DefaultedEvent(p, defaults) for p in payloads]
+
+    def _post_batch(
+        self,
+        payloads: Sequence[Union[IngestPayload, DefaultedEvent]],
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = 30,
+        track: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Send already processed usage reports to the batch endpoint.
+
+        Reports buffered with defaults are encoded here, each set of
+        defaults having been encoded once up front. With a delivery tracker
+        the reports are stamped and, if ``track``, kept until acknowledged.
+        """
+        delivery = self.client.delivery
+        try:
+            if delivery is None:
+                return self._send_batch(payloads, headers, timeout)
+            payloads = delivery.stamp_all(payloads)
+            if not track:
+                return self._send_batch(payloads, headers, timeout)
+            delivery.sent(payloads)
+            try:
+                response = self._send_batch(payloads, headers, timeout)
+            except Exception as e:
+                delivery.failed(e, payloads)
+                raise
+        except Exception as e:
+            dedup = self.client.dedup
+            # Events the delivery tracker will resend keep their keys
+            resent = delivery is not None and track and not is_permanent_error(e)
+            if dedup is not None and not resent:
+                dedup.forget_all(payloads)
+            raise
+        delivery.acknowledge(response, payloads)
+        return response
+
+    def _send_batch(
+        self,
+        payloads: Sequence[Union[IngestPayload, DefaultedEvent]],
+        headers: Optional[Dict[str, str]],
+        timeout: Optional[int],
+    ) -> Dict[str, Any]:
+        if not any(isinstance(p, DefaultedEvent) for p in payloads):
+            return self._request(
+                "POST",
+                "batch",
+                data={"events": payloads},
+                headers=headers,
+                timeout=timeout,
+            )
+        body = encode_batch(payloads)
+        return self._request(
+            "POST", "batch", headers=headers, timeout=timeout, body=body
+        )
@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+from typing import Dict, Optional, TypedDict, NotRequired, TYPE_CHECKING
+from .base import BaseResource
+
+if TYPE_CHECKING:
+    from .. import TeerClient
+
+
+class ModelRate(TypedDict):
+    """Prices for a single model, per million tokens"""
+
+    input: float
+    """Price per million uncached input tokens."""
+
+    output: float
+    """Price per million output tokens."""
+
+    cache_read: NotRequired[float]
+    """Price per million input tokens read from cache. Defaults to the input price."""
+
+    cache_write: NotRequired[float]
+    """Price per million input tokens written to cache. Defaults to the input price."""
+
+    batch_discount: NotRequired[float]
+    """Fraction taken off the price of batch requests, e.g. 0.5 for half price."""
+
+
+class RateCard(TypedDict):
+    """A rate card mapping model names to prices"""
+
+    id: str
+    currency: str
+    rates: Dict[str, ModelRate]
+
+
+class RateCardsResource(BaseResource):
+    """Resource for reading rate cards"""
+
+    def __init__(self, client: "TeerClient"):
+        """
+        Initialize the RateCards resource.
+
+        Args:
+            client: The Teer client instance.
+        """
+        super().__init__(client, "rate-cards")
+
+    def retrieve(
+        self,
+        rate_card_id: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = 10,
+    ) -> RateCard:
+        """
+        Retrieve a rate card.
+
+        Args:
+            rate_card_id: The ID of the rate card.
+            headers: Additional headers to include in the request.
+            timeout: Request timeout in seconds. Defaults to 10 seconds.
+
+        Returns:
+            The rate card.
+
+        Raises:
+            Exception: If the request fails.
+        """
+        return self._request("GET", rate_card_id, headers=headers, timeout=timeout)
@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+from typing import List, Optional, TypedDict, NotRequired, TYPE_CHECKING
+from .base import BaseResource
+from ..pagination import PageIterator
+from ..types import Provider, UsageObject, MetadataObject
+
+if TYPE_CHECKING:
+    from .. import TeerClient
+
+
+class UsageReport(TypedDict):
+    """A usage report as stored by Teer"""
+
+    id: str
+    provider: Provider
+    model: str
+    function_id: NotRequired[str]
+    usage: UsageObject
+    trace_id: NotRequired[str]
+    span_id: NotRequired[str]
+    parent_span_id: NotRequired[str]
+    batch: NotRequired[bool]
+    metadata: NotRequired[MetadataObject]
+    created_at: str
+
+
+class UsageTotal(TypedDict):
+    """Usage for one organization, team or user in the current period"""
+
+    field: str
+    value: str
+    usage: float
+
+
+class UsageResource(BaseResource):
+    """Resource for reading usage reports back from Teer"""
+
+    def __init__(self, client: "TeerClient"):
+        """
+        Initialize the Usage resource.
+
+        Args:
+            client: The Teer client instance.
+        """
+        super().__init__(client, "usage")
+
+    def list(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        provider: Optional[Provider] = None,
+        model: Optional[str] = None,
+        function_id: Optional[str] = None,
+        page_size: int = 1000,
+        prefetch: int = 1,
+        timeout: Optional[int] = 30,
+    ) -> PageIterator[UsageReport]:
+        """
+        List usage reports, fetching pages lazily as they are consumed.
+
+        Args:
+            start: Only include reports created at or after this ISO 8601 time.
+            end: Only include reports created before this ISO 8601 time.
+            provider: Only include reports for this provider.
+            model: Only include reports for this model.
+            function_id: Only include reports for this function.
+            page_size: Number of reports per page.
+            prefetch: Number of pages to fetch ahead in the background.
+            timeout: Request timeout in seconds, per page.
+
+        Returns:
+            An iterator over the matching usage reports.
+        """
+        filters = {
+            "start": start,
+            "end": end,
+            "provider": provider,
+            "model": model,
+            "function_id": function_id,
+        }
+        return self._paginate("", filters, page_size, prefetch, timeout)
+
+    def totals(
+        self, measure: str = "tokens", timeout: Optional[int] = 10
+    ) -> List[UsageTotal]:
+        """
+        Get current-period usage per organization, team and user.
+
+        Args:
+            measure: ``"tokens"`` or ``"cost"``.
+            timeout: Request timeout in seconds. Defaults to 10 seconds.
+
+        Returns:
+            The usage totals.
+
+        Raises:
+            Exception: If the request fails.
+        """
+        response = self._request(
+            "GET", "totals", params={"measure": measure}, timeout=timeout
+        )
+        return response.get("data", [])
+
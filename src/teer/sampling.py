@@ -0,0 +1,146 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+import hashlib
+import random
+import threading
+from typing import Dict, Optional, Tuple
+
+from .metrics import Metrics
+from .processors import EventProcessor
+from .types import IngestPayload
+
+# Keep/drop thresholds are compared against 64-bit trace hashes
+_HASH_SPACE = 2**64
+
+
+def trace_hash(trace_id: str) -> int:
+    """
+    Hash a trace ID to a uniformly distributed 64-bit integer.
+
+    The hash is stable across processes and hosts, so every service that
+    samples with the same rate keeps the same traces.
+
+    Args:
+        trace_id: The trace ID.
+
+    Returns:
+        The hash.
+    """
+    digest = hashlib.blake2b(trace_id.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+class TraceSampler(EventProcessor):
+    """
+    Sends a fraction of ingest events without biasing totals.
+
+    The sampler is an event processor: register it with
+    ``client.add_processor``. Each event gets the sample rate of the most
+    specific rule matching it: its ``function_id`` and ``model`` together,
+    then its ``function_id``, then its ``model``, then the default rate.
+
+    The keep/drop decision compares a hash of the event's ``trace_id`` with
+    the rate, so all events of a trace that share a rate are kept or dropped
+    together, in every process. Rates are nested: a trace kept at 1% is
+    also kept by every rule with a higher rate. Events without a trace ID
+    are sampled independently.
+
+    Kept events carry their ``sample_rate``; each one stands for
+    ``1 / sample_rate`` events, so totals weighted by it stay unbiased.
+    Meter events never pass through event processors and are never sampled.
+    Register the sampler after processors that must see every event, such
+    as a ``QuotaTracker``.
+    """
+
+    def __init__(self, default_rate: float = 1.0, metrics: Optional[Metrics] = None):
+        """
+        Initialize the sampler.
+
+        Args:
+            default_rate: Sample rate of events no rule matches, from 0 to 1.
+            metrics: Optional metrics registry to count kept and dropped
+                     events into.
+        """
+        self.default_rate = _check_rate(default_rate)
+        self.metrics = metrics
+        self._rules: Dict[Tuple[Optional[str], Optional[str]], float] = {}
+        self._lock = threading.Lock()
+
+    def set_rate(
+        self,
+        rate: Optional[float],
+        function_id: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> None:
+        """
+        Set the sample rate of a function, a model, or both.
+
+        Args:
+            rate: The fraction of events to keep, from 0 to 1, or None to
+                  remove the rule.
+            function_id: The function the rule applies to.
+            model: The model the rule applies to.
+        """
+        if function_id is None and model is None:
+            if rate is None:
+                raise ValueError("The default rate cannot be removed")
+            self.default_rate = _check_rate(rate)
+            return
+        with self._lock:
+            rules = dict(self._rules)
+            if rate is None:
+                rules.pop((function_id, model), None)
+            else:
+                rules[(function_id, model)] = _check_rate(rate)
+            # Replace rather than mutate so concurrent lookups stay lock-free
+            self._rules = rules
+
+    def rate(self, event: IngestPayload) -> float:
+        """
+        Get the sample rate that applies to an event.
+
+        Args:
+            event: The ingest payload.
+
+        Returns:
+            The sample rate.
+        """
+        rules = self._rules
+        if rules:
+            function_id = event.get("function_id")
+            model = event.get("model")
+            for key in ((function_id, model), (function_id, None), (None, model)):
+                rate = rules.get(key)
+                if rate is not None:
+                    return rate
+        return self.default_rate
+
+    def process(self, event: IngestPayload) -> Optional[IngestPayload]:
+        rate = self.rate(event)
+        if rate >= 1.0:
+            return event
+
+        trace_id = event.get("trace_id")
+        if trace_id:
+            keep = trace_hash(trace_id) < rate * _HASH_SPACE
+        else:
+            keep = random.random() < rate
+
+        metrics = self.metrics
+        if not keep:
+            if metrics is not None:
+                metrics.increment("sampling.dropped")
+            return None
+        if metrics is not None:
+            metrics.increment("sampling.kept")
+        # Compose with any sampling done upstream of this process
+        upstream = event.get("sample_rate", 1.0)
+        return {**event, "sample_rate": rate * upstream}
+
+
+def _check_rate(rate: float) -> float:
+    if not 0.0 <= rate <= 1.0:
+        raise ValueError(f"Sample rate must be between 0 and 1, got {rate!r}")
+    return float(rate)
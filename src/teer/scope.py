@@ -0,0 +1,149 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+import threading
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+from .types import IngestPayload
+
+if TYPE_CHECKING:
+    from . import TeerClient
+    from .resources.ingest import Ingest
+
+_current: ContextVar[Optional["UsageScope"]] = ContextVar(
+    "teer_usage_scope", default=None
+)
+
+
+class UsageScope:
+    """
+    Usage reports collected for one application request.
+
+    Reports are collected per ``ingest`` resource so that views created with
+    ``client.with_defaults`` keep their own defaults.
+    """
+
+    def __init__(
+        self,
+        client: "TeerClient",
+        request_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+    ):
+        """
+        Initialize the scope.
+
+        Args:
+            client: The client whose usage is collected.
+            request_id: Stored as ``metadata.request_id`` on every report that
+                        doesn't set one. Defaults to a random identifier.
+            session_id: Stored as ``metadata.session_id`` on every report that
+                        doesn't set one, when given.
+        """
+        self.client = client
+        self.request_id = request_id or uuid.uuid4().hex
+        self.session_id = session_id
+        self._events: List[Tuple["Ingest", IngestPayload]] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def collect(self, ingest: "Ingest", payload: IngestPayload) -> bool:
+        """
+        Hold back a usage report until the scope exits.
+
+        Args:
+            ingest: The ingest resource the report was sent through.
+            payload: The report.
+
+        Returns:
+            True if the report was collected, False if it belongs to another
+            client or the scope has already been submitted.
+        """
+        if ingest.client is not self.client:
+            return False
+        with self._lock:
+            if self._closed:
+                return False
+            self._events.append((ingest, payload))
+        return True
+
+    def submit(self) -> int:
+        """
+        Tag the collected reports and hand them to the background sender.
+
+        Reports collected afterwards, e.g. from a task that outlives the
+        request, are sent as usual.
+
+        Returns:
+            The number of reports buffered.
+        """
+        with self._lock:
+            self._closed = True
+            events, self._events = self._events, []
+
+        metadata = {"request_id": self.request_id}
+        if self.session_id is not None:
+            metadata["session_id"] = self.session_id
+
+        buffered = 0
+        for ingest, payload in events:
+            payload = dict(payload)  # type: ignore[assignment]
+            payload["metadata"] = {  # type: ignore[typeddict-unknown-key]
+                **metadata,
+                **(payload.get("metadata") or {}),  # type: ignore[misc]
+            }
+            buffered += ingest._buffer(payload)
+        if events:
+            self.client.metrics.increment("scope.requests")
+            self.client.metrics.increment("scope.events", len(events))
+        return buffered
+
+
+def current_scope() -> Optional[UsageScope]:
+    """Get the usage scope active in the current context, if any."""
+    return _current.get()
+
+
+@contextmanager
+def usage_scope(
+    client: "TeerClient",
+    request_id: Optional[str] = None,
+    session_id: Optional[str] = None,
+) -> Iterator[UsageScope]:
+    """
+    Collect the client's usage reports until the block exits.
+
+    Inside the block, usage sent or enqueued through the client's ``ingest``
+    resource is held back. When the block exits, even if it raises, every
+    report is tagged with the scope's ``request_id`` and ``session_id`` and
+    handed to the background sender in one go. The active scope is kept in
+    a ``contextvars.ContextVar``, so it follows asyncio tasks and stays
+    separate between concurrent requests.
+
+    Args:
+        client: The client whose usage is collected.
+        request_id: The request identifier. Defaults to a random one.
+        session_id: Optional session identifier.
+
+    Yields:
+        The active scope.
+    """
+    scope = UsageScope(client, request_id, session_id)
+    token = _current.set(scope)
+    try:
+        yield scope
+    finally:
+        _current.reset(token)
+        scope.submit()
+
+
+def _collect(ingest: "Ingest", payload: Any) -> bool:
+    """Collect a report into the active scope, if there is one for its client."""
+    scope = _current.get()
+    return scope is not None and scope.collect(ingest, payload)
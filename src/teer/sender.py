@@ -0,0 +1,606 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+import logging
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Literal, Optional, Tuple
+
+from .metrics import Metrics
+
+logger = logging.getLogger("teer")
+
+# How events are ordered when several workers send concurrently.
+# "none": any worker may send any event, giving the best throughput.
+# "trace_id": events sharing a trace_id are always sent by the same worker,
+# in the order they were enqueued.
+Ordering = Literal["none", "trace_id"]
+
+# Longest pause, in seconds, before a durable lane retries a failed batch
+MAX_RETRY_BACKOFF = 30.0
+
+# Longest time, in seconds, buffered events are flushed for at interpreter exit
+EXIT_FLUSH_TIMEOUT = 10.0
+
+
+def is_permanent_error(error: BaseException) -> bool:
+    """
+    Check whether a send failed in a way that retrying cannot fix.
+
+    Args:
+        error: The error raised by a batch sender.
+
+    Returns:
+        True if the server rejected the request with a 4xx status other than
+        429, e.g. because it is invalid or the API key was revoked.
+    """
+    status_code = getattr(getattr(error, "response", None), "status_code", None)
+    return (
+        isinstance(status_code, int) and 400 <= status_code < 500 and status_code != 429
+    )
+
+
+class PartialFailure(Exception):
+    """
+    Raised by a batch sender when only some events of a batch failed.
+
+    The pool handles the failed events as it would a failed batch, retrying
+    them on a durable lane, and counts the others as sent.
+    """
+
+    def __init__(self, events: List[Any], error: Exception):
+        """
+        Initialize the error.
+
+        Args:
+            events: The events of the batch that were not sent.
+            error: The error they failed with.
+        """
+        super().__init__(str(error))
+        self.events = events
+        self.error = error
+
+
+class Lane:
+    """
+    A queue of events with its own batch sender and delivery guarantees.
+
+    Lanes share the pool's workers and connections. Workers serve lanes by
+    ``priority``, highest first, but after ``weight`` consecutive batches from
+    one lane they send a batch from a lower-priority lane that is waiting, so
+    low-priority traffic is delayed but never starved.
+
+    A durable lane does not drop events: ``enqueue`` blocks while it is full
+    and failed batches are put back at the front of the lane and retried with
+    exponential backoff. Only batches the server rejects with a 4xx status
+    other than 429 are dropped, since retrying them would block the lane
+    forever. Other lanes drop events when full, count failed
+    batches and move on, and can shed load early: above ``shed_threshold`` of
+    ``max_buffer_size`` a growing fraction of new events is dropped.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        send_batch: Callable[[List[Any]], Any],
+        partitions: int = 1,
+        priority: int = 0,
+        weight: int = 1,
+        max_buffer_size: int = 100_000,
+        durable: bool = False,
+        shed_threshold: Optional[float] = None,
+    ):
+        """
+        Initialize the lane.
+
+        Args:
+            name: The lane name, used in metric names.
+            send_batch: Callable that sends a list of events from this lane.
+            partitions: Number of partitions, one per worker when ordering.
+            priority: Lanes with a higher priority are served first.
+            weight: Batches the lane may send back to back while
+                    lower-priority lanes wait.
+            max_buffer_size: Maximum number of buffered events.
+            durable: Whether the lane blocks instead of dropping and retries
+                     failed batches until they are delivered.
+            shed_threshold: Fraction of ``max_buffer_size`` above which new
+                            events are dropped with rising probability. Ignored
+                            for durable lanes.
+        """
+        if weight < 1:
+            raise ValueError("weight must be at least 1")
+        self.name = name
+        self.send_batch = send_batch
+        self.priority = priority
+        self.weight = weight
+        self.max_buffer_size = max_buffer_size
+        self.durable = durable
+        self.shed_threshold = shed_threshold
+        self.partitions: List[Deque[Any]] = [deque() for _ in range(partitions)]
+        # Monotonic time before which a durable lane waits after a failure
+        self.paused_until = 0.0
+        self.failures = 0
+
+    def __len__(self) -> int:
+        return sum(map(len, self.partitions))
+
+    def should_shed(self) -> bool:
+        """
+        Decide whether to drop a new event because the lane is under pressure.
+
+        Returns:
+            True if the event should be dropped.
+        """
+        threshold = self.shed_threshold
+        if threshold is None or self.durable:
+            return False
+        fill = len(self) / self.max_buffer_size
+        if fill <= threshold:
+            return False
+        return random.random() < (fill - threshold) / (1.0 - threshold)
+
+
+class _ThreadBuffer:
+    """
+    Events enqueued by one producer thread, waiting to be merged into lanes.
+
+    Only the owning thread appends and only the merging worker pops, so the
+    producer's fast path touches no lock shared with other producers.
+    """
+
+    __slots__ = ("events", "enqueued", "round_robin", "thread")
+
+    def __init__(self, thread: threading.Thread):
+        self.events: Deque[Tuple[Lane, int, Any]] = deque()
+        # Events ever enqueued by this thread; written by the owner only
+        self.enqueued = 0
+        self.round_robin = 0
+        self.thread = thread
+
+
+class SenderPool:
+    """
+    Pool of background worker threads that drain buffered events in batches.
+
+    Events are buffered in lanes. Each worker repeatedly takes a batch from
+    the highest-priority lane that is ready and hands it to that lane's
+    ``send_batch``. Workers send concurrently over the client's pooled
+    connections, so throughput scales with the number of workers until the
+    server or the network becomes the bottleneck.
+
+    With ``ordering="trace_id"`` each lane has one partition per worker and
+    events are routed by a hash of their key, so the events of a trace
+    enqueued from one thread are never reordered.
+
+    Producers append to a buffer private to their thread, so enqueueing
+    takes no lock shared with other producers. Workers merge the per-thread
+    buffers into the lanes every ``merge_interval`` seconds, and a producer
+    merges on its own once it has a full batch pending.
+    """
+
+    def __init__(
+        self,
+        send_batch: Callable[[List[Any]], Any],
+        workers: int = 4,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        max_buffer_size: int = 100_000,
+        ordering: Ordering = "none",
+        metrics: Optional[Metrics] = None,
+        name: str = "default",
+        merge_interval: float = 0.05,
+    ):
+        """
+        Initialize the sender pool. Workers are started lazily.
+
+        Args:
+            send_batch: Callable that sends a list of events from the
+                        default lane.
+            workers: Number of worker threads.
+            batch_size: Maximum number of events per batch.
+            flush_interval: Maximum time an event waits for its batch to fill,
+                            in seconds.
+            max_buffer_size: Maximum number of events buffered in the default
+                             lane before new ones are dropped.
+            ordering: ``"none"`` or ``"trace_id"``. See ``Ordering``.
+            metrics: Metrics registry to record sender activity into.
+            name: Name of the default lane.
+            merge_interval: Maximum time an event waits in its producer
+                            thread's buffer before workers see it, in seconds.
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if ordering not in ("none", "trace_id"):
+            raise ValueError(f"Unknown ordering: {ordering!r}")
+
+        self.workers = workers
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.ordering = ordering
+        self.metrics = metrics or Metrics()
+        self.default_lane = name
+        self.merge_interval = merge_interval
+
+        self._partitions = workers if ordering == "trace_id" else 1
+        # One condition per partition index, shared by every lane, so a worker
+        # waiting for any of its lanes is woken by an event on any of them.
+        self._conditions = [threading.Condition() for _ in range(self._partitions)]
+        self._lanes: Dict[str, Lane] = {}
+        # Lanes in the order workers consider them, highest priority first
+        self._schedule: Tuple[Lane, ...] = ()
+        self._flushing = False
+
+        self._local = threading.local()
+        self._buffers: Tuple[_ThreadBuffer, ...] = ()
+        self._merge_lock = threading.Lock()
+        # Events enqueued by threads whose buffers have been retired
+        self._retired = 0
+
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._completed = 0
+        self._idle = threading.Condition(self._lock)
+        self._closed = False
+
+        self.add_lane(name, send_batch, max_buffer_size=max_buffer_size)
+
+    def add_lane(
+        self,
+        name: str,
+        send_batch: Callable[[List[Any]], Any],
+        priority: int = 0,
+        weight: int = 1,
+        max_buffer_size: int = 100_000,
+        durable: bool = False,
+        shed_threshold: Optional[float] = None,
+    ) -> Lane:
+        """
+        Add a lane of events with its own sender and delivery guarantees.
+
+        Args:
+            name: The lane name.
+            send_batch: Callable that sends a list of events from the lane.
+            priority: Lanes with a higher priority are served first.
+            weight: Batches the lane may send back to back while
+                    lower-priority lanes wait.
+            max_buffer_size: Maximum number of buffered events.
+            durable: Whether the lane never drops events. See ``Lane``.
+            shed_threshold: Fill fraction above which new events are shed.
+
+        Returns:
+            The new lane.
+        """
+        if name in self._lanes:
+            raise ValueError(f"Lane {name!r} already exists")
+        lane = Lane(
+            name,
+            send_batch,
+            partitions=self._partitions,
+            priority=priority,
+            weight=weight,
+            max_buffer_size=max_buffer_size,
+            durable=durable,
+            shed_threshold=shed_threshold,
+        )
+        self._lanes[name] = lane
+        self._schedule = tuple(
+            sorted(self._lanes.values(), key=lambda lane: -lane.priority)
+        )
+        return lane
+
+    def lane(self, name: str) -> Lane:
+        """
+        Get a lane by name.
+
+        Args:
+            name: The lane name.
+
+        Returns:
+            The lane.
+
+        Raises:
+            KeyError: If there is no such lane.
+        """
+        return self._lanes[name]
+
+    def start(self) -> None:
+        """Start the worker threads if they are not already running."""
+        with self._lock:
+            if self._threads or self._closed:
+                return
+            for index in range(self.workers):
+                thread = threading.Thread(
+                    target=self._run,
+                    args=(index % self._partitions,),
+                    name=f"teer-sender-{index}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def enqueue(
+        self, event: Any, key: Optional[str] = None, lane: Optional[str] = None
+    ) -> bool:
+        """
+        Buffer an event for sending.
+
+        Events for a durable lane block while the lane is full rather than
+        being dropped.
+
+        Args:
+            event: The event to send.
+            key: Ordering key, used when ``ordering="trace_id"``.
+            lane: The lane to buffer the event in. Defaults to the default lane.
+
+        Returns:
+            True if the event was buffered, False if it was dropped.
+        """
+        if self._closed:
+            raise RuntimeError("Cannot enqueue events on a closed sender")
+        if not self._threads:
+            self.start()
+        target = self._lanes[lane or self.default_lane]
+
+        if target.shed_threshold is not None and target.should_shed():
+            self._count(target, "shed")
+            return False
+
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            buffer = self._register_thread()
+
+        partitions = self._partitions
+        if partitions == 1:
+            index = 0
+        elif key is None or self.ordering != "trace_id":
+            buffer.round_robin += 1
+            index = buffer.round_robin % partitions
+        else:
+            index = hash(key) % partitions
+
+        events = buffer.events
+        if len(target) + len(events) >= target.max_buffer_size:
+            if not target.durable or not self._wait_for_space(target, index):
+                self._count(target, "dropped")
+                logger.warning(f"Teer {target.name} buffer is full, dropping event")
+                return False
+
+        events.append((target, index, event))
+        buffer.enqueued += 1
+        if len(events) >= self.batch_size:
+            self._merge()
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Send all buffered events and wait for them to complete.
+
+        Args:
+            timeout: Maximum time to wait, in seconds. Waits forever if None.
+
+        Returns:
+            True if every buffered event was sent (or failed), False on timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self._merge()
+        self._wake(flushing=True)
+        try:
+            with self._idle:
+                while self._enqueued() > self._completed:
+                    remaining = self.merge_interval
+                    if deadline is not None:
+                        remaining = min(remaining, deadline - time.monotonic())
+                        if remaining <= 0:
+                            return False
+                    self._idle.wait(remaining)
+            return True
+        finally:
+            self._wake(flushing=False)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Flush buffered events and stop the worker threads.
+
+        Args:
+            timeout: Maximum time to wait for the flush, in seconds.
+
+        Returns:
+            True if every buffered event was sent before closing.
+        """
+        if self._closed:
+            return True
+        flushed = self.flush(timeout) if self._threads else True
+        self._closed = True
+        self._wake()
+        for thread in self._threads:
+            thread.join(timeout)
+        for lane in self._schedule:
+            if lane.durable and len(lane):
+                logger.error(
+                    f"Closed with {len(lane)} undelivered events in the "
+                    f"{lane.name} lane"
+                )
+        return flushed
+
+    def _wake(self, flushing: Optional[bool] = None) -> None:
+        """Update the flush flag and wake every waiting worker."""
+        if flushing is not None:
+            self._flushing = flushing
+        for condition in self._conditions:
+            with condition:
+                condition.notify_all()
+
+    def _take(
+        self, partition: int, streaks: Dict[str, int]
+    ) -> Tuple[Optional[Lane], List[Any]]:
+        """
+        Take the next batch for a worker.
+
+        Blocks until some lane has a full batch, ``flush_interval`` elapses, or
+        a flush or close is requested, whichever comes first.
+        """
+        condition = self._conditions[partition]
+        batch_size = self.batch_size
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            self._merge()
+            with condition:
+                now = time.monotonic()
+                expired = now >= deadline or self._flushing or self._closed
+                wait_until = min(deadline, now + self.merge_interval)
+                ready = []
+                for lane in self._schedule:
+                    events = lane.partitions[partition]
+                    if not events:
+                        continue
+                    if lane.paused_until > now:
+                        wait_until = min(wait_until, lane.paused_until)
+                        continue
+                    if expired or len(events) >= batch_size:
+                        ready.append(lane)
+
+                if ready:
+                    lane = self._pick(ready, streaks)
+                    events = lane.partitions[partition]
+                    count = min(batch_size, len(events))
+                    batch = [events.popleft() for _ in range(count)]
+                    if lane.durable:
+                        # Wake producers blocked on a full lane
+                        condition.notify_all()
+                    return lane, batch
+                if self._closed or now >= deadline:
+                    return None, []
+                condition.wait(max(wait_until - now, 0.001))
+
+    @staticmethod
+    def _pick(ready: List[Lane], streaks: Dict[str, int]) -> Lane:
+        """Pick a lane by priority, yielding after ``weight`` batches in a row."""
+        lane = ready[0]
+        if len(ready) > 1 and streaks.get(lane.name, 0) >= lane.weight:
+            lane = ready[1]
+        for name in list(streaks):
+            if name != lane.name:
+                streaks[name] = 0
+        streaks[lane.name] = streaks.get(lane.name, 0) + 1
+        return lane
+
+    def _run(self, partition: int) -> None:
+        streaks: Dict[str, int] = {}
+        while True:
+            lane, batch = self._take(partition, streaks)
+            if lane is None:
+                if self._closed:
+                    return
+                continue
+            try:
+                lane.send_batch(batch)
+            except Exception as e:
+                failed, error = batch, e
+                if isinstance(e, PartialFailure):
+                    failed, error = e.events, e.error
+                    sent = len(batch) - len(failed)
+                    self._count(lane, "sent", sent)
+                    self._done(sent)
+                if lane.durable and not self._closed and not is_permanent_error(error):
+                    self._retry_later(lane, partition, failed, error)
+                    continue
+                self._count(lane, "failed", len(failed))
+                logger.error(
+                    f"Failed to send batch of {len(failed)} events: {str(error)}"
+                )
+                self._done(len(failed))
+            else:
+                lane.failures = 0
+                self._count(lane, "sent", len(batch))
+                self._done(len(batch))
+
+    def _retry_later(
+        self, lane: Lane, partition: int, batch: List[Any], error: Exception
+    ) -> None:
+        """Put a failed batch back at the front of its lane and pause the lane."""
+        lane.failures += 1
+        delay = min(0.5 * (2 ** (lane.failures - 1)), MAX_RETRY_BACKOFF)
+        logger.warning(
+            f"Failed to send batch of {len(batch)} {lane.name} events, "
+            f"retrying in {delay:.1f}s: {str(error)}"
+        )
+        self._count(lane, "retried", len(batch))
+        condition = self._conditions[partition]
+        with condition:
+            lane.partitions[partition].extendleft(reversed(batch))
+            lane.paused_until = time.monotonic() + delay
+            condition.notify_all()
+
+    def _count(self, lane: Lane, name: str, value: int = 1) -> None:
+        metrics = self.metrics
+        metrics.increment(f"sender.{name}", value)
+        metrics.increment(f"sender.{lane.name}.{name}", value)
+
+    def _register_thread(self) -> _ThreadBuffer:
+        """Create the calling thread's private buffer."""
+        buffer = _ThreadBuffer(threading.current_thread())
+        self._local.buffer = buffer
+        with self._lock:
+            self._buffers = self._buffers + (buffer,)
+        return buffer
+
+    def _merge(self) -> None:
+        """Move events from the per-thread buffers into their lanes."""
+        if not self._merge_lock.acquire(blocking=False):
+            # Another thread is merging; it will pick these events up.
+            return
+        try:
+            merged: Dict[Lane, int] = {}
+            touched = set()
+            retired = []
+            for buffer in self._buffers:
+                events = buffer.events
+                # Producers only append, so draining from the left is safe
+                while events:
+                    lane, index, event = events.popleft()
+                    lane.partitions[index].append(event)
+                    merged[lane] = merged.get(lane, 0) + 1
+                    touched.add(index)
+                if not buffer.thread.is_alive() and not events:
+                    retired.append(buffer)
+            if retired:
+                with self._lock:
+                    # Count the retired events before dropping their buffers
+                    # so a concurrent flush never sees too few enqueued.
+                    self._retired += sum(b.enqueued for b in retired)
+                    self._buffers = tuple(
+                        b for b in self._buffers if b not in retired
+                    )
+        finally:
+            self._merge_lock.release()
+
+        for lane, count in merged.items():
+            self._count(lane, "enqueued", count)
+        for index in touched:
+            condition = self._conditions[index]
+            with condition:
+                condition.notify_all()
+
+    def _wait_for_space(self, lane: Lane, index: int) -> bool:
+        """Block until a durable lane has room. Returns False if closed."""
+        condition = self._conditions[index]
+        while True:
+            self._merge()
+            with condition:
+                if len(lane) < lane.max_buffer_size:
+                    return True
+                if self._closed:
+                    return False
+                condition.wait(0.1)
+
+    def _enqueued(self) -> int:
+        """Count every event ever enqueued, across all producer threads."""
+        return self._retired + sum(b.enqueued for b in self._buffers)
+
+    def _done(self, count: int) -> None:
+        with self._idle:
+            self._completed += count
+            self._idle.notify_all()
@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+import functools
+import logging
+import time
+from typing import Any, Callable, Optional, TypeVar, TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    from . import TeerClient
+    from .tenants import TeerClientPool
+
+logger = logging.getLogger("teer")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _remaining_seconds(context: Any) -> Optional[float]:
+    """Get the time left in an invocation from a Lambda-style context."""
+    get_remaining = getattr(context, "get_remaining_time_in_millis", None)
+    if get_remaining is None:
+        return None
+    try:
+        return get_remaining() / 1000.0
+    except Exception:
+        return None
+
+
+def handler(
+    client: Union["TeerClient", "TeerClientPool"],
+    flush_timeout: float = 2.0,
+    safety_margin: float = 0.2,
+) -> Callable[[F], F]:
+    """
+    Wrap a serverless handler so buffered events are sent before it returns.
+
+    Platforms such as AWS Lambda freeze the process between invocations, so
+    events left in the background sender are delayed until the next
+    invocation or lost when the instance is recycled. The wrapper flushes
+    the client after every invocation, with all sender workers delivering
+    partial batches in parallel. The flush is bounded by ``flush_timeout``
+    and by the time the invocation has left, minus ``safety_margin``.
+
+    Usage:
+        from teer.serverless import handler
+
+        client = TeerClient(serverless=True)
+
+        @handler(client)
+        def lambda_handler(event, context):
+            client.ingest.enqueue({...})
+            return {"statusCode": 200}
+
+    Args:
+        client: The client (or client pool) to flush.
+        flush_timeout: Maximum time to spend flushing, in seconds.
+        safety_margin: Time to leave the platform before its deadline, in
+                       seconds, when the context reports one.
+
+    Returns:
+        A decorator for the handler.
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(
+            event: Any, context: Any = None, *args: Any, **kwargs: Any
+        ) -> Any:
+            started = time.perf_counter()
+            try:
+                return func(event, context, *args, **kwargs)
+            finally:
+                _flush(client, context, flush_timeout, safety_margin, started)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def _flush(
+    client: Union["TeerClient", "TeerClientPool"],
+    context: Any,
+    flush_timeout: float,
+    safety_margin: float,
+    started: float,
+) -> None:
+    budget = flush_timeout
+    remaining = _remaining_seconds(context)
+    if remaining is not None:
+        budget = min(budget, max(remaining - safety_margin, 0.0))
+
+    flush_started = time.perf_counter()
+    flushed = client.flush(budget)
+    finished = time.perf_counter()
+
+    metrics = client.metrics
+    metrics.increment("serverless.invocations")
+    metrics.set_gauge("serverless.flush_seconds", finished - flush_started)
+    metrics.set_gauge("serverless.invocation_seconds", finished - started)
+    if not flushed:
+        metrics.increment("serverless.flush_timeouts")
+        logger.warning(
+            f"Buffered Teer events were not all sent within {budget:.2f}s; "
+            f"they will be sent during the next invocation"
+        )
@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into a single call.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for it and get the same result, or the same exception.
+    Once the call finishes the key is forgotten, so later callers run the
+    function again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, "Future[Any]"] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run ``fn``, or wait for the call already in flight for ``key``.
+
+        Args:
+            key: Identifies calls that may share a result.
+            fn: The function to run.
+
+        Returns:
+            The result, and whether it was shared from another caller's call.
+
+        Raises:
+            Exception: Whatever ``fn`` raised.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result(), True
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                del self._calls[key]
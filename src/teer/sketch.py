@@ -0,0 +1,380 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+import atexit
+import logging
+import math
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+from .defaults import DefaultedEvent
+from .processors import EventProcessor
+from .types import IngestPayload
+
+if TYPE_CHECKING:
+    from . import TeerClient
+
+logger = logging.getLogger("teer")
+
+
+class DDSketch:
+    """
+    A mergeable quantile sketch with relative accuracy guarantees.
+
+    Values are counted in logarithmically sized bins, so every quantile is
+    returned to within ``relative_accuracy`` of the exact value, whatever
+    the distribution. Sketches with the same accuracy merge exactly. When
+    there are more than ``max_bins`` bins the lowest ones are collapsed,
+    trading accuracy for the smallest values for bounded memory.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Relative error of returned quantiles, between
+                               0 and 1.
+            max_bins: Maximum number of bins kept.
+        """
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float, count: int = 1) -> None:
+        """
+        Add a non-negative value.
+
+        Args:
+            value: The value.
+            count: How many times to add it.
+        """
+        if value < 0:
+            raise ValueError("DDSketch only accepts non-negative values")
+        if value == 0:
+            self.zero_count += count
+        else:
+            index = math.ceil(math.log(value) / self._log_gamma)
+            bins = self.bins
+            bins[index] = bins.get(index, 0) + count
+            if len(bins) > self.max_bins:
+                self._collapse()
+        self.count += count
+        self.sum += value * count
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "DDSketch") -> None:
+        """
+        Add every value of another sketch with the same accuracy.
+
+        Args:
+            other: The sketch to merge in.
+        """
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge sketches with different accuracies")
+        for index, count in other.bins.items():
+            self.bins[index] = self.bins.get(index, 0) + count
+        if len(self.bins) > self.max_bins:
+            self._collapse()
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile.
+
+        Args:
+            q: The quantile, from 0 to 1, e.g. 0.99 for p99.
+
+        Returns:
+            The estimated value, or None if the sketch is empty.
+        """
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if seen > rank:
+            return 0.0
+        for index in sorted(self.bins):
+            seen += self.bins[index]
+            if seen > rank:
+                value = 2 * self.gamma**index / (self.gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the sketch to JSON-compatible values.
+
+        Returns:
+            The accuracy, counts and sorted ``[index, count]`` bins.
+        """
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "zero_count": self.zero_count,
+            "bins": [[index, self.bins[index]] for index in sorted(self.bins)],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DDSketch":
+        """
+        Rebuild a sketch serialized with ``to_dict``.
+
+        Args:
+            data: The serialized sketch.
+
+        Returns:
+            The sketch.
+        """
+        sketch = cls(data["relative_accuracy"])
+        sketch.bins = {int(index): count for index, count in data["bins"]}
+        sketch.zero_count = data["zero_count"]
+        sketch.count = data["count"]
+        sketch.sum = data["sum"]
+        if sketch.count:
+            sketch.min = data["min"]
+            sketch.max = data["max"]
+        return sketch
+
+    def _collapse(self) -> None:
+        """Fold the lowest bins into one until within ``max_bins``."""
+        indexes = sorted(self.bins)
+        excess = len(indexes) - self.max_bins + 1
+        target = indexes[excess]
+        self.bins[target] += sum(self.bins.pop(i) for i in indexes[:excess])
+
+
+# Events are summarized per provider, model, function, rate card and whether
+# they were batch requests, which are priced differently
+SummaryKey = Tuple[str, str, Optional[str], Optional[str], bool]
+
+
+class _Summary:
+    """Exact sums and token sketches of one dimension over one interval."""
+
+    __slots__ = ("input", "output", "usage")
+
+    def __init__(self, relative_accuracy: float):
+        self.input = DDSketch(relative_accuracy)
+        self.output = DDSketch(relative_accuracy)
+        self.usage: Dict[str, Any] = {}
+
+
+def _add_numbers(target: Dict[str, Any], source: Dict[str, Any]) -> None:
+    """Add every number in ``source`` into ``target``, recursing into dicts."""
+    for key, value in source.items():
+        if isinstance(value, dict):
+            _add_numbers(target.setdefault(key, {}), value)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            target[key] = target.get(key, 0) + value
+
+
+def _timestamp(seconds: float) -> str:
+    return datetime.fromtimestamp(seconds, timezone.utc).isoformat()
+
+
+class SketchAggregator(EventProcessor):
+    """
+    Replaces per-call ingest events with per-interval summaries.
+
+    Once per interval, one summary event is sent per provider, model,
+    function, rate card and batch flag. Its ``usage`` holds the exact sums
+    of the interval and its ``summary`` holds DDSketches of the input and
+    output tokens per call, read back with ``summary_quantiles``.
+
+    The aggregator is an event processor: register it with
+    ``client.add_processor``, after any processor that must see individual
+    events. Events it summarizes are dropped from the regular send path.
+    Call ``start`` to ship summaries every ``interval`` seconds in the
+    background, or ``flush`` to ship them now; ``client.flush`` and
+    ``client.close`` ship them too. Summaries are buffered into the client's
+    sender like enqueued events.
+
+    Per-call attribution, such as ``trace_id`` or ``metadata``, is not kept.
+    Sampled events, which stand for ``1 / sample_rate`` events each, are
+    sent as they are so that the summed usage stays exact; register the
+    aggregator before any sampler to summarize every event.
+    """
+
+    def __init__(
+        self,
+        client: "TeerClient",
+        interval: float = 60.0,
+        relative_accuracy: float = 0.01,
+        functions: Optional[Iterable[str]] = None,
+    ):
+        """
+        Initialize the aggregator.
+
+        Args:
+            client: The client to ship summaries through.
+            interval: Seconds between summaries.
+            relative_accuracy: Relative error of the percentiles.
+            functions: Only summarize these function IDs. Summarizes every
+                       event if None.
+        """
+        self.client = client
+        self.interval = interval
+        self.relative_accuracy = relative_accuracy
+        self.functions = frozenset(functions) if functions is not None else None
+        self._summaries: Dict[SummaryKey, _Summary] = {}
+        self._started = time.time()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def process(self, event: IngestPayload) -> Optional[IngestPayload]:
+        if event.get("summary") is not None or event.get("sample_rate", 1.0) < 1.0:
+            return event
+        function_id = event.get("function_id")
+        if self.functions is not None and function_id not in self.functions:
+            return event
+        self.record(event)
+        return None
+
+    def record(self, event: IngestPayload) -> None:
+        """
+        Add an event to the current interval's summary.
+
+        Args:
+            event: The ingest payload.
+        """
+        platform = event.get("platform") or {}
+        key = (
+            event.get("provider", ""),
+            event.get("model", ""),
+            event.get("function_id"),
+            platform.get("rate_card_id"),
+            bool(event.get("batch")),
+        )
+        usage = event.get("usage") or {}
+        with self._lock:
+            summary = self._summaries.get(key)
+            if summary is None:
+                summary = self._summaries[key] = _Summary(self.relative_accuracy)
+            summary.input.add(usage.get("input", 0))
+            summary.output.add(usage.get("output", 0))
+            _add_numbers(summary.usage, usage)  # type: ignore[arg-type]
+
+    def flush(self) -> int:
+        """
+        Ship the current interval's summaries.
+
+        Returns:
+            The number of summary events buffered.
+        """
+        ended = time.time()
+        with self._lock:
+            summaries, self._summaries = self._summaries, {}
+            started, self._started = self._started, ended
+        if not summaries:
+            return 0
+
+        sender = self.client.sender
+        defaults = self.client.ingest.defaults
+        events = 0
+        for key, summary in summaries.items():
+            payload = self._payload(key, summary, started, ended)
+            event = payload if defaults is None else DefaultedEvent(payload, defaults)
+            events += sender.enqueue(event)
+        self.client.metrics.increment("sketch.summaries", events)
+        self.client.metrics.increment(
+            "sketch.events", sum(s.input.count for s in summaries.values())
+        )
+        return events
+
+    def start(self) -> None:
+        """Ship summaries every ``interval`` seconds in a background thread."""
+        if self._thread is not None:
+            return
+        # Create the sender first: exit handlers run in reverse order, so the
+        # last summaries are shipped before the sender is closed.
+        self.client.sender
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="teer-sketch", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def close(self) -> None:
+        """Stop the background thread and ship the last summaries."""
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Failed to ship usage summaries: {str(e)}")
+
+    def _payload(
+        self, key: SummaryKey, summary: _Summary, started: float, ended: float
+    ) -> IngestPayload:
+        provider, model, function_id, rate_card_id, batch = key
+        payload: Dict[str, Any] = {
+            "provider": provider,
+            "model": model,
+            "usage": summary.usage,
+            "summary": {
+                "count": summary.input.count,
+                "start": _timestamp(started),
+                "end": _timestamp(ended),
+                "input": summary.input.to_dict(),
+                "output": summary.output.to_dict(),
+            },
+        }
+        if function_id is not None:
+            payload["function_id"] = function_id
+        if rate_card_id is not None:
+            payload["platform"] = {"rate_card_id": rate_card_id}
+        if batch:
+            payload["batch"] = True
+        return payload  # type: ignore[return-value]
+
+
+def summary_quantiles(
+    payload: Dict[str, Any], quantiles: Iterable[float] = (0.5, 0.99)
+) -> Dict[str, List[Optional[float]]]:
+    """
+    Read percentiles back from a summary event.
+
+    Args:
+        payload: A summary event shipped by ``SketchAggregator``.
+        quantiles: The quantiles to read.
+
+    Returns:
+        The input and output token quantiles, in the order requested.
+    """
+    summary = payload["summary"]
+    quantiles = list(quantiles)
+    return {
+        name: [DDSketch.from_dict(summary[name]).quantile(q) for q in quantiles]
+        for name in ("input", "output")
+    }
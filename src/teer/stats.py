@@ -0,0 +1,222 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+import threading
+import time
+from typing import Dict, List, Literal, Optional, Tuple
+
+from .pricing import usage_tokens
+from .processors import EventProcessor
+from .types import IngestPayload
+
+# What a rate counts
+StatsMeasure = Literal["tokens", "input", "output", "events"]
+
+# Slot columns: events, uncached input, output, cache read, cache write
+_EVENTS, _INPUT, _OUTPUT, _CACHE_READ, _CACHE_WRITE = range(5)
+_COLUMNS = 5
+
+# Events of functions and models beyond ``max_keys`` are aggregated here
+OTHER = "__other__"
+
+StatsKey = Tuple[Optional[str], Optional[str]]
+
+
+class _Ring:
+    """Per-second usage aggregates of one function and model."""
+
+    __slots__ = ("seconds", "slots", "lock")
+
+    def __init__(self, size: int):
+        self.seconds = [-1] * size
+        self.slots = [[0.0] * _COLUMNS for _ in range(size)]
+        self.lock = threading.Lock()
+
+    def add(self, second: int, values: Tuple[int, int, int, int]) -> None:
+        index = second % len(self.seconds)
+        with self.lock:
+            slot = self.slots[index]
+            if self.seconds[index] != second:
+                # The slot last held a second that has left the ring
+                self.seconds[index] = second
+                slot[:] = (0.0, 0.0, 0.0, 0.0, 0.0)
+            slot[_EVENTS] += 1
+            slot[_INPUT] += values[0]
+            slot[_OUTPUT] += values[1]
+            slot[_CACHE_READ] += values[2]
+            slot[_CACHE_WRITE] += values[3]
+
+    def sum(self, oldest: int, newest: int, totals: List[float]) -> None:
+        size = len(self.seconds)
+        seconds = self.seconds
+        with self.lock:
+            # Only the slots of the window, not the whole horizon
+            for second in range(oldest, newest + 1):
+                index = second % size
+                if seconds[index] == second:
+                    slot = self.slots[index]
+                    for column in range(_COLUMNS):
+                        totals[column] += slot[column]
+
+
+class UsageStats(EventProcessor):
+    """
+    Live per-second usage of outgoing ingest events, kept in process.
+
+    Enable it with ``TeerClient(stats=UsageStats())`` and read it through
+    ``client.stats``. It runs as an event processor right after any
+    deduplicator, so it sees every event the application reports, before
+    sampling or other processors drop any.
+
+    Each function and model gets a ring buffer of per-second aggregates
+    covering the last ``horizon`` seconds, so memory is fixed: at most
+    ``max_keys`` rings of ``horizon`` slots. Recording an event touches one
+    slot. Reading a window only visits the rings of the requested function,
+    which are indexed by function ID, and sums ``window`` slots of each.
+    """
+
+    def __init__(self, horizon: int = 300, max_keys: int = 1024):
+        """
+        Initialize the stats.
+
+        Args:
+            horizon: Longest window that can be read, in seconds.
+            max_keys: Maximum number of function and model combinations
+                      tracked separately. Further ones are aggregated under
+                      ``OTHER``.
+        """
+        if horizon < 1:
+            raise ValueError("horizon must be at least 1 second")
+        self.horizon = horizon
+        self.max_keys = max_keys
+        self._rings: Dict[StatsKey, _Ring] = {}
+        # The same rings by function ID, then model
+        self._functions: Dict[Optional[str], Dict[Optional[str], _Ring]] = {}
+        self._lock = threading.Lock()
+
+    def process(self, event: IngestPayload) -> Optional[IngestPayload]:
+        self.record(event)
+        return event
+
+    def record(self, event: IngestPayload) -> None:
+        """
+        Add an event's usage to the current second.
+
+        Args:
+            event: The ingest payload.
+        """
+        key = (event.get("function_id"), event.get("model"))
+        ring = self._rings.get(key)
+        if ring is None:
+            ring = self._ring(key)
+        values = usage_tokens(event.get("provider", ""), event.get("usage") or {})
+        ring.add(int(time.monotonic()), values)
+
+    def rate(
+        self,
+        function_id: Optional[str] = None,
+        window: int = 60,
+        model: Optional[str] = None,
+        measure: StatsMeasure = "tokens",
+    ) -> float:
+        """
+        Get the average rate over the last ``window`` seconds.
+
+        Args:
+            function_id: Only count this function. Counts all if None.
+            window: The window, in seconds, at most ``horizon``.
+            model: Only count this model. Counts all if None.
+            measure: ``"tokens"`` for all tokens including cached ones,
+                     ``"input"`` for input tokens including cached ones,
+                     ``"output"`` for output tokens, or ``"events"``.
+
+        Returns:
+            The per-second rate.
+        """
+        totals = self._totals(function_id, model, window)
+        if measure == "events":
+            value = totals[_EVENTS]
+        elif measure == "output":
+            value = totals[_OUTPUT]
+        elif measure == "input":
+            value = totals[_INPUT] + totals[_CACHE_READ] + totals[_CACHE_WRITE]
+        elif measure == "tokens":
+            value = sum(totals[_INPUT:])
+        else:
+            raise ValueError(f"Unknown stats measure: {measure!r}")
+        return value / window
+
+    def cache_hit_ratio(
+        self,
+        function_id: Optional[str] = None,
+        window: int = 60,
+        model: Optional[str] = None,
+    ) -> Optional[float]:
+        """
+        Get the fraction of input tokens read from the provider's prompt cache.
+
+        Cache reads come from Anthropic's ``cache_read_input_tokens``,
+        OpenAI's ``input_cached_tokens`` and Google's
+        ``cached_content_token_count``.
+
+        Args:
+            function_id: Only count this function. Counts all if None.
+            window: The window, in seconds, at most ``horizon``.
+            model: Only count this model. Counts all if None.
+
+        Returns:
+            The ratio, or None if there was no input in the window.
+        """
+        totals = self._totals(function_id, model, window)
+        input_tokens = totals[_INPUT] + totals[_CACHE_READ] + totals[_CACHE_WRITE]
+        if not input_tokens:
+            return None
+        return totals[_CACHE_READ] / input_tokens
+
+    def keys(self) -> List[StatsKey]:
+        """
+        Get the function and model combinations seen so far.
+
+        Returns:
+            (function_id, model) pairs.
+        """
+        return list(self._rings)
+
+    def _ring(self, key: StatsKey) -> _Ring:
+        with self._lock:
+            ring = self._rings.get(key)
+            if ring is None:
+                if len(self._rings) >= self.max_keys:
+                    key = (OTHER, OTHER)
+                    ring = self._rings.get(key)
+                if ring is None:
+                    ring = self._rings[key] = _Ring(self.horizon)
+                    function_id, model = key
+                    self._functions.setdefault(function_id, {})[model] = ring
+        return ring
+
+    def _totals(
+        self, function_id: Optional[str], model: Optional[str], window: int
+    ) -> List[float]:
+        if not 1 <= window <= self.horizon:
+            raise ValueError(f"window must be between 1 and {self.horizon} seconds")
+        newest = int(time.monotonic())
+        oldest = newest - window + 1
+        if function_id is None:
+            rings = [
+                ring
+                for (_, ring_model), ring in list(self._rings.items())
+                if model is None or ring_model == model
+            ]
+        else:
+            models = self._functions.get(function_id) or {}
+            if model is None:
+                rings = list(models.values())
+            else:
+                ring = models.get(model)
+                rings = [ring] if ring is not None else []
+        totals = [0.0] * _COLUMNS
+        for ring in rings:
+            ring.sum(oldest, newest, totals)
+        return totals
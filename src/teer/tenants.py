@@ -0,0 +1,309 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+import atexit
+import logging
+import threading
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+)
+
+from .hooks import Hook
+from .metrics import Metrics
+from .sender import EXIT_FLUSH_TIMEOUT, Ordering, PartialFailure, SenderPool
+from .transports import HTTPTransport, Transport
+
+if TYPE_CHECKING:
+    from . import TeerClient
+
+logger = logging.getLogger("teer")
+
+
+class _TenantSender:
+    """
+    A tenant's view of the pool's shared sender.
+
+    Events are tagged with the tenant's API key so the shared workers know
+    whose credentials to send them with.
+    """
+
+    def __init__(self, api_key: str, shared: SenderPool):
+        self.api_key = api_key
+        self.shared = shared
+
+    def enqueue(
+        self, event: Any, key: Optional[str] = None, lane: Optional[str] = None
+    ) -> bool:
+        return self.shared.enqueue((self.api_key, event), key, lane=lane)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        return self.shared.flush(timeout)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        # The shared sender outlives any one tenant; the pool closes it.
+        return self.shared.flush(timeout)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.shared, name)
+
+
+def _group(batch: List[Tuple[str, Any]]) -> Dict[str, List[Any]]:
+    """Group tagged events by API key, keeping their order."""
+    groups: Dict[str, List[Any]] = {}
+    for api_key, event in batch:
+        groups.setdefault(api_key, []).append(event)
+    return groups
+
+
+class TeerClientPool:
+    """
+    Clients for many Teer accounts sharing one set of connections and workers.
+
+    Platforms that report usage on behalf of many accounts get one
+    ``TeerClient`` per API key from ``client(api_key)``. Every tenant client
+    sends through the same transport and buffers into the same sender pool,
+    so the number of connections and threads does not grow with the number
+    of tenants. Buffered events are tagged with their tenant and sent with
+    that tenant's credentials.
+
+    Tenant clients, with their auth headers and metrics, are created on
+    first use and the least recently used ones are evicted beyond
+    ``max_tenants``. Evicting a tenant never loses its buffered events; its
+    client is simply recreated when they are sent.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        track_url: Optional[str] = None,
+        api_version: str = "v1",
+        max_tenants: int = 1024,
+        hooks: Optional[Iterable[Hook]] = None,
+        max_retries: int = 2,
+        sender_workers: int = 4,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        ordering: Ordering = "none",
+        transport: Optional[Transport] = None,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            base_url: The base URL for the Teer API. Defaults to the
+                      ``TeerClient`` default.
+            track_url: The base URL for tracking endpoints. Defaults to the
+                       ``TeerClient`` default.
+            api_version: The API version to use. Defaults to v1.
+            max_tenants: Maximum number of tenant clients kept alive.
+            hooks: Optional request lifecycle hooks, shared by every tenant.
+            max_retries: How many times to retry throttled requests.
+            sender_workers: Number of background threads shared by all tenants.
+            batch_size: Maximum number of buffered events per request.
+            flush_interval: Maximum time a buffered event waits for its batch
+                           to fill, in seconds.
+            ordering: ``"trace_id"`` or ``"none"``. See ``teer.sender.Ordering``.
+            transport: Optional transport shared by every tenant. Defaults to
+                       pooled HTTP.
+        """
+        if max_tenants < 1:
+            raise ValueError("max_tenants must be at least 1")
+        self.max_tenants = max_tenants
+        self.metrics = Metrics()
+        self.transport = transport or HTTPTransport(
+            pool_maxsize=max(10, sender_workers)
+        )
+
+        self._client_options: Dict[str, Any] = {
+            "api_version": api_version,
+            "hooks": list(hooks or ()),
+            "max_retries": max_retries,
+            "transport": self.transport,
+        }
+        if base_url is not None:
+            self._client_options["base_url"] = base_url
+        if track_url is not None:
+            self._client_options["track_url"] = track_url
+
+        self._sender_options = {
+            "workers": sender_workers,
+            "batch_size": batch_size,
+            "flush_interval": flush_interval,
+            "ordering": ordering,
+        }
+        self._clients: "OrderedDict[str, TeerClient]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._sender: Optional[SenderPool] = None
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __contains__(self, api_key: str) -> bool:
+        return api_key in self._clients
+
+    @staticmethod
+    def is_tenant_client(client: "TeerClient") -> bool:
+        """
+        Check whether a client belongs to a pool.
+
+        Tenant clients buffer their events into the pool's shared sender,
+        tagged with their API key, rather than into a sender of their own.
+
+        Args:
+            client: The client.
+
+        Returns:
+            True if the client was created by a ``TeerClientPool``.
+        """
+        return isinstance(client.sender, _TenantSender)
+
+    def client(self, api_key: str) -> "TeerClient":
+        """
+        Get the client for a tenant, creating it if needed.
+
+        Args:
+            api_key: The tenant's Teer API key.
+
+        Returns:
+            The tenant's client.
+        """
+        with self._lock:
+            client = self._clients.get(api_key)
+            if client is not None:
+                self._clients.move_to_end(api_key)
+                return client
+
+        # Build outside the lock; a concurrent build of the same tenant is
+        # harmless, the first one stored wins.
+        client = self._create(api_key)
+        with self._lock:
+            existing = self._clients.get(api_key)
+            if existing is not None:
+                self._clients.move_to_end(api_key)
+                return existing
+            self._clients[api_key] = client
+            while len(self._clients) > self.max_tenants:
+                self._clients.popitem(last=False)
+                self.metrics.increment("tenants.evicted")
+            self.metrics.set_gauge("tenants.active", len(self._clients))
+        return client
+
+    @property
+    def sender(self) -> SenderPool:
+        """The background sender pool shared by every tenant."""
+        if self._sender is None:
+            with self._lock:
+                if self._sender is None:
+                    sender = SenderPool(
+                        self._send_ingest,
+                        metrics=self.metrics,
+                        name="ingest",
+                        **self._sender_options,
+                    )
+                    sender.add_lane(
+                        "meter", self._send_meter, priority=1, weight=8, durable=True
+                    )
+                    self._sender = sender
+                    atexit.register(self.close, EXIT_FLUSH_TIMEOUT)
+        return self._sender
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for every tenant's buffered events to be sent.
+
+        Args:
+            timeout: Maximum time to wait, in seconds. Waits forever if None.
+
+        Returns:
+            True if every buffered event was sent, False on timeout.
+        """
+        if self._sender is None:
+            return True
+        return self._sender.flush(timeout)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Flush buffered events and stop the shared sender.
+
+        Args:
+            timeout: Maximum time to wait for the flush, in seconds.
+
+        Returns:
+            True if every buffered event was sent before closing.
+        """
+        if self._sender is None:
+            return True
+        return self._sender.close(timeout)
+
+    def _create(self, api_key: str) -> "TeerClient":
+        from . import TeerClient
+
+        client = TeerClient(api_key=api_key, **self._client_options)
+        client._sender = _TenantSender(api_key, self.sender)  # type: ignore[assignment]
+        return client
+
+    def _send_ingest(self, batch: List[Tuple[str, Any]]) -> None:
+        """Send a shared ingest batch, one request per tenant in it."""
+        self._send_by_tenant(
+            batch, lambda client, events: client.ingest._post_batch(events), True
+        )
+
+    def _send_meter(self, batch: List[Tuple[str, Any]]) -> None:
+        """
+        Send a shared meter event batch, one tenant at a time.
+
+        Only the events of tenants whose requests failed are retried, so
+        tenants whose events were delivered are never billed twice. Events a
+        tenant's server rejects, e.g. because its key was revoked, are
+        dropped by that tenant's resource.
+        """
+        self._send_by_tenant(
+            batch,
+            lambda client, events: client.billing.meter_events._post_batch(events),
+        )
+
+    def _send_by_tenant(
+        self,
+        batch: List[Tuple[str, Any]],
+        send: Callable[["TeerClient", List[Any]], Any],
+        count: bool = False,
+    ) -> None:
+        """
+        Send each tenant's events of a shared batch with its own client.
+
+        With ``count``, each tenant's sent and failed events are also counted
+        in its client's metrics.
+
+        Raises:
+            PartialFailure: With the tagged events of the tenants that
+                            failed, for the shared lane to count or retry.
+        """
+        failed: List[Tuple[str, Any]] = []
+        error: Optional[Exception] = None
+        for api_key, events in _group(batch).items():
+            client = self.client(api_key)
+            try:
+                send(client, events)
+            except Exception as e:
+                error = error or e
+                failed.extend((api_key, event) for event in events)
+                if count:
+                    client.metrics.increment("sender.failed", len(events))
+                logger.error(
+                    f"Failed to send batch of {len(events)} events for tenant "
+                    f"...{api_key[-4:]}: {str(e)}"
+                )
+            else:
+                if count:
+                    client.metrics.increment("sender.sent", len(events))
+        if error is not None:
+            raise PartialFailure(failed, error)
@@ -0,0 +1,287 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, Union
+
+from .types import IngestPayload
+
+# Pre-tokenization in the style of the GPT tokenizers: contractions, words,
+# up to three digits, punctuation runs and whitespace each form a piece.
+_PIECE = re.compile(r"'(?:s|t|re|ve|m|ll|d)| ?[^\W\d_]+| ?\d{1,3}| ?[^\s\w]+|\s+")
+
+# Estimated tokens relative to OpenAI's tokenizers for the same text
+PROVIDER_FACTORS: Dict[str, float] = {
+    "openai": 1.0,
+    "anthropic": 1.1,
+    "google": 1.05,
+}
+
+# Chat formatting overhead, per message and per prompt
+TOKENS_PER_MESSAGE = 4
+TOKENS_PER_PROMPT = 3
+
+Prompt = Union[str, Iterable[Mapping[str, Any]]]
+
+
+def _is_cjk(char: str) -> bool:
+    code = ord(char)
+    return (
+        0x3040 <= code <= 0x30FF  # Hiragana, Katakana
+        or 0x3400 <= code <= 0x9FFF  # CJK ideographs
+        or 0xAC00 <= code <= 0xD7AF  # Hangul
+        or 0xF900 <= code <= 0xFAFF
+    )
+
+
+def heuristic_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in a text without a vocabulary.
+
+    The text is split the way BPE tokenizers pre-tokenize it, and each piece
+    is costed by its kind: short ASCII words are one token and longer ones
+    one per seven characters, numbers one per three digits, CJK one per
+    character, other scripts one per three characters and punctuation one
+    per two characters. The result is typically within 10-15% of OpenAI's
+    tokenizers on English text and code.
+
+    Args:
+        text: The text to estimate.
+
+    Returns:
+        The estimated number of tokens.
+    """
+    tokens = 0
+    for piece in _PIECE.findall(text):
+        word = piece.lstrip(" ") or piece
+        first = word[0]
+        if first.isalpha():
+            if word.isascii():
+                tokens += (len(word) + 6) // 7
+            else:
+                cjk = sum(1 for c in word if _is_cjk(c))
+                tokens += cjk + (len(word) - cjk + 2) // 3
+        elif first.isdigit() or first.isspace():
+            tokens += 1
+        else:
+            tokens += (len(word) + 1) // 2
+    return tokens
+
+
+class TokenEstimator:
+    """
+    Offline estimates of token usage, for paths that get no usage from the
+    provider such as proxies, partial streams and cancelled requests.
+
+    By default token counts come from ``heuristic_tokens``, scaled per
+    provider. With ``use_tiktoken=True`` and ``tiktoken`` installed, exact
+    OpenAI encodings are used instead (still scaled for other providers);
+    note that ``tiktoken`` downloads each vocabulary on first use unless it
+    is already in its cache.
+
+    Counts of texts at least ``cache_min_chars`` long are kept in an LRU
+    cache, keyed on a digest of the text, so repeated system prompts,
+    few-shot examples and earlier turns of a conversation are only counted
+    once. Texts longer than ``fast_path_chars`` are estimated from evenly
+    spaced samples rather than counted in full, and not cached.
+    """
+
+    def __init__(
+        self,
+        use_tiktoken: bool = False,
+        cache_size: int = 1024,
+        cache_min_chars: int = 256,
+        fast_path_chars: int = 65_536,
+        samples: int = 16,
+        sample_chars: int = 2048,
+    ):
+        """
+        Initialize the estimator.
+
+        Args:
+            use_tiktoken: Whether to count with ``tiktoken`` encodings.
+            cache_size: Maximum number of cached text counts.
+            cache_min_chars: Shortest text whose count is cached.
+            fast_path_chars: Length above which texts are sampled.
+            samples: Number of samples taken from a long text.
+            sample_chars: Length of each sample.
+
+        Raises:
+            ValueError: If ``samples`` or ``sample_chars`` is below 1.
+            ImportError: If ``use_tiktoken`` is set and tiktoken is not
+                         installed.
+        """
+        if samples < 1 or sample_chars < 1:
+            raise ValueError("samples and sample_chars must be at least 1")
+        if use_tiktoken:
+            try:
+                import tiktoken  # noqa: F401
+            except ImportError as e:
+                raise ImportError(
+                    "use_tiktoken requires tiktoken. "
+                    "Install it with `pip install tiktoken`."
+                ) from e
+        self.use_tiktoken = use_tiktoken
+        self.cache_size = cache_size
+        self.cache_min_chars = cache_min_chars
+        self.fast_path_chars = fast_path_chars
+        self.samples = samples
+        self.sample_chars = sample_chars
+        # Keyed on a digest of the text, so cached texts are not kept alive
+        self._cache: "OrderedDict[Tuple[str, bytes], int]" = OrderedDict()
+        self._encodings: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def count(
+        self, text: str, provider: str = "openai", model: Optional[str] = None
+    ) -> int:
+        """
+        Estimate the number of tokens in a text.
+
+        Args:
+            text: The text.
+            provider: The LLM provider whose tokenizer to approximate.
+            model: The model name, used to pick a ``tiktoken`` encoding.
+
+        Returns:
+            The estimated number of tokens.
+        """
+        if not text:
+            return 0
+        factor = PROVIDER_FACTORS.get(provider, 1.0)
+        return round(self._count(text, model) * factor)
+
+    def count_prompt(
+        self, prompt: Prompt, provider: str = "openai", model: Optional[str] = None
+    ) -> int:
+        """
+        Estimate the input tokens of a prompt.
+
+        Args:
+            prompt: A string, or chat messages with a ``content`` that is a
+                    string or a list of parts with a ``text`` field. Non-text
+                    parts such as images are not counted.
+            provider: The LLM provider whose tokenizer to approximate.
+            model: The model name, used to pick a ``tiktoken`` encoding.
+
+        Returns:
+            The estimated number of tokens, including chat formatting.
+        """
+        if isinstance(prompt, str):
+            return self.count(prompt, provider, model)
+
+        tokens = 0
+        messages = 0
+        for message in prompt:
+            messages += 1
+            content = message.get("content")
+            if isinstance(content, str):
+                tokens += self._count(content, model)
+            elif content:
+                for part in content:
+                    text = part.get("text") if isinstance(part, Mapping) else None
+                    if text:
+                        tokens += self._count(text, model)
+        if messages:
+            tokens += messages * TOKENS_PER_MESSAGE + TOKENS_PER_PROMPT
+        return round(tokens * PROVIDER_FACTORS.get(provider, 1.0))
+
+    def estimate(
+        self,
+        payload: IngestPayload,
+        prompt: Optional[Prompt] = None,
+        completion: Optional[str] = None,
+    ) -> IngestPayload:
+        """
+        Fill in a payload's token usage from the prompt and completion text.
+
+        The payload's ``usage.estimated`` flag is set, so estimated reports
+        can be told apart from provider-reported ones.
+
+        Args:
+            payload: The ingest payload. It is not modified.
+            prompt: The prompt, as accepted by ``count_prompt``. Sets
+                    ``usage.input`` when given.
+            completion: The completion text received so far. Sets
+                        ``usage.output`` when given.
+
+        Returns:
+            A copy of the payload with estimated usage.
+        """
+        provider = payload.get("provider", "openai")
+        model = payload.get("model")
+        usage: Dict[str, Any] = dict(payload.get("usage") or {})
+        if prompt is not None:
+            usage["input"] = self.count_prompt(prompt, provider, model)
+        if completion is not None:
+            usage["output"] = self.count(completion, provider, model)
+        usage.setdefault("input", 0)
+        usage.setdefault("output", 0)
+        usage["estimated"] = True
+        return {**payload, "usage": usage}  # type: ignore[typeddict-item]
+
+    def _count(self, text: str, model: Optional[str]) -> int:
+        """Count tokens before the provider factor, using the cache."""
+        if len(text) < self.cache_min_chars:
+            return self._encode_count(text, model)
+        if len(text) > self.fast_path_chars:
+            # Sampling is cheaper than hashing the whole text for the cache
+            return self._sampled_count(text, model)
+
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        key = (self._encoding_name(model), digest)
+        with self._lock:
+            tokens = self._cache.get(key)
+            if tokens is not None:
+                self._cache.move_to_end(key)
+                return tokens
+
+        tokens = self._encode_count(text, model)
+
+        with self._lock:
+            self._cache[key] = tokens
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return tokens
+
+    def _sampled_count(self, text: str, model: Optional[str]) -> int:
+        """Extrapolate the count of a long text from evenly spaced samples."""
+        if len(text) <= self.samples * self.sample_chars:
+            # The samples would cover the whole text anyway
+            return self._encode_count(text, model)
+        step = len(text) // self.samples
+        sampled_chars = 0
+        sampled_tokens = 0
+        for start in range(0, step * self.samples, step):
+            sample = text[start : start + self.sample_chars]
+            sampled_chars += len(sample)
+            sampled_tokens += self._encode_count(sample, model)
+        return round(sampled_tokens * len(text) / sampled_chars)
+
+    def _encode_count(self, text: str, model: Optional[str]) -> int:
+        if not self.use_tiktoken:
+            return heuristic_tokens(text)
+        return len(self._encoding(model).encode_ordinary(text))
+
+    def _encoding_name(self, model: Optional[str]) -> str:
+        if not self.use_tiktoken:
+            return "heuristic"
+        return self._encoding(model).name
+
+    def _encoding(self, model: Optional[str]) -> Any:
+        import tiktoken
+
+        key = model or ""
+        encoding = self._encodings.get(key)
+        if encoding is None:
+            try:
+                encoding = tiktoken.encoding_for_model(model or "")
+            except KeyError:
+                # Unknown or non-OpenAI model: use the newest encoding
+                encoding = tiktoken.get_encoding("o200k_base")
+            self._encodings[key] = encoding
+        return encoding
@@ -0,0 +1,218 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+import atexit
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, TYPE_CHECKING
+
+from .processors import EventProcessor
+from .tenants import TeerClientPool
+from .types import IngestPayload
+
+if TYPE_CHECKING:
+    from . import TeerClient
+
+
+class _Trace:
+    """The spans of one trace buffered so far."""
+
+    __slots__ = ("started", "spans")
+
+    def __init__(self, started: float):
+        self.started = started
+        self.spans: List[IngestPayload] = []
+
+
+class TraceBuffer(EventProcessor):
+    """
+    Holds the spans of each trace and ships the whole span tree at once.
+
+    Agent loops report dozens of spans per trace. The buffer is an event
+    processor: register it with ``client.add_processor``, after every other
+    processor, and events with a ``trace_id`` are held until their root
+    span, the one without a ``parent_span_id``, is reported. The trace is
+    then buffered into a lane of the client's sender, ``"traces"`` for the
+    first buffer and ``"traces-2"`` and so on for further ones, as a single
+    item and sent in one request, possibly together with other
+    traces but never split across requests. Spans of a trace that already
+    shipped are sent as usual.
+
+    Memory is capped. A trace whose root has not been reported within
+    ``timeout`` seconds is shipped as it is. Beyond ``max_traces`` traces or
+    ``max_spans`` spans in total the oldest traces are shipped early, and a
+    trace that reaches ``max_spans_per_trace`` spans ships what it has.
+    Nothing is dropped; the ``traces.timed_out``, ``traces.evicted`` and
+    ``traces.split`` counters show how often this happens.
+
+    Held spans are not sent yet, so ``ingest.send`` returns None and
+    ``ingest.enqueue`` returns False for them, as for events a processor
+    dropped. ``client.flush`` and ``client.close``, and so the serverless
+    ``handler``, ship every held trace, complete or not.
+
+    Clients of a ``TeerClientPool`` share one sender between tenants and
+    are not supported.
+    """
+
+    def __init__(
+        self,
+        client: "TeerClient",
+        timeout: float = 30.0,
+        max_traces: int = 10_000,
+        max_spans: int = 100_000,
+        max_spans_per_trace: int = 1000,
+    ):
+        """
+        Initialize the buffer.
+
+        Args:
+            client: The client to ship traces through.
+            timeout: Maximum time a trace is held, in seconds.
+            max_traces: Maximum number of traces held.
+            max_spans: Maximum number of spans held across all traces.
+            max_spans_per_trace: Maximum number of spans held for one trace.
+
+        Raises:
+            ValueError: If the client belongs to a ``TeerClientPool``.
+        """
+        if TeerClientPool.is_tenant_client(client):
+            raise ValueError("TraceBuffer does not support TeerClientPool clients")
+        self.client = client
+        self.timeout = timeout
+        self.max_traces = max_traces
+        self.max_spans = max_spans
+        self.max_spans_per_trace = max_spans_per_trace
+        self._traces: "OrderedDict[str, _Trace]" = OrderedDict()
+        # Recently shipped traces, so their late spans are not held again
+        self._shipped: "OrderedDict[str, None]" = OrderedDict()
+        self._spans = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.lane = self._add_lane()
+        atexit.register(self.close)
+
+    def __len__(self) -> int:
+        return len(self._traces)
+
+    def process(self, event: IngestPayload) -> Optional[IngestPayload]:
+        trace_id = event.get("trace_id")
+        if not trace_id:
+            return event
+
+        ready: List[List[IngestPayload]] = []
+        with self._lock:
+            trace = self._traces.get(trace_id)
+            if trace is None:
+                if trace_id in self._shipped:
+                    return event
+                trace = self._traces[trace_id] = _Trace(time.monotonic())
+            trace.spans.append(event)
+            self._spans += 1
+
+            if not event.get("parent_span_id"):
+                ready.append(self._pop(trace_id))
+            elif len(trace.spans) >= self.max_spans_per_trace:
+                self.client.metrics.increment("traces.split")
+                ready.append(self._pop(trace_id, shipped=False))
+
+            while self._traces and (
+                len(self._traces) > self.max_traces or self._spans > self.max_spans
+            ):
+                self.client.metrics.increment("traces.evicted")
+                ready.append(self._pop(next(iter(self._traces)), shipped=False))
+
+        self._ship(ready)
+        if self._thread is None:
+            self._start()
+        return None
+
+    def flush(self) -> int:
+        """
+        Ship every held trace now, complete or not.
+
+        Returns:
+            The number of traces shipped.
+        """
+        with self._lock:
+            ready = [self._pop(trace_id) for trace_id in list(self._traces)]
+        self._ship(ready)
+        return len(ready)
+
+    def close(self) -> None:
+        """Stop the timeout thread and ship every held trace."""
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+        self.flush()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None or self._stop.is_set():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="teer-traces", daemon=True
+            )
+        self._thread.start()
+
+    def _run(self) -> None:
+        interval = min(self.timeout / 4, 1.0)
+        while not self._stop.wait(interval):
+            self._expire()
+
+    def _expire(self) -> None:
+        """Ship traces held longer than the timeout, oldest first."""
+        expired = time.monotonic() - self.timeout
+        ready = []
+        with self._lock:
+            while self._traces:
+                trace_id, trace = next(iter(self._traces.items()))
+                if trace.started > expired:
+                    break
+                self.client.metrics.increment("traces.timed_out")
+                ready.append(self._pop(trace_id, shipped=False))
+        self._ship(ready)
+
+    def _pop(self, trace_id: str, shipped: bool = True) -> List[IngestPayload]:
+        """Remove a trace, remembering it as complete if ``shipped``."""
+        trace = self._traces.pop(trace_id)
+        self._spans -= len(trace.spans)
+        if shipped:
+            self._shipped[trace_id] = None
+            if len(self._shipped) > self.max_traces:
+                self._shipped.popitem(last=False)
+        return trace.spans
+
+    def _add_lane(self) -> str:
+        """Add a lane of the client's sender for this buffer's traces."""
+        sender = self.client.sender
+        for n in itertools.count(1):
+            name = "traces" if n == 1 else f"traces-{n}"
+            try:
+                sender.add_lane(name, self._send)
+            except ValueError:
+                # Taken by another buffer of the same client
+                continue
+            return name
+        raise AssertionError("unreachable")
+
+    def _ship(self, traces: List[List[IngestPayload]]) -> None:
+        sender = self.client.sender
+        for spans in traces:
+            sender.enqueue(spans, lane=self.lane)
+
+    def _send(self, traces: List[List[IngestPayload]]) -> None:
+        """Send a batch of traces, packing whole traces into each request."""
+        batch: List[IngestPayload] = []
+        for spans in traces:
+            if batch and len(batch) + len(spans) > self.max_spans_per_trace:
+                self.client.ingest._post_batch(batch)
+                batch = []
+            batch.extend(spans)
+        if batch:
+            self.client.ingest._post_batch(batch)
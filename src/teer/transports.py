@@ -0,0 +1,432 @@
+# SPDX-FileCopyrightText: 2025-present Shane Rogers <shane@teer.ai>
+#
+# SPDX-License-Identifier: MIT
+
+import gzip
+import http.client
+import json
+import os
+import re
+import socket
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Union
+from urllib.parse import urlencode, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .hooks import RequestContext
+
+
+def encode_body(request: RequestContext) -> Optional[bytes]:
+    """
+    Get the encoded body of a request.
+
+    Args:
+        request: The request.
+
+    Returns:
+        The body bytes, or None if the request has no body.
+    """
+    if request.body is not None:
+        return request.body
+    if request.json is None:
+        return None
+    return json.dumps(request.json, separators=(",", ":")).encode("utf-8")
+
+
+def decode_body(request: RequestContext) -> Any:
+    """
+    Get the decoded JSON body of a request, undoing any compression.
+
+    Args:
+        request: The request.
+
+    Returns:
+        The decoded JSON body, or None if the request has no body.
+    """
+    if request.body is None:
+        return request.json
+    body = request.body
+    if request.headers.get("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+    return json.loads(body)
+
+
+class Response:
+    """
+    Minimal HTTP response returned by transports that do not use ``requests``.
+
+    It mirrors the parts of ``requests.Response`` the SDK relies on, so hooks
+    and the HTTP client treat every transport the same way.
+    """
+
+    def __init__(
+        self,
+        status_code: int = 200,
+        content: bytes = b"",
+        headers: Optional[Dict[str, str]] = None,
+        url: str = "",
+    ):
+        """
+        Initialize the response.
+
+        Args:
+            status_code: The HTTP status code.
+            content: The raw response body.
+            headers: The response headers.
+            url: The request URL.
+        """
+        self.status_code = status_code
+        self.content = content
+        self.headers: CaseInsensitiveDict = CaseInsensitiveDict(headers or {})
+        self.url = url
+
+    @classmethod
+    def from_json(cls, body: Any, status_code: int = 200, url: str = "") -> "Response":
+        """
+        Build a JSON response.
+
+        Args:
+            body: The JSON-serializable body.
+            status_code: The HTTP status code.
+            url: The request URL.
+
+        Returns:
+            The response.
+        """
+        content = json.dumps(body).encode("utf-8")
+        return cls(status_code, content, {"Content-Type": "application/json"}, url)
+
+    @property
+    def text(self) -> str:
+        """The response body decoded as UTF-8."""
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """Parse the response body as JSON."""
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        """Raise ``requests.exceptions.HTTPError`` for 4xx and 5xx responses."""
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(
+                f"{self.status_code} Error for url: {self.url}", response=self
+            )
+
+
+ResponseLike = Union[requests.Response, Response]
+
+
+class Transport(ABC):
+    """
+    Base class for transports that carry requests to Teer.
+
+    The HTTP client builds each request, runs the hook chain and then hands
+    it to its transport. Implement ``send`` to deliver requests somewhere
+    other than the Teer API over TCP.
+    """
+
+    @abstractmethod
+    def send(self, request: RequestContext) -> ResponseLike:
+        """
+        Deliver a request and return its response.
+
+        Args:
+            request: The fully prepared request.
+
+        Returns:
+            The response. Must not raise for HTTP error statuses.
+
+        Raises:
+            requests.exceptions.RequestException: If the request cannot be delivered.
+        """
+
+    def warm(self, url: str, timeout: Optional[float] = 2.0) -> None:
+        """
+        Open a connection ahead of the first request, if the transport pools them.
+
+        Failures are ignored; the first real request will simply connect.
+
+        Args:
+            url: A URL on the host to connect to.
+            timeout: Maximum time to spend connecting, in seconds.
+        """
+
+    def close(self) -> None:
+        """Release any resources held by the transport."""
+
+
+class HTTPTransport(Transport):
+    """Sends requests over HTTP(S) with a pooled ``requests.Session``."""
+
+    def __init__(
+        self, session: Optional[requests.Session] = None, pool_maxsize: int = 10
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            session: Optional session to use. One is created if not provided.
+            pool_maxsize: Maximum number of pooled connections kept per host.
+                         Ignored when a session is provided.
+        """
+        if session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=pool_maxsize)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+
+    def send(self, request: RequestContext) -> ResponseLike:
+        return self.session.request(
+            method=request.method,
+            url=request.url,
+            params=request.params,
+            json=request.json if request.body is None else None,
+            data=request.body,
+            headers=request.headers,
+            timeout=request.timeout,
+        )
+
+    def warm(self, url: str, timeout: Optional[float] = 2.0) -> None:
+        # A HEAD request pays for DNS, TCP and TLS and leaves a kept-alive
+        # connection in the session's pool for the next request.
+        try:
+            self.session.head(url, timeout=timeout).close()
+        except requests.exceptions.RequestException:
+            pass
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class InMemoryTransport(Transport):
+    """
+    Keeps requests in memory instead of sending them.
+
+    Useful in tests and benchmarks. Every request is recorded in
+    ``requests``; responses come from ``handler`` when given, otherwise an
+    empty JSON object with status 200.
+    """
+
+    def __init__(
+        self,
+        handler: Optional[Callable[[RequestContext], ResponseLike]] = None,
+        record: bool = True,
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            handler: Optional callable that builds the response for a request.
+            record: Whether to keep every request in ``requests``.
+        """
+        self.handler = handler
+        self.record = record
+        self.requests: List[RequestContext] = []
+        self._lock = threading.Lock()
+
+    def send(self, request: RequestContext) -> ResponseLike:
+        if self.record:
+            with self._lock:
+                self.requests.append(request)
+        if self.handler is not None:
+            return self.handler(request)
+        return Response(200, b"{}", url=request.url)
+
+    def events(self) -> List[Any]:
+        """
+        Get every ingest event carried by the recorded requests.
+
+        Returns:
+            The decoded events, with batches expanded.
+        """
+        events: List[Any] = []
+        for request in list(self.requests):
+            body = decode_body(request)
+            if isinstance(body, dict) and isinstance(body.get("events"), list):
+                events.extend(body["events"])
+            elif body is not None:
+                events.append(body)
+        return events
+
+    def clear(self) -> None:
+        """Forget every recorded request."""
+        with self._lock:
+            self.requests.clear()
+
+
+class FileTransport(Transport):
+    """
+    Appends request bodies to JSONL files for offline capture.
+
+    Each request body is written as one JSON line. Ingest requests go to
+    ``path``, with batch bodies (``{"events": [...]}``) expanded to one line
+    per event, so captured ingest traffic can be replayed later with
+    ``teer upload``. Requests to other endpoints, such as meter events, are
+    kept out of that file: each endpoint gets a file of its own next to it,
+    e.g. ``capture.billing-meter-events.jsonl`` for ``capture.jsonl``.
+    Requests without a body, such as GETs, get a 404 response.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the transport.
+
+        Args:
+            path: The file to append ingest events to. It is created if it
+                  does not exist.
+        """
+        self.path = path
+        self._files: Dict[str, BinaryIO] = {path: open(path, "ab")}
+        self._lock = threading.Lock()
+
+    def send(self, request: RequestContext) -> ResponseLike:
+        body = decode_body(request)
+        if body is None:
+            return Response(404, b"{}", url=request.url)
+        if isinstance(body, dict) and isinstance(body.get("events"), list):
+            records = body["events"]
+        else:
+            records = [body]
+        data = b"".join(
+            json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n"
+            for record in records
+        )
+        path = self.path_for(request.url)
+        with self._lock:
+            f = self._files.get(path)
+            if f is None:
+                f = self._files[path] = open(path, "ab")
+            f.write(data)
+            f.flush()
+        return Response(202, b"{}", url=request.url)
+
+    def path_for(self, url: str) -> str:
+        """
+        Get the file the bodies of requests to a URL are written to.
+
+        Args:
+            url: The request URL.
+
+        Returns:
+            ``path`` for ingest requests, otherwise the endpoint's own file.
+        """
+        segments = [s for s in urlsplit(url).path.split("/") if s]
+        if segments[-1:] == ["ingest"] or segments[-2:] == ["ingest", "batch"]:
+            return self.path
+        # Name the file after the endpoint, e.g. /v1/billing/meter-events
+        for index, segment in enumerate(segments):
+            if re.fullmatch(r"v\d+", segment):
+                segments = segments[index + 1 :]
+                break
+        root, ext = os.path.splitext(self.path)
+        return f"{root}.{'-'.join(segments) or 'other'}{ext}"
+
+    def close(self) -> None:
+        with self._lock:
+            for f in self._files.values():
+                f.close()
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix domain socket."""
+
+    def __init__(self, socket_path: str, timeout: Optional[float]):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+
+class UnixSocketTransport(Transport):
+    """
+    Sends HTTP requests over a Unix domain socket, e.g. to a local proxy.
+
+    The path and query of each request URL are kept and its host is sent in
+    the ``Host`` header; the socket path determines where the request goes.
+    Idle connections are pooled and reused.
+    """
+
+    def __init__(self, socket_path: str, pool_maxsize: int = 10):
+        """
+        Initialize the transport.
+
+        Args:
+            socket_path: Path of the Unix domain socket to connect to.
+            pool_maxsize: Maximum number of idle connections kept for reuse.
+        """
+        self.socket_path = socket_path
+        self.pool_maxsize = pool_maxsize
+        self._idle: List[_UnixHTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def send(self, request: RequestContext) -> ResponseLike:
+        parts = urlsplit(request.url)
+        target = parts.path or "/"
+        query = parts.query
+        if request.params:
+            encoded = urlencode(request.params, doseq=True)
+            query = f"{query}&{encoded}" if query else encoded
+        if query:
+            target = f"{target}?{query}"
+
+        headers = dict(request.headers)
+        headers.setdefault("Host", parts.netloc or "localhost")
+        body = encode_body(request)
+
+        connection = self._acquire(request.timeout)
+        try:
+            connection.request(request.method, target, body=body, headers=headers)
+            raw = connection.getresponse()
+            content = raw.read()
+        except (OSError, http.client.HTTPException) as e:
+            connection.close()
+            raise requests.exceptions.ConnectionError(
+                f"Error talking to {self.socket_path}: {str(e)}"
+            ) from e
+
+        response = Response(raw.status, content, dict(raw.getheaders()), request.url)
+        if raw.will_close:
+            connection.close()
+        else:
+            self._release(connection)
+        return response
+
+    def warm(self, url: str, timeout: Optional[float] = 2.0) -> None:
+        connection = _UnixHTTPConnection(self.socket_path, timeout)
+        try:
+            connection.connect()
+        except OSError:
+            connection.close()
+            return
+        self._release(connection)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+    def _acquire(self, timeout: Optional[float]) -> _UnixHTTPConnection:
+        with self._lock:
+            if self._idle:
+                connection = self._idle.pop()
+                connection.timeout = timeout
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+                return connection
+        return _UnixHTTPConnection(self.socket_path, timeout)
+
+    def _release(self, connection: _UnixHTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self.pool_maxsize:
+                self._idle.append(connection)
+                return
+        connection.close()
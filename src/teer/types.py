@@ -58,6 +58,9 @@ class UsageObject(TypedDict):
     
     cache: NotRequired[CacheObject]
     """Cache-related token information."""
+    
+    estimated: NotRequired[bool]
+    """Whether the token counts were estimated locally rather than reported."""
 
 
 # Provider type
@@ -120,6 +123,9 @@ class IngestPayload(TypedDict):
     parent_span_id: NotRequired[str]
     """The ID of the parent span, if applicable."""
     
+    idempotency_key: NotRequired[str]
+    """A key that is the same for every report of this one LLM call."""
+    
     batch: NotRequired[bool]
     """Whether this was part of a batch operation."""
     
@@ -131,3 +137,15 @@ class IngestPayload(TypedDict):
     
     metadata: NotRequired[MetadataObject]
     """Additional metadata for attribution and analytics."""
+    
+    sample_rate: NotRequired[float]
+    """The fraction of similar events that were sampled and sent."""
+    
+    summary: NotRequired[Dict[str, Any]]
+    """Token distributions of the calls summarized by this event."""
+    
+    producer_id: NotRequired[str]
+    """The ID of the client instance that produced this event."""
+    
+    sequence: NotRequired[int]
+    """The event's sequence number among those of its producer."""
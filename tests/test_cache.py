@@ -0,0 +1,82 @@
+"""
+Tests for conditional GET caching.
+"""
+
+import unittest
+from unittest.mock import MagicMock
+
+from teer import TeerClient, ResponseCache
+
+from .test_http import make_response
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test cases for the response cache."""
+
+    def setUp(self):
+        """Set up a client with a response cache."""
+        self.cache = ResponseCache(max_entries=2)
+        self.client = TeerClient(api_key="test_api_key", response_cache=self.cache)
+        self.session = MagicMock()
+        self.client.http_client.session = self.session
+
+    def test_revalidates_with_etag(self):
+        """Test that a 304 reuses the cached body."""
+        first = make_response(body={"id": "rc_1"})
+        first.headers = {
+            "ETag": '"v1"',
+            "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+        }
+        not_modified = make_response(status_code=304)
+        self.session.request.side_effect = [first, not_modified]
+
+        card = self.client.rate_cards.retrieve("rc_1")
+        again = self.client.rate_cards.retrieve("rc_1")
+
+        self.assertIs(again, card)
+        not_modified.json.assert_not_called()
+        headers = self.session.request.call_args.kwargs["headers"]
+        self.assertEqual(headers["If-None-Match"], '"v1"')
+        self.assertEqual(headers["If-Modified-Since"], "Wed, 01 Jan 2025 00:00:00 GMT")
+        self.assertEqual(self.client.metrics.get("cache.revalidated"), 1)
+
+    def test_changed_resource_is_replaced(self):
+        """Test that a 200 on revalidation replaces the cached body."""
+        first = make_response(body={"version": 1})
+        first.headers = {"ETag": '"v1"'}
+        second = make_response(body={"version": 2})
+        second.headers = {"ETag": '"v2"'}
+        self.session.request.side_effect = [first, second]
+
+        self.client.rate_cards.retrieve("rc_1")
+        self.assertEqual(self.client.rate_cards.retrieve("rc_1"), {"version": 2})
+
+    def test_max_age_skips_request(self):
+        """Test that fresh entries are served without any request."""
+        self.cache.max_age = 60
+        self.session.request.return_value = make_response(body={"id": "rc_1"})
+
+        self.client.rate_cards.retrieve("rc_1")
+        self.client.rate_cards.retrieve("rc_1")
+
+        self.assertEqual(self.session.request.call_count, 1)
+        self.assertEqual(self.client.metrics.get("cache.hits"), 1)
+
+    def test_lru_eviction_and_posts(self):
+        """Test that the cache is bounded and only caches GETs."""
+        self.session.request.return_value = make_response(body={})
+
+        for rate_card_id in ("a", "b", "c"):
+            self.client.rate_cards.retrieve(rate_card_id)
+        self.client.ingest.send(
+            {"provider": "openai", "model": "gpt-4o", "usage": {"input": 1, "output": 1}}
+        )
+
+        self.assertEqual(len(self.cache), 2)
+        url = f"{self.client.api_base}/rate-cards/a"
+        key = self.cache.key(url, None, "Bearer test_api_key")
+        self.assertIsNone(self.cache.get(key))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Tests for the JSONL bulk uploader.
+"""
+
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from teer import TeerClient
+from teer.cli import Uploader, iter_batches, main
+
+
+def write_jsonl(path, count):
+    """Write ``count`` usage reports to a JSONL file."""
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(count):
+            payload = {
+                "provider": "openai",
+                "model": "gpt-4o",
+                "usage": {"input": i, "output": 1},
+            }
+            f.write(json.dumps(payload) + "\n")
+
+
+def sent_inputs(mock_send):
+    """Collect the usage.input values of every event sent through the mock."""
+    return sorted(
+        json.loads(line)["usage"]["input"]
+        for call in mock_send.call_args_list
+        for line in call.args[0]
+    )
+
+
+class TestUploader(unittest.TestCase):
+    """Test cases for the uploader."""
+
+    def setUp(self):
+        """Set up a temporary input file."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "usage.jsonl")
+        write_jsonl(self.path, 25)
+        self.client = TeerClient(api_key="test_api_key")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_iter_batches_tracks_offsets(self):
+        """Test that batches cover the file and skip invalid lines."""
+        with open(self.path, "ab") as f:
+            f.write(b"\nnot json\n")
+        with open(self.path, "rb") as f:
+            batches = list(iter_batches(f, 0, 10, validate=True))
+
+        self.assertEqual([len(lines) for _, _, lines, _ in batches], [10, 10, 5])
+        self.assertEqual(batches[0][0], 0)
+        self.assertEqual(batches[1][0], batches[0][1])
+        self.assertEqual(batches[-1][1], os.path.getsize(self.path))
+        self.assertEqual(batches[-1][3], 1)
+
+    @patch("teer.resources.ingest.Ingest.send_batch_encoded")
+    def test_upload(self, mock_send):
+        """Test that every line is uploaded and the checkpoint is removed."""
+        result = Uploader(self.client, self.path, batch_size=4, workers=3).run()
+
+        self.assertEqual(result.events, 25)
+        self.assertEqual(sent_inputs(mock_send), list(range(25)))
+        self.assertFalse(os.path.exists(self.path + ".checkpoint"))
+
+    @patch("teer.resources.ingest.Ingest.send_batch_encoded")
+    def test_resume_after_failure(self, mock_send):
+        """Test that a failed upload resumes after the last contiguous batch."""
+        mock_send.side_effect = [None, None, RuntimeError("down")]
+        uploader = Uploader(self.client, self.path, batch_size=5, workers=1)
+        with self.assertRaises(RuntimeError):
+            uploader.run()
+        self.assertEqual(uploader.checkpoint.load()[1], 10)
+
+        mock_send.reset_mock(side_effect=True)
+        result = Uploader(self.client, self.path, batch_size=5, workers=2).run()
+
+        self.assertEqual(result.events, 15)
+        self.assertEqual(sent_inputs(mock_send), list(range(10, 25)))
+
+    @patch("teer.resources.ingest.Ingest.send_batch_encoded")
+    def test_main(self, mock_send):
+        """Test the ``teer upload`` command."""
+        with patch("sys.stderr", new_callable=io.StringIO) as stderr:
+            code = main(["upload", self.path, "--api-key", "test", "--gzip", "--quiet"])
+
+        self.assertEqual(code, 0)
+        self.assertIn("Uploaded 25 events", stderr.getvalue())
+
+    @patch("teer.resources.ingest.Ingest.send_batch_encoded")
+    def test_connection_pool_fits_workers(self, mock_send):
+        """Test that every upload worker gets a pooled connection."""
+        with patch("teer.cli.TeerClient", wraps=TeerClient) as client_class:
+            main(
+                ["upload", self.path, "--api-key", "test", "--workers", "32", "--quiet"]
+            )
+
+        self.assertEqual(client_class.call_args.kwargs["pool_maxsize"], 32)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+Tests for adaptive concurrency control and throttling retries.
+"""
+
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from teer import TeerClient, AdaptiveConcurrencyLimiter, InMemoryTransport
+from teer.hooks import Hook
+from teer.concurrency import parse_retry_after
+
+from .test_http import make_response
+
+
+class TestAdaptiveConcurrencyLimiter(unittest.TestCase):
+    """Test cases for the AIMD limiter."""
+
+    def test_grows_on_healthy_responses(self):
+        """Test that healthy responses grow the limit additively."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=4)
+        for _ in range(20):
+            limiter.acquire()
+            limiter.release(latency=0.01)
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_slow_responses_hold_limit(self):
+        """Test that responses well above the baseline do not grow the limit."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, latency_tolerance=2.0)
+        limiter.acquire()
+        limiter.release(latency=0.01)
+        limit = limiter._limit
+        limiter.acquire()
+        limiter.release(latency=1.0)
+        self.assertEqual(limiter._limit, limit)
+
+    def test_backs_off_when_throttled(self):
+        """Test that throttling halves the limit and publishes it."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+        client = TeerClient(api_key="test_api_key", concurrency_limiter=limiter)
+        self.assertEqual(client.metrics.get("concurrency.limit"), 8)
+
+        limiter.acquire()
+        limiter.release(throttled=True)
+
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual(client.metrics.get("concurrency.limit"), 4)
+        self.assertEqual(client.metrics.get("concurrency.throttled"), 1)
+
+    def test_retry_after_is_capped(self):
+        """Test that a huge Retry-After pauses requests for max_retry_delay."""
+        limiter = AdaptiveConcurrencyLimiter(max_retry_delay=5.0)
+        limiter.acquire()
+        limiter.release(throttled=True, retry_after=3600.0)
+        self.assertLessEqual(limiter._blocked_until - time.monotonic(), 5.0)
+
+    def test_slot_released_when_send_fails(self):
+        """Test that slots are returned whatever makes a request fail."""
+
+        class Failing(Hook):
+            def before_send(self, request):
+                raise RuntimeError("hook failed")
+
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+        transport = InMemoryTransport(MagicMock(side_effect=ValueError("bad")))
+        client = TeerClient(
+            api_key="test_api_key",
+            transport=transport,
+            concurrency_limiter=limiter,
+        )
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                client.http_client.request("GET", "meters")
+        self.assertEqual(limiter.in_flight, 0)
+
+        client.http_client.add_hook(Failing())
+        for _ in range(2):
+            with self.assertRaises(RuntimeError):
+                client.http_client.request("GET", "meters")
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_parse_retry_after(self):
+        """Test parsing both forms of Retry-After."""
+        response = MagicMock()
+        response.headers = {"Retry-After": "3"}
+        self.assertEqual(parse_retry_after(response), 3.0)
+        response.headers = {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        self.assertEqual(parse_retry_after(response), 0.0)
+        response.headers = {}
+        self.assertIsNone(parse_retry_after(response))
+
+
+class TestThrottlingRetries(unittest.TestCase):
+    """Test cases for retrying throttled requests."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.client = TeerClient(api_key="test_api_key", max_retries=1)
+        self.session = MagicMock()
+        self.client.http_client.session = self.session
+
+    @patch("teer.http.time.sleep")
+    def test_retries_after_429(self, mock_sleep):
+        """Test that a 429 is retried after the Retry-After delay."""
+        throttled = make_response(status_code=429)
+        throttled.headers = {"Retry-After": "2"}
+        self.session.request.side_effect = [
+            throttled,
+            make_response(body={"ok": True}),
+        ]
+
+        result = self.client.ingest.send(
+            {"provider": "openai", "model": "gpt-4o", "usage": {"input": 1, "output": 1}}
+        )
+
+        self.assertEqual(result, {"ok": True})
+        mock_sleep.assert_called_once_with(2.0)
+        self.assertEqual(self.client.metrics.get("http.retries"), 1)
+
+    @patch("teer.http.time.sleep")
+    def test_gives_up_after_max_retries(self, mock_sleep):
+        """Test that throttling is raised once retries are exhausted."""
+        self.session.request.return_value = make_response(status_code=503)
+
+        with self.assertRaises(requests.exceptions.HTTPError):
+            self.client.http_client.request("GET", "meters")
+
+        self.assertEqual(self.session.request.call_count, 2)
+
+    def test_other_errors_are_not_retried(self):
+        """Test that non-throttling errors are raised immediately."""
+        self.session.request.return_value = make_response(status_code=400)
+
+        with self.assertRaises(requests.exceptions.HTTPError):
+            self.client.http_client.request("GET", "meters")
+
+        self.assertEqual(self.session.request.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
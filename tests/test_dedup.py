@@ -0,0 +1,135 @@
+"""
+Tests for duplicate suppression.
+"""
+
+import unittest
+
+from teer import Deduplicator, InMemoryTransport, TeerClient
+from teer.dedup import BloomFilter, DedupFilter, WindowedLRUFilter
+from teer.transports import Response
+
+
+def event(span_id=None, request_id=None, idempotency_key=None, output=5):
+    payload = {
+        "provider": "openai",
+        "model": "gpt-4o",
+        "function_id": "chat",
+        "usage": {"input": 10, "output": output},
+    }
+    if span_id:
+        payload["span_id"] = span_id
+    if request_id:
+        payload["metadata"] = {"request_id": request_id}
+    if idempotency_key:
+        payload["idempotency_key"] = idempotency_key
+    return payload
+
+
+class TestFilters(unittest.TestCase):
+    """Test cases for the dedup filters."""
+
+    def test_lru_is_bounded(self):
+        """Test that the LRU filter forgets the oldest keys beyond its size."""
+        f = WindowedLRUFilter(max_keys=2)
+        self.assertFalse(f.seen("a"))
+        self.assertTrue(f.seen("a"))
+        f.seen("b")
+        f.seen("c")
+        self.assertEqual(len(f), 2)
+        self.assertFalse(f.seen("a"))
+
+    def test_lru_window(self):
+        """Test that keys expire after the window."""
+        f = WindowedLRUFilter(window=0)
+        f.seen("a")
+        self.assertFalse(f.seen("a"))
+
+    def test_bloom_error_rate(self):
+        """Test the Bloom filter's size and false positive rate."""
+        f = BloomFilter(capacity=10_000, error_rate=0.01)
+        # Each generation is sized for half the error rate
+        self.assertLess(f.memory, 2 * 14_000)
+
+        inserted = sum(f.seen(f"key-{i}") for i in range(10_000))
+        self.assertLess(inserted, 100)
+        self.assertTrue(f.seen("key-42"))
+        false_positives = sum(f.seen(f"other-{i}") for i in range(10_000))
+        self.assertLess(false_positives, 300)
+
+
+class TestDeduplicator(unittest.TestCase):
+    """Test cases for duplicate suppression in the client."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.transport = InMemoryTransport()
+        self.client = TeerClient(
+            api_key="test_api_key", transport=self.transport, dedup=Deduplicator()
+        )
+
+    def test_ingest_duplicates_are_suppressed(self):
+        """Test suppression keyed on span IDs and idempotency keys."""
+        self.client.ingest.send(event(span_id="s1"))
+        self.assertIsNone(self.client.ingest.send(event(span_id="s1")))
+        self.client.ingest.send(event(idempotency_key="k1"))
+        self.assertIsNone(self.client.ingest.send(event(idempotency_key="k1")))
+        # Identical calls in the same request are not duplicates
+        self.client.ingest.send(event(request_id="r1"))
+        self.client.ingest.send(event(request_id="r1"))
+        # Events without IDs are never suppressed
+        self.client.ingest.send(event())
+        self.client.ingest.send(event())
+
+        self.assertEqual(len(self.transport.requests), 6)
+        self.assertEqual(self.client.metrics.get("dedup.suppressed"), 2)
+
+    def test_meter_duplicates_are_suppressed(self):
+        """Test suppression of meter events keyed on their identifier."""
+        params = {
+            "provider": "stripe",
+            "fields": {
+                "event_name": "tokens",
+                "identifier": "m1",
+                "payload": {"stripe_customer_id": "cus_1", "value": "10"},
+            },
+        }
+        self.client.billing.meter_events.create(params)
+        self.assertIsNone(self.client.billing.meter_events.create(params))
+        self.assertFalse(self.client.billing.meter_events.enqueue(params))
+        self.assertEqual(len(self.transport.requests), 1)
+
+    def test_failed_sends_can_be_retried(self):
+        """Test that a send that failed is not suppressed when retried."""
+        self.transport.handler = lambda request: Response(400, b"{}")
+        with self.assertRaises(Exception):
+            self.client.ingest.send(event(span_id="s1"))
+
+        self.transport.handler = None
+        self.assertIsNotNone(self.client.ingest.send(event(span_id="s1")))
+
+    def test_failed_batches_can_be_retried(self):
+        """Test that buffered events that were not delivered can be replayed."""
+        self.transport.handler = lambda request: Response(500, b"{}")
+        self.assertTrue(self.client.ingest.enqueue(event(span_id="s1")))
+        self.assertTrue(self.client.flush(timeout=5))
+        self.assertEqual(self.client.metrics.get("sender.failed"), 1)
+
+        self.transport.handler = None
+        self.assertTrue(self.client.ingest.enqueue(event(span_id="s1")))
+        self.assertTrue(self.client.flush(timeout=5))
+        self.assertEqual(len(self.transport.requests), 2)
+        self.assertEqual(self.client.metrics.get("dedup.suppressed"), 0)
+
+    def test_filters_must_implement_both_methods(self):
+        """Test that a filter missing a method cannot be created."""
+
+        class SeenOnly(DedupFilter):
+            def seen(self, key):
+                return False
+
+        with self.assertRaises(TypeError):
+            SeenOnly()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Tests for client-level payload defaults.
+"""
+
+import json
+import unittest
+
+from teer import EventProcessor, InMemoryTransport, PayloadDefaults, TeerClient
+
+
+class TestPayloadDefaults(unittest.TestCase):
+    """Test cases for payload defaults and scoped views."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.transport = InMemoryTransport()
+        self.client = TeerClient(
+            api_key="test_api_key",
+            transport=self.transport,
+            defaults={
+                "provider": "openai",
+                "platform": {"rate_card_id": "rc_1"},
+                "metadata": {"organization_id": "org_1", "team_id": "team_1"},
+            },
+        )
+
+    def test_encode_merges_nested_fields(self):
+        """Test that event fields win and nested dicts are merged."""
+        defaults = PayloadDefaults({"provider": "openai", "metadata": {"a": 1, "b": 2}})
+        event = {"model": "gpt-4o", "metadata": {"b": 3}}
+
+        self.assertEqual(
+            json.loads(defaults.encode(event)),
+            {"provider": "openai", "model": "gpt-4o", "metadata": {"a": 1, "b": 3}},
+        )
+        self.assertEqual(json.loads(defaults.encode({})), defaults.values)
+        self.assertEqual(event, {"model": "gpt-4o", "metadata": {"b": 3}})
+
+    def test_send_applies_client_defaults(self):
+        """Test that single sends carry the client's defaults."""
+        self.client.ingest.send({"model": "gpt-4o", "usage": {"input": 1}})
+
+        (event,) = self.transport.events()
+        self.assertEqual(event["provider"], "openai")
+        self.assertEqual(event["platform"], {"rate_card_id": "rc_1"})
+        self.assertEqual(event["model"], "gpt-4o")
+
+    def test_scoped_views_layer_defaults(self):
+        """Test that views stack on the client's defaults in one batch."""
+        team = self.client.with_defaults(metadata={"team_id": "team_2"})
+        user = team.with_defaults(metadata={"user_id": "user_1"})
+
+        self.client.ingest.enqueue({"model": "a"})
+        team.ingest.enqueue({"model": "b"})
+        user.ingest.enqueue({"model": "c", "provider": "anthropic"})
+        self.assertTrue(user.flush(timeout=5))
+        self.client.close()
+
+        events = {event["model"]: event for event in self.transport.events()}
+        self.assertEqual(events["a"]["metadata"]["team_id"], "team_1")
+        self.assertEqual(events["b"]["metadata"]["team_id"], "team_2")
+        self.assertEqual(
+            events["c"]["metadata"],
+            {"organization_id": "org_1", "team_id": "team_2", "user_id": "user_1"},
+        )
+        self.assertEqual(events["c"]["provider"], "anthropic")
+        self.assertIs(user.sender, self.client.sender)
+
+    def test_processors_see_merged_events(self):
+        """Test that processors see events with the defaults applied."""
+        seen = []
+
+        class Recorder(EventProcessor):
+            def process(self, event):
+                seen.append(event)
+                return event
+
+        self.client.add_processor(Recorder())
+        self.client.ingest.send_batch([{"model": "gpt-4o"}])
+
+        self.assertEqual(seen[0]["metadata"]["organization_id"], "org_1")
+        self.assertEqual(self.transport.events(), seen)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Tests for producer sequence numbers and acknowledgement windows.
+"""
+
+import json
+import unittest
+
+from teer import DeliveryTracker, InMemoryTransport, TeerClient
+from teer.transports import Response
+
+
+def event(output=5):
+    return {
+        "provider": "openai",
+        "model": "gpt-4o",
+        "function_id": "chat",
+        "usage": {"input": 10, "output": output},
+    }
+
+
+class TestDeliveryTracker(unittest.TestCase):
+    """Test cases for exactly-once delivery."""
+
+    def setUp(self):
+        self.responses = []
+        self.transport = InMemoryTransport(self.respond)
+        # Resends are triggered by hand rather than by the background thread
+        self.delivery = DeliveryTracker(resend_after=3600)
+        self.client = TeerClient(
+            "test_api_key",
+            transport=self.transport,
+            delivery=self.delivery,
+            flush_interval=0.01,
+        )
+
+    def tearDown(self):
+        self.client.close()
+
+    def respond(self, request):
+        if self.responses:
+            status, body = self.responses.pop(0)
+            return Response(status, json.dumps(body).encode(), url=request.url)
+        return Response(200, b"{}", url=request.url)
+
+    def test_sequences(self):
+        """Test that events share a producer ID and get increasing sequences."""
+        self.client.ingest.send(event())
+        self.client.ingest.enqueue(event())
+        self.client.billing.meter_events.enqueue(
+            {"provider": "stripe", "fields": {}}  # type: ignore[typeddict-item]
+        )
+        self.assertTrue(self.client.flush(timeout=5))
+
+        events = self.transport.events()
+        self.assertEqual(len(events), 3)
+        self.assertEqual(
+            {e["producer_id"] for e in events}, {self.delivery.producer_id}
+        )
+        self.assertEqual(sorted(e["sequence"] for e in events), [1, 2, 3])
+        self.assertEqual(len(self.delivery), 0)
+
+    def test_resend_keeps_sequence(self):
+        """Test that a failed batch is resent with its original sequences."""
+        self.responses.append((500, {"error": "unavailable"}))
+        self.client.ingest.enqueue(event())
+        self.assertTrue(self.client.flush(timeout=5))
+        self.assertEqual(len(self.delivery), 1)
+
+        self.delivery.resend_after = 0
+        self.assertEqual(self.delivery.resend(), 1)
+        self.assertTrue(self.client.flush(timeout=5))
+
+        first, second = self.transport.events()
+        self.assertEqual(first["sequence"], second["sequence"])
+        self.assertEqual(len(self.delivery), 0)
+        self.assertEqual(self.client.metrics.get("delivery.resent"), 1)
+
+    def test_rejected_events_are_not_resent(self):
+        """Test that events the server rejects as invalid leave the window."""
+        self.responses.append((400, {"error": "invalid"}))
+        self.client.ingest.enqueue(event())
+        self.assertTrue(self.client.flush(timeout=5))
+        self.assertEqual(len(self.delivery), 0)
+
+    def test_cumulative_ack(self):
+        """Test that acked_sequence only acknowledges sequences up to it."""
+        self.responses.append((200, {"acked_sequence": 2}))
+        self.client.ingest._post_batch(
+            [self.delivery.stamp(event(output=n)) for n in range(4)]
+        )
+        self.assertEqual(len(self.delivery), 2)
+
+        self.delivery.resend_after = 0
+        self.delivery.resend()
+        self.assertTrue(self.client.flush(timeout=5))
+        resent = self.transport.events()[4:]
+        self.assertEqual([e["sequence"] for e in resent], [3, 4])
+
+
+if __name__ == "__main__":
+    unittest.main()
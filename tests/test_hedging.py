@@ -0,0 +1,109 @@
+"""
+Tests for hedged requests.
+"""
+
+import threading
+import time
+import unittest
+
+from teer import HedgingPolicy, InMemoryTransport, TeerClient
+from teer.http import HEDGE_WORKERS
+from teer.transports import Response
+
+
+class TestHedging(unittest.TestCase):
+    """Test cases for request hedging."""
+
+    payload = {"provider": "openai", "model": "gpt-4o", "usage": {"input": 1}}
+
+    def make_client(self, policy, delays, statuses=()):
+        """
+        Build a client whose nth request takes ``delays[n]`` seconds and
+        fails with ``statuses[n]`` when given.
+        """
+        lock = threading.Lock()
+        calls = []
+
+        def handler(request):
+            with lock:
+                attempt = len(calls)
+                calls.append((request, threading.current_thread()))
+            time.sleep(delays[attempt])
+            status = statuses[attempt] if attempt < len(statuses) else 200
+            return Response.from_json({"attempt": attempt}, status)
+
+        transport = InMemoryTransport(handler=handler)
+        client = TeerClient(api_key="test_api_key", transport=transport, hedging=policy)
+        return client, calls
+
+    def test_slow_request_is_hedged(self):
+        """Test that a duplicate fires after the delay and replaces a failure."""
+        client, calls = self.make_client(
+            HedgingPolicy(max_delay=0.05), [0.3, 0.0], [500]
+        )
+
+        result = client.ingest.send(self.payload)
+
+        self.assertEqual(result, {"attempt": 1})
+        self.assertEqual(len(calls), 2)
+        keys = {request.headers["Idempotency-Key"] for request, _ in calls}
+        self.assertEqual(len(keys), 1)
+        self.assertEqual(client.metrics.get("hedging.fired"), 1)
+        self.assertEqual(client.metrics.get("hedging.won"), 1)
+
+    def test_fast_hedge_wins(self):
+        """Test that a duplicate answering first beats a slow original."""
+        client, calls = self.make_client(HedgingPolicy(max_delay=0.05), [0.5, 0.0])
+
+        started = time.monotonic()
+        self.assertEqual(client.ingest.send(self.payload), {"attempt": 1})
+        self.assertLess(time.monotonic() - started, 0.4)
+        self.assertEqual(client.metrics.get("hedging.won"), 1)
+
+    def test_busy_hedge_threads_send_unhedged(self):
+        """Test that requests go out on the calling thread when threads are busy."""
+        client, calls = self.make_client(HedgingPolicy(max_delay=0.01), [0.05])
+        client.http_client._hedge_busy = HEDGE_WORKERS
+
+        self.assertEqual(client.ingest.send(self.payload), {"attempt": 0})
+        self.assertEqual(len(calls), 1)
+        self.assertIs(calls[0][1], threading.current_thread())
+        self.assertEqual(client.metrics.get("hedging.skipped"), 1)
+
+    def test_hedge_budget(self):
+        """Test that no hedge fires once the budget is spent."""
+        policy = HedgingPolicy(max_delay=0.01, burst=0)
+        client, calls = self.make_client(policy, [0.05])
+
+        self.assertEqual(client.ingest.send(self.payload), {"attempt": 0})
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(client.metrics.get("hedging.budget_exhausted"), 1)
+
+    def test_meter_events_use_identifier(self):
+        """Test that meter events are deduplicated on their identifier."""
+        client, calls = self.make_client(HedgingPolicy(), [0.0])
+
+        client.billing.meter_events.create(
+            {
+                "provider": "stripe",
+                "fields": {
+                    "event_name": "tokens",
+                    "identifier": "evt_1",
+                    "payload": {"stripe_customer_id": "cus_1", "value": "10"},
+                },
+            }
+        )
+        self.assertEqual(calls[0][0].headers["Idempotency-Key"], "evt_1")
+
+    def test_delay_follows_percentile(self):
+        """Test that the delay tracks the configured latency percentile."""
+        policy = HedgingPolicy(percentile=90, min_delay=0, min_samples=10)
+        self.assertEqual(policy.delay(), policy.max_delay)
+
+        for i in range(500):
+            policy.record((i % 100) / 1000)
+        self.assertAlmostEqual(policy.delay(), 0.09, delta=0.005)
+
+
+if __name__ == "__main__":
+    unittest.main()
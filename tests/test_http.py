@@ -0,0 +1,126 @@
+"""
+Tests for the shared HTTP client and its lifecycle hooks.
+"""
+
+import gzip
+import json
+import unittest
+from unittest.mock import MagicMock
+
+import requests
+
+from teer import TeerClient, Hook
+from teer.compression import GzipCompression
+
+
+def make_response(status_code=200, body=None):
+    """Build a fake ``requests.Response``."""
+    response = MagicMock(spec=requests.Response)
+    response.status_code = status_code
+    response.headers = {}
+    response.json.return_value = body if body is not None else {}
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            f"{status_code} Error", response=response
+        )
+    return response
+
+
+class RecordingHook(Hook):
+    """Hook that records the order in which it was called."""
+
+    def __init__(self, name, calls):
+        self.name = name
+        self.calls = calls
+
+    def before_send(self, request):
+        self.calls.append(("before_send", self.name))
+        request.headers[f"X-{self.name}"] = "1"
+
+    def after_response(self, request, response):
+        self.calls.append(("after_response", self.name))
+
+    def on_error(self, request, error):
+        self.calls.append(("on_error", self.name))
+
+
+class TestHttpClient(unittest.TestCase):
+    """Test cases for the HTTP client."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.client = TeerClient(api_key="test_api_key")
+        self.session = MagicMock()
+        self.client.http_client.session = self.session
+
+    def test_resources_share_http_client(self):
+        """Test that resources send through the client's HTTP client."""
+        self.session.request.return_value = make_response(body={"ok": True})
+
+        result = self.client.ingest.send(
+            {"provider": "openai", "model": "gpt-4o", "usage": {"input": 1, "output": 2}}
+        )
+
+        self.assertEqual(result, {"ok": True})
+        kwargs = self.session.request.call_args.kwargs
+        self.assertEqual(kwargs["url"], f"{self.client.track_base}/ingest")
+        self.assertEqual(kwargs["headers"]["Authorization"], "Bearer test_api_key")
+        self.assertEqual(kwargs["json"]["model"], "gpt-4o")
+
+    def test_hooks_run_in_order(self):
+        """Test that hooks wrap each other in registration order."""
+        calls = []
+        self.client.http_client.add_hook(RecordingHook("a", calls))
+        self.client.http_client.add_hook(RecordingHook("b", calls))
+        self.session.request.return_value = make_response()
+
+        self.client.http_client.request("GET", "meters")
+
+        self.assertEqual(
+            calls,
+            [
+                ("before_send", "a"),
+                ("before_send", "b"),
+                ("after_response", "b"),
+                ("after_response", "a"),
+            ],
+        )
+        headers = self.session.request.call_args.kwargs["headers"]
+        self.assertEqual(headers["X-a"], "1")
+        self.assertEqual(headers["X-b"], "1")
+
+    def test_on_error_hooks(self):
+        """Test that errors reach the on_error hooks and are re-raised."""
+        calls = []
+        hook = RecordingHook("a", calls)
+        self.client.http_client.add_hook(hook)
+        self.session.request.return_value = make_response(status_code=500)
+
+        with self.assertRaises(requests.exceptions.HTTPError):
+            self.client.http_client.request("GET", "meters")
+
+        self.assertEqual(calls, [("before_send", "a"), ("on_error", "a")])
+
+        self.client.http_client.remove_hook(hook)
+        self.assertEqual(self.client.http_client.hooks, [])
+
+    def test_gzip_compression(self):
+        """Test that the gzip hook compresses large bodies only."""
+        self.client.http_client.add_hook(GzipCompression(min_size=100))
+        self.session.request.return_value = make_response()
+
+        self.client.ingest.send_batch([{"model": "x" * 200}])
+        kwargs = self.session.request.call_args.kwargs
+        self.assertEqual(kwargs["headers"]["Content-Encoding"], "gzip")
+        self.assertIsNone(kwargs["json"])
+        body = json.loads(gzip.decompress(kwargs["data"]))
+        self.assertEqual(body["events"][0]["model"], "x" * 200)
+
+        self.client.ingest.send_batch([{"model": "x"}])
+        kwargs = self.session.request.call_args.kwargs
+        self.assertNotIn("Content-Encoding", kwargs["headers"])
+        self.assertEqual(json.loads(kwargs["data"])["events"][0]["model"], "x")
+
+
+if __name__ == "__main__":
+    unittest.main()
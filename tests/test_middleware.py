@@ -0,0 +1,130 @@
+"""
+Tests for request-scoped usage collection and the web framework middleware.
+"""
+
+import asyncio
+import unittest
+
+from teer import InMemoryTransport, TeerClient
+from teer.middleware import TeerASGIMiddleware, TeerWSGIMiddleware
+from teer.scope import current_scope, usage_scope
+
+PAYLOAD = {"provider": "openai", "model": "gpt-4o", "usage": {"input": 1}}
+
+
+class TestUsageScope(unittest.TestCase):
+    """Test cases for usage scopes."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.transport = InMemoryTransport()
+        self.client = TeerClient(api_key="test_api_key", transport=self.transport)
+
+    def tearDown(self):
+        """Stop the sender."""
+        self.client.close(timeout=5)
+
+    def test_collects_until_exit(self):
+        """Test that sends inside a scope are buffered together on exit."""
+        with usage_scope(self.client, "req_1", "sess_1") as scope:
+            self.assertIsNone(self.client.ingest.send(PAYLOAD))
+            self.assertTrue(self.client.ingest.enqueue(PAYLOAD))
+            self.assertIs(current_scope(), scope)
+            self.assertEqual(self.transport.requests, [])
+
+        self.assertIsNone(current_scope())
+        self.assertTrue(self.client.flush(timeout=5))
+        events = self.transport.events()
+        self.assertEqual(len(events), 2)
+        for event in events:
+            self.assertEqual(
+                event["metadata"], {"request_id": "req_1", "session_id": "sess_1"}
+            )
+        self.assertEqual(self.client.metrics.get("scope.events"), 2)
+
+    def test_explicit_metadata_wins(self):
+        """Test that reports keep their own request ID and defaults."""
+        scoped = self.client.with_defaults(function_id="chat")
+        with usage_scope(self.client, "req_1"):
+            scoped.ingest.send({**PAYLOAD, "metadata": {"request_id": "mine"}})
+
+        self.assertTrue(self.client.flush(timeout=5))
+        (event,) = self.transport.events()
+        self.assertEqual(event["metadata"], {"request_id": "mine"})
+        self.assertEqual(event["function_id"], "chat")
+
+    def test_other_clients_are_not_collected(self):
+        """Test that a scope only collects its own client's usage."""
+        other = TeerClient(api_key="other", transport=InMemoryTransport())
+        with usage_scope(self.client):
+            other.ingest.send(PAYLOAD)
+        self.assertEqual(len(other.http_client.transport.requests), 1)
+
+
+class TestMiddleware(unittest.TestCase):
+    """Test cases for the ASGI and WSGI middleware."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.transport = InMemoryTransport()
+        self.client = TeerClient(api_key="test_api_key", transport=self.transport)
+
+    def tearDown(self):
+        """Stop the sender."""
+        self.client.close(timeout=5)
+
+    def test_asgi_requests_are_isolated(self):
+        """Test that concurrent ASGI requests collect their own usage."""
+        client = self.client
+
+        async def app(scope, receive, send):
+            for _ in range(3):
+                client.ingest.send(PAYLOAD)
+                await asyncio.sleep(0)
+            await send({"type": "http.response.body", "body": b""})
+
+        middleware = TeerASGIMiddleware(app, client=client)
+
+        async def request(request_id):
+            headers = [(b"x-request-id", request_id.encode())]
+            scope = {"type": "http", "headers": headers}
+
+            async def send(message):
+                pass
+
+            await middleware(scope, None, send)
+
+        async def main():
+            await asyncio.gather(request("a"), request("b"))
+
+        asyncio.run(main())
+        self.assertTrue(client.flush(timeout=5))
+        ids = [e["metadata"]["request_id"] for e in self.transport.events()]
+        self.assertEqual(sorted(ids), ["a", "a", "a", "b", "b", "b"])
+
+    def test_wsgi_submits_when_response_closes(self):
+        """Test that WSGI usage is buffered once the response is closed."""
+        client = self.client
+
+        def app(environ, start_response):
+            client.ingest.send(PAYLOAD)
+            start_response("200 OK", [])
+            return [b"ok"]
+
+        middleware = TeerWSGIMiddleware(app, client)
+        environ = {"HTTP_X_REQUEST_ID": "req_1", "HTTP_X_SESSION_ID": "sess_1"}
+        response = middleware(environ, lambda status, headers: None)
+        self.assertEqual(list(response), [b"ok"])
+        self.assertTrue(client.flush(timeout=5))
+        self.assertEqual(self.transport.events(), [])
+
+        response.close()
+        self.assertTrue(client.flush(timeout=5))
+        (event,) = self.transport.events()
+        self.assertEqual(
+            event["metadata"], {"request_id": "req_1", "session_id": "sess_1"}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Tests for the OpenTelemetry span exporter.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from teer import TeerClient
+
+try:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor, SpanExportResult
+
+    from teer.otel import TeerSpanExporter
+except ImportError:  # no cov
+    TracerProvider = None
+
+
+@unittest.skipIf(TracerProvider is None, "opentelemetry-sdk is not installed")
+class TestTeerSpanExporter(unittest.TestCase):
+    """Test cases for the span exporter."""
+
+    def setUp(self):
+        """Set up a tracer that exports through Teer."""
+        self.client = TeerClient(api_key="test_api_key")
+        self.exporter = TeerSpanExporter(self.client)
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(self.exporter))
+        self.tracer = provider.get_tracer("test")
+
+    @patch("teer.resources.ingest.Ingest.send_batch")
+    def test_exports_genai_spans(self, mock_send_batch):
+        """Test that GenAI spans become ingest events linked to their parent."""
+        with self.tracer.start_as_current_span("agent") as parent:
+            with self.tracer.start_as_current_span("chat") as span:
+                span.set_attributes(
+                    {
+                        "gen_ai.system": "anthropic",
+                        "gen_ai.request.model": "claude-3-haiku-20240307",
+                        "gen_ai.usage.input_tokens": 120,
+                        "gen_ai.usage.output_tokens": 30,
+                        "gen_ai.usage.cache_read.input_tokens": 100,
+                        "teer.function_id": "summarize",
+                        "user.id": "user-1",
+                        "teer.metadata.team_id": "team-1",
+                    }
+                )
+
+        # The parent span has no usage and is skipped
+        payloads = [call.args[0] for call in mock_send_batch.call_args_list]
+        events = [event for batch in payloads for event in batch]
+        self.assertEqual(len(events), 1)
+        event = events[0]
+        self.assertEqual(event["provider"], "anthropic")
+        self.assertEqual(event["model"], "claude-3-haiku-20240307")
+        self.assertEqual(event["function_id"], "summarize")
+        self.assertEqual(event["usage"]["input"], 120)
+        self.assertEqual(
+            event["usage"]["cache"]["anthropic"]["cache_read_input_tokens"], 100
+        )
+        parent_context = parent.get_span_context()
+        self.assertEqual(event["trace_id"], format(parent_context.trace_id, "032x"))
+        self.assertEqual(event["parent_span_id"], format(parent_context.span_id, "016x"))
+        self.assertEqual(event["metadata"], {"user_id": "user-1", "team_id": "team-1"})
+
+    @patch("teer.resources.ingest.Ingest.send_batch", side_effect=RuntimeError("down"))
+    def test_export_failure(self, mock_send_batch):
+        """Test that send failures are reported to OpenTelemetry."""
+        with self.tracer.start_as_current_span("chat") as span:
+            span.set_attributes(
+                {
+                    "gen_ai.system": "openai",
+                    "gen_ai.request.model": "gpt-4o",
+                    "gen_ai.usage.input_tokens": 1,
+                    "gen_ai.usage.output_tokens": 1,
+                }
+            )
+            readable = span
+
+        self.assertEqual(self.exporter.export([readable]), SpanExportResult.FAILURE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Tests for lazily paginated list endpoints.
+"""
+
+import threading
+import unittest
+from unittest.mock import patch
+
+from teer import TeerClient
+from teer.pagination import PageIterator
+
+
+def make_pages(count, per_page):
+    """Build a fake paginated listing of ``count`` pages."""
+    pages = {}
+    for n in range(count):
+        cursor = None if n == 0 else f"c{n}"
+        pages[cursor] = {
+            "data": [{"id": n * per_page + i} for i in range(per_page)],
+            "has_more": n < count - 1,
+            "next_cursor": f"c{n + 1}" if n < count - 1 else None,
+        }
+    return pages
+
+
+class TestPageIterator(unittest.TestCase):
+    """Test cases for the page iterator."""
+
+    def test_iterates_all_items(self):
+        """Test that every item is yielded in order, with and without prefetching."""
+        pages = make_pages(5, 3)
+        for prefetch in (0, 1, 3):
+            items = list(PageIterator(pages.__getitem__, prefetch=prefetch))
+            self.assertEqual([item["id"] for item in items], list(range(15)))
+
+    def test_fetches_lazily(self):
+        """Test that pages are only fetched as they are consumed."""
+        pages = make_pages(100, 2)
+        fetched = []
+        lock = threading.Lock()
+
+        def fetch(cursor):
+            with lock:
+                fetched.append(cursor)
+            return pages[cursor]
+
+        iterator = iter(PageIterator(fetch, prefetch=1))
+        next(iterator)
+        iterator.close()
+        # Current page, one queued page and at most one page in hand
+        self.assertLessEqual(len(fetched), 3)
+
+    def test_errors_are_raised_to_consumer(self):
+        """Test that fetch errors surface in the consuming thread."""
+        pages = make_pages(2, 1)
+
+        def fetch(cursor):
+            if cursor is not None:
+                raise RuntimeError("boom")
+            return pages[cursor]
+
+        iterator = iter(PageIterator(fetch, prefetch=1))
+        self.assertEqual(next(iterator), {"id": 0})
+        with self.assertRaises(RuntimeError):
+            next(iterator)
+
+
+class TestListResources(unittest.TestCase):
+    """Test cases for the list methods of resources."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.client = TeerClient(api_key="test_api_key")
+
+    @patch("teer.resources.base.BaseResource._request")
+    def test_usage_list(self, mock_request):
+        """Test that usage reports are listed with filters and cursors."""
+        pages = make_pages(2, 2)
+        mock_request.side_effect = lambda method, path, params, timeout: (
+            pages[params.get("cursor")]
+        )
+
+        reports = list(self.client.usage.list(model="gpt-4o", page_size=2, prefetch=0))
+
+        self.assertEqual(len(reports), 4)
+        first, second = mock_request.call_args_list
+        self.assertEqual(first.kwargs["params"], {"model": "gpt-4o", "limit": 2})
+        self.assertEqual(second.kwargs["params"]["cursor"], "c1")
+
+    @patch("teer.resources.base.BaseResource._request")
+    def test_meter_events_list(self, mock_request):
+        """Test that meter events can be listed."""
+        mock_request.return_value = {"data": [{"id": "me_1"}], "has_more": False}
+
+        events = list(self.client.billing.meter_events.list(event_name="search"))
+
+        self.assertEqual(events, [{"id": "me_1"}])
+        self.assertEqual(
+            mock_request.call_args.kwargs["params"],
+            {"event_name": "search", "limit": 1000},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+"""
+Tests for local cost computation.
+"""
+
+import math
+import threading
+import unittest
+from unittest.mock import patch
+
+from teer import TeerClient
+
+try:
+    import numpy
+except ImportError:  # no cov
+    numpy = None
+
+RATE_CARD = {
+    "id": "rc_123",
+    "currency": "usd",
+    "rates": {
+        "claude-3-haiku-20240307": {
+            "input": 0.25,
+            "output": 1.25,
+            "cache_read": 0.03,
+            "cache_write": 0.30,
+            "batch_discount": 0.5,
+        },
+        "gpt-4o": {"input": 2.5, "output": 10.0, "cache_read": 1.25},
+        "gemini-2.0-flash-001": {"input": 0.1, "output": 0.4, "cache_read": 0.025},
+    },
+}
+
+PAYLOADS = [
+    {
+        "provider": "anthropic",
+        "model": "claude-3-haiku-20240307",
+        "usage": {
+            "input": 1_000_000,
+            "output": 1_000_000,
+            "cache": {
+                "anthropic": {
+                    "cache_read_input_tokens": 1_000_000,
+                    "cache_creation_input_tokens": 1_000_000,
+                }
+            },
+        },
+        "platform": {"rate_card_id": "rc_123"},
+    },
+    {
+        "provider": "openai",
+        "model": "gpt-4o",
+        "usage": {
+            "input": 2_000_000,
+            "output": 1_000_000,
+            "cache": {"openai": {"input_cached_tokens": 1_000_000}},
+        },
+        "platform": {"rate_card_id": "rc_123"},
+    },
+    {
+        "provider": "google",
+        "model": "gemini-2.0-flash-001",
+        "usage": {
+            "input": 2_000_000,
+            "output": 1_000_000,
+            "cache": {
+                "google": {
+                    "cached_content_token_count": 1_000_000,
+                    "thoughts_token_count": 1_000_000,
+                }
+            },
+        },
+        "platform": {"rate_card_id": "rc_123"},
+    },
+    {
+        "provider": "anthropic",
+        "model": "claude-3-haiku-20240307",
+        "usage": {"input": 1_000_000, "output": 1_000_000},
+        "batch": True,
+        "platform": {"rate_card_id": "rc_123"},
+    },
+    {
+        "provider": "openai",
+        "model": "unknown-model",
+        "usage": {"input": 1, "output": 1},
+        "platform": {"rate_card_id": "rc_123"},
+    },
+]
+
+EXPECTED = [0.25 + 1.25 + 0.03 + 0.30, 2.5 + 10.0 + 1.25, 0.1 + 0.8 + 0.025, 0.75]
+
+
+class TestCostEngine(unittest.TestCase):
+    """Test cases for the cost engine."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.client = TeerClient(api_key="test_api_key")
+
+    @patch("teer.resources.rate_cards.RateCardsResource.retrieve")
+    def test_cost_fetches_and_caches_rate_card(self, mock_retrieve):
+        """Test that rate cards are fetched once and reused."""
+        mock_retrieve.return_value = RATE_CARD
+
+        costs = [self.client.pricing.cost(p) for p in PAYLOADS]
+
+        for cost, expected in zip(costs, EXPECTED):
+            self.assertAlmostEqual(cost, expected)
+        self.assertIsNone(costs[-1])
+        mock_retrieve.assert_called_once_with("rc_123")
+
+    @patch("teer.resources.rate_cards.RateCardsResource.retrieve")
+    def test_rate_card_expires(self, mock_retrieve):
+        """Test that rate cards are fetched again after the TTL."""
+        mock_retrieve.return_value = RATE_CARD
+        self.client.pricing.ttl = 0
+
+        self.client.pricing.cost(PAYLOADS[0])
+        self.client.pricing.cost(PAYLOADS[0])
+
+        self.assertEqual(mock_retrieve.call_count, 2)
+
+    @patch("teer.resources.rate_cards.RateCardsResource.retrieve")
+    def test_slow_fetch_does_not_block_other_cards(self, mock_retrieve):
+        """Test that rate cards are fetched concurrently, once per card."""
+        release = threading.Event()
+
+        def retrieve(rate_card_id):
+            if rate_card_id == "rc_slow":
+                release.wait(5)
+            return {**RATE_CARD, "id": rate_card_id}
+
+        mock_retrieve.side_effect = retrieve
+        slow = threading.Thread(target=self.client.pricing.rate_card, args=("rc_slow",))
+        slow.start()
+
+        self.assertEqual(self.client.pricing.rate_card("rc_123")["id"], "rc_123")
+        self.assertTrue(slow.is_alive())
+        release.set()
+        slow.join()
+
+    def test_no_rate_card(self):
+        """Test that payloads without a rate card are not priced."""
+        payload = {
+            "provider": "openai",
+            "model": "gpt-4o",
+            "usage": {"input": 1, "output": 1},
+        }
+        self.assertIsNone(self.client.pricing.cost(payload))
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_cost_batch_matches_cost(self):
+        """Test that the vectorized path agrees with the scalar one."""
+        self.client.pricing.set_rate_card(RATE_CARD)
+
+        costs = self.client.pricing.cost_batch(PAYLOADS * 10)
+
+        self.assertEqual(costs.shape, (len(PAYLOADS) * 10,))
+        for cost, expected in zip(costs, (EXPECTED + [math.nan]) * 10):
+            if math.isnan(expected):
+                self.assertTrue(math.isnan(cost))
+            else:
+                self.assertAlmostEqual(cost, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Tests for local quota tracking.
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from teer import TeerClient
+from teer.quota import QuotaTracker
+
+from .test_pricing import RATE_CARD
+
+
+def make_payload(tokens, **metadata):
+    """Build an ingest payload with the given total tokens and metadata."""
+    return {
+        "provider": "openai",
+        "model": "gpt-4o",
+        "usage": {"input": tokens, "output": 0},
+        "metadata": metadata,
+    }
+
+
+class TestQuotaTracker(unittest.TestCase):
+    """Test cases for the quota tracker."""
+
+    def setUp(self):
+        """Set up a client with a registered tracker."""
+        self.client = TeerClient(api_key="test_api_key")
+        self.quota = QuotaTracker(self.client)
+        self.client.add_processor(self.quota)
+
+    @patch("teer.resources.base.BaseResource._request")
+    def test_outgoing_events_count_against_limits(self, mock_request):
+        """Test that sent events consume the budget of their team and user."""
+        self.quota.set_limit("team_id", "team-1", 1000)
+        self.quota.set_limit("user_id", "user-2", 100)
+
+        self.client.ingest.send(make_payload(600, team_id="team-1", user_id="user-1"))
+        self.assertTrue(self.quota.allowed(team_id="team-1", user_id="user-1"))
+        self.assertEqual(self.quota.remaining("team_id", "team-1"), 400)
+
+        self.client.ingest.send(make_payload(400, team_id="team-1", user_id="user-2"))
+        self.assertFalse(self.quota.allowed(team_id="team-1"))
+        self.assertFalse(self.quota.allowed(user_id="user-2"))
+        self.assertTrue(self.quota.allowed(user_id="user-1"))
+        self.assertTrue(self.quota.allowed(organization_id="org-unlimited"))
+
+    def test_tokens_include_cache(self):
+        """Test that the tokens measure counts cache tokens like pricing does."""
+        payload = make_payload(100, team_id="team-1")
+        payload["provider"] = "anthropic"
+        payload["usage"]["cache"] = {
+            "anthropic": {
+                "cache_read_input_tokens": 50,
+                "cache_creation_input_tokens": 20,
+            }
+        }
+        self.quota.record(payload)
+        self.assertEqual(self.quota.usage("team_id", "team-1"), 170)
+
+    @patch("teer.resources.usage.UsageResource.totals")
+    def test_reconcile(self, mock_totals):
+        """Test that reconciliation adopts the server's totals."""
+        self.quota.record(make_payload(50, team_id="team-1"))
+        mock_totals.return_value = [
+            {"field": "team_id", "value": "team-1", "usage": 900},
+            {"field": "organization_id", "value": "org-1", "usage": 10},
+        ]
+
+        self.quota.reconcile()
+
+        self.assertEqual(self.quota.usage("team_id", "team-1"), 900)
+        self.assertEqual(self.quota.usage("organization_id", "org-1"), 10)
+        mock_totals.assert_called_once_with("tokens")
+
+    def test_cost_measure(self):
+        """Test that cost quotas are priced with the client's cost engine."""
+        quota = QuotaTracker(self.client, measure="cost")
+        with patch.object(self.client.pricing, "cost", return_value=2.5):
+            quota.record(make_payload(10, organization_id="org-1"))
+        self.assertEqual(quota.usage("organization_id", "org-1"), 2.5)
+
+    @patch("teer.resources.rate_cards.RateCardsResource.retrieve")
+    def test_cost_measure_never_waits_for_rate_cards(self, mock_retrieve):
+        """Test that a cold rate card is fetched in the background."""
+        release = threading.Event()
+        fetched = threading.Event()
+
+        def retrieve(rate_card_id):
+            release.wait(5)
+            fetched.set()
+            return RATE_CARD
+
+        mock_retrieve.side_effect = retrieve
+        quota = QuotaTracker(self.client, measure="cost")
+        payload = {
+            **make_payload(10, organization_id="org-1"),
+            "platform": {"rate_card_id": "rc_123"},
+        }
+
+        quota.record(payload)
+        self.assertEqual(quota.usage("organization_id", "org-1"), 0)
+        self.assertEqual(self.client.metrics.get("quota.unpriced"), 1)
+
+        release.set()
+        self.assertTrue(fetched.wait(5))
+        for _ in range(100):
+            quota.record(payload)
+            if quota.usage("organization_id", "org-1"):
+                break
+            time.sleep(0.01)
+        self.assertGreater(quota.usage("organization_id", "org-1"), 0)
+        mock_retrieve.assert_called_once_with("rc_123")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Tests for trace-based sampling.
+"""
+
+import unittest
+
+from teer import InMemoryTransport, TeerClient
+from teer.sampling import TraceSampler
+
+
+def event(trace_id, function_id="search", model="gpt-4o-mini"):
+    return {
+        "provider": "openai",
+        "model": model,
+        "function_id": function_id,
+        "trace_id": trace_id,
+        "usage": {"input": 10, "output": 5},
+    }
+
+
+class TestTraceSampler(unittest.TestCase):
+    """Test cases for the trace sampler."""
+
+    def test_most_specific_rule_wins(self):
+        """Test rule precedence between function, model and default rates."""
+        sampler = TraceSampler(default_rate=0.5)
+        sampler.set_rate(0.1, model="gpt-4o-mini")
+        sampler.set_rate(0.2, function_id="search")
+        sampler.set_rate(0.3, function_id="search", model="gpt-4o-mini")
+
+        self.assertEqual(sampler.rate(event("t")), 0.3)
+        self.assertEqual(sampler.rate(event("t", model="gpt-4o")), 0.2)
+        self.assertEqual(sampler.rate(event("t", function_id="chat")), 0.1)
+        self.assertEqual(sampler.rate(event("t", "chat", "gpt-4o")), 0.5)
+
+        sampler.set_rate(None, function_id="search", model="gpt-4o-mini")
+        self.assertEqual(sampler.rate(event("t")), 0.2)
+
+    def test_traces_are_kept_whole_and_weighted(self):
+        """Test that spans of a trace share one decision and carry the rate."""
+        sampler = TraceSampler(default_rate=0.25)
+        kept_traces = 0
+        for i in range(2000):
+            trace_id = f"trace-{i}"
+            spans = [sampler.process(event(trace_id)) for _ in range(3)]
+            decisions = {span is not None for span in spans}
+            self.assertEqual(len(decisions), 1)
+            if spans[0] is not None:
+                kept_traces += 1
+                self.assertEqual(spans[0]["sample_rate"], 0.25)
+
+        # Weighted by 1 / sample_rate the kept traces estimate the total
+        self.assertAlmostEqual(kept_traces / 0.25, 2000, delta=200)
+
+    def test_meter_events_are_exempt(self):
+        """Test that dropping every ingest event leaves meter events alone."""
+        transport = InMemoryTransport()
+        client = TeerClient(api_key="test_api_key", transport=transport)
+        sampler = TraceSampler(default_rate=0.0, metrics=client.metrics)
+        client.add_processor(sampler)
+
+        self.assertIsNone(client.ingest.send(event("t")))
+        client.billing.meter_events.create(
+            {"event_name": "tokens", "payload": {"value": "1"}}
+        )
+        self.assertEqual(len(transport.requests), 1)
+        self.assertEqual(client.metrics.get("sampling.dropped"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,235 @@
+"""
+Tests for the background sender pool.
+"""
+
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from teer import InMemoryTransport, TeerClient
+from teer.sender import SenderPool
+from teer.transports import Response
+
+from .test_http import make_response
+
+
+def make_payload(index, trace_id=None):
+    """Build a minimal ingest payload."""
+    payload = {
+        "provider": "openai",
+        "model": "gpt-4o",
+        "function_id": f"fn-{index}",
+        "usage": {"input": index, "output": 1},
+    }
+    if trace_id is not None:
+        payload["trace_id"] = trace_id
+    return payload
+
+
+class TestSenderPool(unittest.TestCase):
+    """Test cases for the sender pool."""
+
+    def test_enqueue_and_flush(self):
+        """Test that enqueued events are batched through the ingest batch endpoint."""
+        client = TeerClient(api_key="test_api_key", sender_workers=2, batch_size=10)
+        session = MagicMock()
+        session.request.return_value = make_response()
+        client.http_client.session = session
+
+        for i in range(25):
+            self.assertTrue(client.ingest.enqueue(make_payload(i)))
+        self.assertTrue(client.flush(timeout=5))
+
+        sent = [
+            event
+            for call in session.request.call_args_list
+            for event in call.kwargs["json"]["events"]
+        ]
+        self.assertEqual(sorted(e["usage"]["input"] for e in sent), list(range(25)))
+        self.assertEqual(
+            session.request.call_args.kwargs["url"], f"{client.track_base}/ingest/batch"
+        )
+        self.assertEqual(client.metrics.get("sender.sent"), 25)
+        client.close()
+
+    def test_trace_ordering(self):
+        """Test that events of one trace are sent in order by a single worker."""
+        sent = []
+        lock = threading.Lock()
+
+        def send_batch(batch):
+            with lock:
+                sent.extend((threading.current_thread().name, e) for e in batch)
+
+        pool = SenderPool(send_batch, workers=4, batch_size=3, ordering="trace_id")
+        for i in range(40):
+            pool.enqueue(make_payload(i, trace_id=f"t{i % 5}"), f"t{i % 5}")
+        self.assertTrue(pool.close(timeout=5))
+
+        for trace in (f"t{n}" for n in range(5)):
+            events = [(name, e) for name, e in sent if e["trace_id"] == trace]
+            self.assertEqual(len({name for name, _ in events}), 1)
+            indexes = [e["usage"]["input"] for _, e in events]
+            self.assertEqual(indexes, sorted(indexes))
+
+    def test_drops_when_full(self):
+        """Test that events are dropped and counted when the buffer is full."""
+        release = threading.Event()
+        pool = SenderPool(
+            lambda batch: release.wait(), workers=1, batch_size=1, max_buffer_size=1
+        )
+        results = [pool.enqueue(make_payload(i)) for i in range(5)]
+        self.assertIn(False, results)
+        self.assertGreaterEqual(pool.metrics.get("sender.dropped"), 1)
+        release.set()
+        self.assertTrue(pool.close(timeout=5))
+
+    def test_failed_batches_are_counted(self):
+        """Test that failures are logged and counted without killing workers."""
+        pool = SenderPool(MagicMock(side_effect=RuntimeError("boom")), workers=1)
+        pool.enqueue(make_payload(1))
+        self.assertTrue(pool.flush(timeout=5))
+        self.assertEqual(pool.metrics.get("sender.failed"), 1)
+        pool.close()
+
+    def test_priority_lane_is_served_first(self):
+        """Test that a higher-priority lane jumps ahead of the default lane."""
+        order = []
+        started, release = threading.Event(), threading.Event()
+
+        def send(batch):
+            started.set()
+            release.wait()
+            order.append(batch[0][0])
+
+        pool = SenderPool(send, workers=1, batch_size=1, flush_interval=5)
+        pool.add_lane("meter", send, priority=1, weight=2)
+        # The first batch holds the worker until both lanes are populated
+        pool.enqueue(("blocker", 0))
+        self.assertTrue(started.wait(5))
+        for i in range(3):
+            pool.enqueue(("ingest", i))
+        for i in range(3):
+            pool.enqueue(("meter", i), lane="meter")
+        release.set()
+        self.assertTrue(pool.close(timeout=5))
+
+        self.assertEqual(order[1:4], ["meter", "meter", "ingest"])
+        self.assertEqual(sorted(order[1:]), ["ingest"] * 3 + ["meter"] * 3)
+        self.assertEqual(pool.metrics.get("sender.meter.sent"), 3)
+
+    def test_durable_lane_retries(self):
+        """Test that failed batches of a durable lane are retried, not dropped."""
+        attempts = []
+
+        def flaky(batch):
+            attempts.append(batch)
+            if len(attempts) == 1:
+                raise RuntimeError("boom")
+
+        pool = SenderPool(MagicMock(), workers=1)
+        pool.add_lane("meter", flaky, durable=True)
+        pool.enqueue({"id": 1}, lane="meter")
+        self.assertTrue(pool.flush(timeout=5))
+
+        self.assertEqual(attempts, [[{"id": 1}], [{"id": 1}]])
+        self.assertEqual(pool.metrics.get("sender.meter.retried"), 1)
+        self.assertEqual(pool.metrics.get("sender.meter.failed"), 0)
+        pool.close()
+
+    def test_durable_lane_drops_rejected_batches(self):
+        """Test that a 400 on a durable lane does not block later events."""
+        sent = []
+
+        def reject_first(batch):
+            if not sent:
+                sent.append(None)
+                raise make_response(400).raise_for_status.side_effect
+            sent.extend(batch)
+
+        pool = SenderPool(MagicMock(), workers=1, batch_size=1)
+        pool.add_lane("meter", reject_first, durable=True)
+        for i in range(3):
+            pool.enqueue({"id": i}, lane="meter")
+        self.assertTrue(pool.close(timeout=5))
+
+        self.assertEqual(sent[1:], [{"id": 1}, {"id": 2}])
+        self.assertEqual(pool.metrics.get("sender.meter.retried"), 0)
+        self.assertEqual(pool.metrics.get("sender.meter.failed"), 1)
+
+    def test_rejected_meter_event_does_not_block_client(self):
+        """Test that a meter event rejected by the server is dropped alone."""
+        transport = InMemoryTransport(
+            lambda request: Response(
+                400 if request.json["fields"]["identifier"] == "bad" else 200,
+                b"{}",
+                url=request.url,
+            )
+        )
+        client = TeerClient(api_key="test_api_key", transport=transport)
+        for identifier in ("bad", "good"):
+            client.billing.meter_events.enqueue(
+                {
+                    "provider": "stripe",
+                    "fields": {
+                        "event_name": "tokens",
+                        "identifier": identifier,
+                        "payload": {"stripe_customer_id": "cus_1", "value": "1"},
+                    },
+                }
+            )
+        self.assertTrue(client.close(timeout=5))
+
+        self.assertEqual(len(transport.requests), 2)
+        self.assertEqual(client.metrics.get("billing.meter_events.rejected"), 1)
+
+    def test_shedding_under_pressure(self):
+        """Test that a lane above its shed threshold drops new events."""
+        release = threading.Event()
+        pool = SenderPool(lambda batch: release.wait(), workers=1, batch_size=1)
+        lane = pool.lane("default")
+        lane.max_buffer_size = 10
+        lane.shed_threshold = 0.0
+        results = [pool.enqueue(i) for i in range(50)]
+        self.assertIn(False, results)
+        self.assertGreaterEqual(pool.metrics.get("sender.default.shed"), 1)
+        release.set()
+        self.assertTrue(pool.close(timeout=5))
+
+    def test_meter_events_enqueue(self):
+        """Test that buffered meter events are sent with an identifier."""
+        transport = InMemoryTransport()
+        client = TeerClient(api_key="test_api_key", transport=transport)
+        client.billing.meter_events.enqueue(
+            {
+                "provider": "stripe",
+                "fields": {
+                    "event_name": "tokens",
+                    "payload": {"stripe_customer_id": "cus_1", "value": "10"},
+                },
+            }
+        )
+        client.billing.meter_events.enqueue(
+            {
+                "provider": "stripe",
+                "fields": {
+                    "event_name": "tokens",
+                    "identifier": "idmp_1",
+                    "payload": {"stripe_customer_id": "cus_1", "value": "10"},
+                },
+            }
+        )
+        self.assertTrue(client.close(timeout=5))
+
+        generated, given = transport.requests
+        self.assertTrue(generated.url.endswith("/billing/meter-events"))
+        self.assertNotIn("identifier", generated.json)
+        identifier = generated.json["fields"]["identifier"]
+        self.assertTrue(identifier)
+        self.assertEqual(generated.headers["Idempotency-Key"], identifier)
+        self.assertEqual(given.json["fields"]["identifier"], "idmp_1")
+        self.assertEqual(given.headers["Idempotency-Key"], "idmp_1")
+
+
+if __name__ == "__main__":
+    unittest.main()
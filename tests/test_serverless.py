@@ -0,0 +1,82 @@
+"""
+Tests for serverless mode.
+"""
+
+import unittest
+
+from teer import InMemoryTransport, TeerClient
+from teer.serverless import handler
+
+
+class WarmingTransport(InMemoryTransport):
+    """In-memory transport that records warm-up calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.warmed = []
+
+    def warm(self, url, timeout=2.0):
+        self.warmed.append(url)
+
+
+class FakeContext:
+    """Lambda-style context with a fixed amount of time left."""
+
+    def __init__(self, remaining_ms):
+        self.remaining_ms = remaining_ms
+
+    def get_remaining_time_in_millis(self):
+        return self.remaining_ms
+
+
+class TestServerless(unittest.TestCase):
+    """Test cases for serverless mode."""
+
+    def test_prewarm_on_init(self):
+        """Test that serverless clients open a connection during init."""
+        transport = WarmingTransport()
+        client = TeerClient(
+            api_key="test_api_key", transport=transport, serverless=True
+        )
+
+        self.assertEqual(transport.warmed, [f"{client.track_base}/ingest"])
+        self.assertIsNotNone(client.metrics.get("serverless.prewarm_seconds"))
+
+    def test_handler_flushes_before_returning(self):
+        """Test that events buffered by the handler are sent before it returns."""
+        transport = InMemoryTransport()
+        client = TeerClient(api_key="test_api_key", transport=transport)
+
+        @handler(client)
+        def lambda_handler(event, context):
+            for i in range(event["count"]):
+                client.ingest.enqueue({"model": "gpt-4o", "usage": {"input": i}})
+            return {"statusCode": 200}
+
+        result = lambda_handler({"count": 3}, FakeContext(10_000))
+
+        self.assertEqual(result, {"statusCode": 200})
+        self.assertEqual(len(transport.events()), 3)
+        self.assertEqual(client.metrics.get("serverless.invocations"), 1)
+        self.assertEqual(client.metrics.get("serverless.flush_timeouts"), 0)
+        client.close()
+
+    def test_flush_respects_remaining_time(self):
+        """Test that the flush budget never exceeds the invocation's time left."""
+        calls = []
+
+        class Client:
+            metrics = TeerClient(api_key="test_api_key").metrics
+
+            def flush(self, timeout):
+                calls.append(timeout)
+                return True
+
+        handler(Client(), flush_timeout=2.0, safety_margin=0.2)(lambda e, c: None)(
+            {}, FakeContext(500)
+        )
+        self.assertAlmostEqual(calls[0], 0.3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Tests for coalescing concurrent identical reads.
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+
+from teer import InMemoryTransport, TeerClient
+from teer.transports import Response
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Test cases for read coalescing in the HTTP client."""
+
+    def setUp(self):
+        """Set up a transport that holds GETs until released."""
+        self.release = threading.Event()
+
+        def handler(request):
+            self.release.wait(5)
+            if request.url.endswith("missing"):
+                return Response(404, b"{}", url=request.url)
+            return Response.from_json({"id": "rc_1"})
+
+        self.transport = InMemoryTransport(handler)
+        self.client = TeerClient(api_key="test_api_key", transport=self.transport)
+
+    def get_concurrently(self, path, count=8):
+        results = []
+
+        def get():
+            try:
+                results.append(self.client.http_client.request("GET", path))
+            except Exception as e:
+                results.append(e)
+
+        threads = [threading.Thread(target=get) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        # Let every thread join the in-flight request before it completes
+        time.sleep(0.2)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_threads_share_one_request(self):
+        """Test that concurrent identical GETs send a single request."""
+        results = self.get_concurrently("rate_cards/rc_1")
+
+        self.assertEqual(len(self.transport.requests), 1)
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual(self.client.metrics.get("http.coalesced"), 7)
+
+    def test_errors_are_shared(self):
+        """Test that every waiter sees the failure of the shared request."""
+        results = self.get_concurrently("rate_cards/missing", count=4)
+
+        self.assertEqual(len(self.transport.requests), 1)
+        self.assertTrue(all(isinstance(r, Exception) for r in results))
+
+    def test_asyncio_executor_calls_share_one_request(self):
+        """Test coalescing of reads issued from asyncio through an executor."""
+        get = self.client.http_client.request
+
+        async def main():
+            loop = asyncio.get_running_loop()
+            calls = [
+                loop.run_in_executor(None, get, "GET", "rate_cards/rc_1")
+                for _ in range(4)
+            ]
+            loop.call_later(0.2, self.release.set)
+            return await asyncio.gather(*calls)
+
+        results = asyncio.run(main())
+        self.assertEqual(len(self.transport.requests), 1)
+        self.assertEqual(results, [{"id": "rc_1"}] * 4)
+
+    def test_sequential_reads_are_not_coalesced(self):
+        """Test that a finished request is not reused."""
+        self.release.set()
+        self.client.http_client.request("GET", "rate_cards/rc_1")
+        self.client.http_client.request("GET", "rate_cards/rc_1")
+        self.assertEqual(len(self.transport.requests), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
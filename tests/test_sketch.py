@@ -0,0 +1,113 @@
+"""
+Tests for summary-sketch mode.
+"""
+
+import random
+import unittest
+
+from teer import InMemoryTransport, TeerClient
+from teer.sketch import DDSketch, SketchAggregator, summary_quantiles
+
+
+class TestDDSketch(unittest.TestCase):
+    """Test cases for the quantile sketch."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Test quantiles against exact ones on a skewed distribution."""
+        rng = random.Random(7)
+        values = sorted(int(rng.lognormvariate(6, 1.5)) for _ in range(20_000))
+        sketch = DDSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.5, 0.9, 0.99):
+            exact = values[int(q * (len(values) - 1))]
+            self.assertAlmostEqual(sketch.quantile(q), exact, delta=exact * 0.011)
+        self.assertEqual(sketch.sum, sum(values))
+
+    def test_merge_and_serialize(self):
+        """Test that merged and round-tripped sketches agree."""
+        a, b, whole = DDSketch(), DDSketch(), DDSketch()
+        for value in range(1, 1001):
+            (a if value % 2 else b).add(value)
+            whole.add(value)
+        a.merge(DDSketch.from_dict(b.to_dict()))
+
+        self.assertEqual(a.count, 1000)
+        self.assertEqual(a.quantile(0.99), whole.quantile(0.99))
+
+    def test_bins_are_bounded(self):
+        """Test that the lowest bins collapse beyond max_bins."""
+        sketch = DDSketch(max_bins=16)
+        for value in range(1, 10_000):
+            sketch.add(value)
+        self.assertLessEqual(len(sketch.bins), 16)
+        self.assertAlmostEqual(sketch.quantile(0.99), 9900, delta=100)
+
+
+class TestSketchAggregator(unittest.TestCase):
+    """Test cases for shipping summaries instead of events."""
+
+    def test_summaries_replace_events(self):
+        """Test that many calls ship as one summary with exact sums."""
+        transport = InMemoryTransport()
+        client = TeerClient(api_key="test_api_key", transport=transport)
+        aggregator = SketchAggregator(client, functions=["autocomplete"])
+        client.add_processor(aggregator)
+
+        for i in range(1, 1001):
+            client.ingest.enqueue(
+                {
+                    "provider": "openai",
+                    "model": "gpt-4o-mini",
+                    "function_id": "autocomplete",
+                    "usage": {
+                        "input": i,
+                        "output": 10,
+                        "cache": {"openai": {"input_cached_tokens": 1}},
+                    },
+                }
+            )
+        chat = {"provider": "openai", "model": "gpt-4o", "function_id": "chat"}
+        client.ingest.enqueue({**chat, "usage": {}})
+        self.assertEqual(aggregator.flush(), 1)
+        self.assertTrue(client.flush(timeout=5))
+
+        events = transport.events()
+        (summary,) = [e for e in events if "summary" in e]
+        self.assertEqual(len(events), 2)
+        self.assertEqual(summary["usage"]["input"], 500500)
+        self.assertEqual(summary["usage"]["output"], 10000)
+        cache = summary["usage"]["cache"]["openai"]
+        self.assertEqual(cache["input_cached_tokens"], 1000)
+        self.assertEqual(summary["summary"]["count"], 1000)
+        quantiles = summary_quantiles(summary, (0.5, 0.99))
+        self.assertAlmostEqual(quantiles["input"][0], 500, delta=10)
+        self.assertAlmostEqual(quantiles["input"][1], 990, delta=20)
+        self.assertEqual(quantiles["output"], [10, 10])
+        client.close()
+
+    def test_batch_and_sampled_events(self):
+        """Test that batch events get their own summary and sampled ones pass."""
+        transport = InMemoryTransport()
+        client = TeerClient(api_key="test_api_key", transport=transport)
+        client.add_processor(SketchAggregator(client))
+
+        event = {"provider": "openai", "model": "gpt-4o", "usage": {"input": 10}}
+        client.ingest.enqueue(event)
+        client.ingest.enqueue({**event, "batch": True})
+        client.ingest.enqueue({**event, "sample_rate": 0.1})
+        # The client's flush ships the held summaries
+        self.assertTrue(client.flush(timeout=5))
+
+        events = transport.events()
+        self.assertEqual(len(events), 3)
+        summaries = [e for e in events if "summary" in e]
+        self.assertEqual(sorted(bool(e.get("batch")) for e in summaries), [0, 1])
+        (sampled,) = [e for e in events if "summary" not in e]
+        self.assertEqual(sampled["sample_rate"], 0.1)
+        client.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
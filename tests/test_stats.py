@@ -0,0 +1,96 @@
+"""
+Tests for in-process rolling usage stats.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from teer import InMemoryTransport, TeerClient, UsageStats
+from teer.stats import _Ring
+
+
+def event(function_id="chat", model="gpt-4o", input=100, output=20, cached=0):
+    return {
+        "provider": "openai",
+        "model": model,
+        "function_id": function_id,
+        "usage": {
+            "input": input,
+            "output": output,
+            "cache": {"openai": {"input_cached_tokens": cached}},
+        },
+    }
+
+
+class TestUsageStats(unittest.TestCase):
+    """Test cases for usage stats."""
+
+    def setUp(self):
+        """Freeze the stats clock."""
+        self.now = 1000.0
+        patcher = patch("teer.stats.time.monotonic", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.stats = UsageStats(horizon=60)
+
+    def test_rate_per_function_and_model(self):
+        """Test token rates filtered by function and model."""
+        for second in range(10):
+            self.now = 1000.0 + second
+            self.stats.record(event())
+            self.stats.record(event(model="gpt-4o-mini", input=50, output=10))
+            self.stats.record(event(function_id="search"))
+
+        self.assertEqual(self.stats.rate("chat", window=10), (120 + 60) * 10 / 10)
+        self.assertEqual(self.stats.rate("chat", window=10, model="gpt-4o"), 120)
+        self.assertEqual(self.stats.rate(window=10, measure="events"), 3)
+        self.assertEqual(self.stats.rate("search", window=5, measure="output"), 20)
+
+    def test_old_seconds_leave_the_window(self):
+        """Test that the ring reuses slots of seconds past the horizon."""
+        self.stats.record(event())
+        self.now += 30
+        self.assertEqual(self.stats.rate("chat", window=60), 120 / 60)
+        self.assertEqual(self.stats.rate("chat", window=10), 0)
+
+        self.now += 60
+        self.stats.record(event(input=10, output=0))
+        self.assertEqual(self.stats.rate("chat", window=60), 10 / 60)
+
+    def test_cache_hit_ratio(self):
+        """Test the share of input tokens served from the prompt cache."""
+        self.assertIsNone(self.stats.cache_hit_ratio("chat"))
+        self.stats.record(event(input=100, cached=75))
+        self.stats.record(event(input=100, cached=25))
+        self.assertEqual(self.stats.cache_hit_ratio("chat"), 0.5)
+
+    def test_keys_are_bounded(self):
+        """Test that functions beyond max_keys share one ring."""
+        stats = UsageStats(horizon=10, max_keys=2)
+        for name in ("a", "b", "c", "d"):
+            stats.record(event(function_id=name))
+        self.assertEqual(len(stats.keys()), 3)
+        self.assertEqual(stats.rate("__other__", window=1, measure="events"), 2)
+
+    def test_rate_reads_only_matching_rings(self):
+        """Test that a function's rate does not visit other functions' rings."""
+        for name in range(100):
+            self.stats.record(event(function_id=f"fn-{name}"))
+        self.stats.record(event())
+
+        with patch.object(_Ring, "sum", autospec=True, side_effect=_Ring.sum) as sum_:
+            self.assertEqual(self.stats.rate("chat", window=1, measure="events"), 1)
+        self.assertEqual(sum_.call_count, 1)
+
+    def test_client_records_outgoing_events(self):
+        """Test that the client feeds every outgoing event to its stats."""
+        client = TeerClient(
+            api_key="test_api_key", transport=InMemoryTransport(), stats=self.stats
+        )
+        client.ingest.send(event())
+        client.ingest.send_batch([event(), event()])
+        self.assertEqual(client.stats.rate("chat", window=1, measure="events"), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
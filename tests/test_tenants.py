@@ -0,0 +1,111 @@
+"""
+Tests for the multi-tenant client pool.
+"""
+
+import unittest
+
+from teer import InMemoryTransport, TeerClientPool
+from teer.transports import Response
+
+
+def meter_event(identifier):
+    return {
+        "provider": "stripe",
+        "fields": {
+            "event_name": "tokens",
+            "identifier": identifier,
+            "payload": {"stripe_customer_id": "cus_1", "value": "1"},
+        },
+    }
+
+
+class TestTeerClientPool(unittest.TestCase):
+    """Test cases for the client pool."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.transport = InMemoryTransport()
+        self.pool = TeerClientPool(
+            max_tenants=2, transport=self.transport, batch_size=50
+        )
+
+    def tearDown(self):
+        """Stop the shared sender."""
+        self.pool.close(timeout=5)
+
+    def test_tenants_share_transport_and_sender(self):
+        """Test that tenants reuse the pool's transport and sender."""
+        a = self.pool.client("key_a")
+        b = self.pool.client("key_b")
+
+        self.assertIs(self.pool.client("key_a"), a)
+        self.assertIs(a.http_client.transport, b.http_client.transport)
+        self.assertIs(a.sender.shared, b.sender.shared)
+
+    def test_buffered_events_use_tenant_credentials(self):
+        """Test that a shared batch is split into one request per tenant."""
+        for i in range(3):
+            self.pool.client("key_a").ingest.enqueue({"model": "a", "usage": {}})
+            self.pool.client("key_b").ingest.enqueue({"model": "b", "usage": {}})
+        self.assertTrue(self.pool.flush(timeout=5))
+
+        by_key = {}
+        for request in self.transport.requests:
+            key = request.headers["Authorization"]
+            by_key.setdefault(key, []).extend(request.json["events"])
+        self.assertEqual(
+            {key: {e["model"] for e in events} for key, events in by_key.items()},
+            {"Bearer key_a": {"a"}, "Bearer key_b": {"b"}},
+        )
+        self.assertEqual(self.pool.client("key_a").metrics.get("sender.sent"), 3)
+
+    def test_lru_eviction_keeps_buffered_events(self):
+        """Test that evicted tenants are recreated to send their events."""
+        self.pool.client("key_a").ingest.enqueue({"model": "a", "usage": {}})
+        self.pool.client("key_b")
+        self.pool.client("key_c")
+
+        self.assertNotIn("key_a", self.pool)
+        self.assertEqual(len(self.pool), 2)
+        self.assertEqual(self.pool.metrics.get("tenants.evicted"), 1)
+
+        self.assertTrue(self.pool.flush(timeout=5))
+        (request,) = self.transport.requests
+        self.assertEqual(request.headers["Authorization"], "Bearer key_a")
+
+    def test_failed_tenant_does_not_fail_others(self):
+        """Test that only the failing tenant's ingest events count as failed."""
+        self.transport.handler = lambda request: Response(
+            500 if request.headers["Authorization"] == "Bearer key_b" else 200,
+            b"{}",
+            url=request.url,
+        )
+        self.pool.client("key_a").ingest.enqueue({"model": "a", "usage": {}})
+        self.pool.client("key_b").ingest.enqueue({"model": "b", "usage": {}})
+        self.assertTrue(self.pool.flush(timeout=5))
+
+        self.assertEqual(self.pool.metrics.get("sender.sent"), 1)
+        self.assertEqual(self.pool.metrics.get("sender.failed"), 1)
+
+    def test_meter_retries_only_failed_tenant(self):
+        """Test that a tenant's failure never resends another's meter events."""
+        failures = [True]
+
+        def handler(request):
+            if request.headers["Authorization"] == "Bearer key_b" and failures:
+                failures.pop()
+                return Response(500, b"{}", url=request.url)
+            return Response(200, b"{}", url=request.url)
+
+        self.transport.handler = handler
+        self.pool.client("key_a").billing.meter_events.enqueue(meter_event("a1"))
+        self.pool.client("key_b").billing.meter_events.enqueue(meter_event("b1"))
+        self.assertTrue(self.pool.flush(timeout=5))
+
+        identifiers = [r.json["fields"]["identifier"] for r in self.transport.requests]
+        self.assertEqual(sorted(identifiers), ["a1", "b1", "b1"])
+        self.assertEqual(self.pool.metrics.get("sender.meter.retried"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Tests for the offline token estimator.
+"""
+
+import unittest
+
+from teer import TokenEstimator
+from teer.tokens import heuristic_tokens
+
+
+class TestTokenEstimator(unittest.TestCase):
+    """Test cases for token estimates."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.estimator = TokenEstimator(cache_min_chars=16)
+
+    def test_heuristic_tokens(self):
+        """Test the heuristic on text with known token counts."""
+        self.assertEqual(heuristic_tokens(""), 0)
+        self.assertEqual(
+            heuristic_tokens("The quick brown fox jumps over the lazy dog."), 10
+        )
+        # One token per CJK character, numbers in groups of three digits
+        self.assertEqual(heuristic_tokens("東京"), 2)
+        self.assertEqual(heuristic_tokens("1234567"), 3)
+
+    def test_provider_factor(self):
+        """Test that estimates are scaled for each provider's tokenizer."""
+        text = " ".join(["word"] * 100)
+        self.assertEqual(self.estimator.count(text, "openai"), 100)
+        self.assertEqual(self.estimator.count(text, "anthropic"), 110)
+
+    def test_prompt_prefixes_are_cached(self):
+        """Test that repeated messages are counted once."""
+        system = {"role": "system", "content": "You are a helpful assistant. " * 4}
+        first = [system, {"role": "user", "content": "Hi"}]
+        parts = [{"type": "text", "text": "Hey"}]
+        second = [system, {"role": "user", "content": parts}]
+
+        tokens = self.estimator.count_prompt(first)
+        self.assertEqual(len(self.estimator._cache), 1)
+        self.assertEqual(self.estimator.count_prompt(second), tokens)
+        self.assertEqual(len(self.estimator._cache), 1)
+
+    def test_long_inputs_are_sampled(self):
+        """Test that the fast path stays close to the full count."""
+        text = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 2000
+        exact = heuristic_tokens(text)
+        estimator = TokenEstimator(fast_path_chars=10_000)
+        sampled = estimator.count(text)
+        self.assertAlmostEqual(sampled, exact, delta=exact * 0.02)
+        # Sampled texts are not kept in the cache
+        self.assertEqual(len(estimator._cache), 0)
+
+    def test_more_samples_than_characters(self):
+        """Test sampling when the fast path is below the sample count."""
+        estimator = TokenEstimator(cache_min_chars=1, fast_path_chars=4, samples=16)
+        self.assertEqual(estimator.count("two words"), 2)
+        with self.assertRaises(ValueError):
+            TokenEstimator(samples=0)
+
+    def test_estimate_flags_payload(self):
+        """Test that estimated usage is filled in and flagged."""
+        payload = {"provider": "openai", "model": "gpt-4o", "usage": {"output": 7}}
+        estimated = self.estimator.estimate(payload, prompt="hello world")
+
+        self.assertEqual(
+            estimated["usage"], {"input": 2, "output": 7, "estimated": True}
+        )
+        self.assertEqual(payload["usage"], {"output": 7})
+
+
+if __name__ == "__main__":
+    unittest.main()
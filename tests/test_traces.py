@@ -0,0 +1,115 @@
+"""
+Tests for trace-scoped buffering.
+"""
+
+import unittest
+
+from teer import InMemoryTransport, TeerClient, TeerClientPool
+from teer.traces import TraceBuffer
+
+
+def span(trace_id, span_id, parent=None):
+    event = {
+        "provider": "openai",
+        "model": "gpt-4o",
+        "trace_id": trace_id,
+        "span_id": span_id,
+        "usage": {"input": 1, "output": 1},
+    }
+    if parent:
+        event["parent_span_id"] = parent
+    return event
+
+
+class TestTraceBuffer(unittest.TestCase):
+    """Test cases for the trace buffer."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.transport = InMemoryTransport()
+        self.client = TeerClient(api_key="test_api_key", transport=self.transport)
+
+    def tearDown(self):
+        """Stop the buffer and sender."""
+        self.buffer.close()
+        self.client.close(timeout=5)
+
+    def add(self, **options):
+        self.buffer = TraceBuffer(self.client, **options)
+        self.client.add_processor(self.buffer)
+
+    def test_trace_ships_when_root_ends(self):
+        """Test that a span tree is held until its root and sent at once."""
+        self.add()
+        for i in range(5):
+            self.assertFalse(self.client.ingest.enqueue(span("t1", f"s{i}", "root")))
+        self.client.ingest.enqueue({**span("x", "x"), "trace_id": None})
+        self.assertTrue(self.client.sender.flush(timeout=5))
+        self.assertEqual(len(self.transport.events()), 1)
+        self.assertEqual(len(self.buffer), 1)
+
+        self.client.ingest.send(span("t1", "root"))
+        self.assertTrue(self.client.sender.flush(timeout=5))
+        trace_request = self.transport.requests[-1]
+        self.assertEqual(len(trace_request.json["events"]), 6)
+        self.assertEqual(len(self.buffer), 0)
+
+        # A late span of a shipped trace is sent right away
+        self.assertIsNotNone(self.client.ingest.send(span("t1", "late", "root")))
+
+    def test_abandoned_traces_time_out(self):
+        """Test that traces without a root are shipped after the timeout."""
+        self.add(timeout=60)
+        self.client.ingest.enqueue(span("t1", "s1", "root"))
+        self.client.ingest.enqueue(span("t2", "s1", "root"))
+        self.buffer._traces["t1"].started -= 120
+        self.buffer._expire()
+        self.assertTrue(self.client.sender.flush(timeout=5))
+        self.assertEqual(len(self.transport.events()), 1)
+        self.assertEqual(self.client.metrics.get("traces.timed_out"), 1)
+        self.assertEqual(len(self.buffer), 1)
+
+    def test_memory_caps(self):
+        """Test eviction of the oldest trace and splitting of large ones."""
+        self.add(max_traces=2, max_spans_per_trace=3)
+        for trace_id in ("t1", "t2", "t3"):
+            self.client.ingest.enqueue(span(trace_id, "s1", "root"))
+        self.assertEqual(self.client.metrics.get("traces.evicted"), 1)
+        for i in range(3):
+            self.client.ingest.enqueue(span("t2", f"s{i + 2}", "root"))
+        self.assertEqual(self.client.metrics.get("traces.split"), 1)
+
+        self.assertTrue(self.client.sender.flush(timeout=5))
+        self.assertEqual(len(self.transport.events()), 4)
+        self.assertEqual(len(self.buffer), 2)
+
+    def test_client_flush_ships_held_traces(self):
+        """Test that flushing the client, e.g. after a Lambda invocation, drains."""
+        self.add()
+        self.client.ingest.enqueue(span("t1", "s1", "root"))
+        self.assertTrue(self.client.flush(timeout=5))
+        self.assertEqual(len(self.transport.events()), 1)
+        self.assertEqual(len(self.buffer), 0)
+
+    def test_buffers_get_their_own_lanes(self):
+        """Test that several buffers can share a client."""
+        self.add()
+        other = TraceBuffer(self.client)
+        self.addCleanup(other.close)
+        self.assertEqual((self.buffer.lane, other.lane), ("traces", "traces-2"))
+
+        other.process(span("t9", "root"))
+        self.assertTrue(self.client.sender.flush(timeout=5))
+        self.assertEqual(len(self.transport.events()), 1)
+
+    def test_pool_clients_are_rejected(self):
+        """Test that tenant clients of a pool are refused explicitly."""
+        self.add()
+        pool = TeerClientPool(transport=self.transport)
+        self.addCleanup(pool.close, 5)
+        with self.assertRaises(ValueError):
+            TraceBuffer(pool.client("tenant_key"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+Tests for the pluggable transports.
+"""
+
+import json
+import os
+import socketserver
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler
+
+import requests
+
+from teer import (
+    FileTransport,
+    InMemoryTransport,
+    TeerClient,
+    Transport,
+    UnixSocketTransport,
+)
+from teer.compression import GzipCompression
+from teer.transports import Response
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    """Echoes the request path and body back as JSON."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        content = json.dumps(
+            {
+                "path": self.path,
+                "host": self.headers["Host"],
+                "authorization": self.headers["Authorization"],
+                "body": json.loads(body),
+            }
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ("local", 0)
+
+
+class TestTransports(unittest.TestCase):
+    """Test cases for the transports."""
+
+    payload = {"provider": "openai", "model": "gpt-4o", "usage": {"input": 1}}
+
+    def test_in_memory_transport(self):
+        """Test that the in-memory transport records requests and events."""
+        transport = InMemoryTransport()
+        client = TeerClient(api_key="test_api_key", transport=transport)
+
+        client.ingest.send(self.payload)
+        client.ingest.send_batch([self.payload, self.payload])
+
+        self.assertEqual(len(transport.requests), 2)
+        self.assertEqual(transport.requests[0].url, f"{client.track_base}/ingest")
+        self.assertEqual(transport.events(), [self.payload] * 3)
+
+    def test_in_memory_handler_errors(self):
+        """Test that handler error responses raise like HTTP errors."""
+        transport = InMemoryTransport(
+            handler=lambda request: Response.from_json({"error": "no"}, 400)
+        )
+        client = TeerClient(api_key="test_api_key", transport=transport)
+
+        with self.assertRaises(requests.exceptions.HTTPError) as raised:
+            client.ingest.send(self.payload)
+        self.assertEqual(raised.exception.response.status_code, 400)
+
+    def test_file_transport(self):
+        """Test that the file transport writes one line per event."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "capture.jsonl")
+            transport = FileTransport(path)
+            client = TeerClient(api_key="test_api_key", transport=transport)
+            client.http_client.add_hook(GzipCompression(min_size=1))
+
+            client.ingest.send(self.payload)
+            client.ingest.send_batch([self.payload, self.payload])
+            meter_event = {"provider": "stripe", "fields": {"identifier": "m1"}}
+            client.billing.meter_events.create(meter_event)
+            transport.close()
+
+            with open(path) as f:
+                lines = [json.loads(line) for line in f]
+            with open(os.path.join(tmp, "capture.billing-meter-events.jsonl")) as f:
+                meter_lines = [json.loads(line) for line in f]
+        self.assertEqual(lines, [self.payload] * 3)
+        self.assertEqual(meter_lines, [meter_event])
+
+    def test_transports_must_implement_send(self):
+        """Test that a transport without send cannot be created."""
+        with self.assertRaises(TypeError):
+            Transport()
+
+    def test_unix_socket_transport(self):
+        """Test that requests reach a server listening on a Unix socket."""
+        with tempfile.TemporaryDirectory() as tmp:
+            socket_path = os.path.join(tmp, "teer.sock")
+            server = UnixHTTPServer(socket_path, EchoHandler)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            transport = UnixSocketTransport(socket_path)
+            client = TeerClient(
+                api_key="test_api_key",
+                track_url="http://proxy.local",
+                transport=transport,
+            )
+            try:
+                first = client.ingest.send(self.payload)
+                second = client.ingest.send(self.payload)
+            finally:
+                transport.close()
+                server.shutdown()
+                server.server_close()
+
+        self.assertEqual(first["path"], "/v1/ingest")
+        self.assertEqual(first["host"], "proxy.local")
+        self.assertEqual(first["authorization"], "Bearer test_api_key")
+        self.assertEqual(second["body"], self.payload)
+
+
+if __name__ == "__main__":
+    unittest.main()